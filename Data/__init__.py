@@ -6,4 +6,18 @@ from . import spell_helpers
 from . import spell_system
 from . import targeting_system
 from . import condition_system
-from . import effect_manager
\ No newline at end of file
+from . import effect_manager
+from . import asset_cache
+from . import fog_of_war
+from . import fov
+from . import pathfinding
+from . import spatial_index
+from . import tile_grid
+from . import dungeon_prefetch
+from . import connectivity
+from . import camera
+from . import frame_compositor
+from . import text_cache
+from . import animation
+from . import effect_frames
+from . import particles
\ No newline at end of file
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Animation Scheduler for Blade & Sigil
+This module plays visual effects (spell explosions, frost rings and the
+like) without blocking the game. Effects are queued as time-based sprite
+sequences at a position in the world; the main loop advances them and
+draws the ones still playing over the map each frame, so input, messages
+and panels keep updating while effects run, and any number of effects
+can play at once.
+"""
+
+import logging
+
+import pygame
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class SpriteSequence:
+    """
+    A sequence of frames shown centred on a world position over a fixed duration.
+
+    The frames are spread evenly over the duration; a single frame is simply
+    held for the whole of it.
+    """
+
+    def __init__(self, frames, world_center, duration, start_time=None, on_complete=None):
+        """
+        Initialize a sprite sequence.
+
+        Args:
+            frames: List of pygame Surfaces, shown in order
+            world_center: (x, y) world pixel the frames are centred on
+            duration: Length of the sequence in seconds
+            start_time: Ticks (ms) to start at; defaults to now
+            on_complete: Optional callable run once when the sequence ends
+        """
+        self.frames = frames
+        self.world_center = world_center
+        self.duration_ms = max(1, int(duration * 1000))
+        self.start_time = pygame.time.get_ticks() if start_time is None else start_time
+        self.on_complete = on_complete
+
+    def progress(self, now):
+        """Return how far through the sequence it is at ticks now, from 0 to 1."""
+        return min(1.0, max(0.0, (now - self.start_time) / self.duration_ms))
+
+    def finished(self, now):
+        """Return True once the sequence has played out."""
+        return now - self.start_time >= self.duration_ms
+
+    def frame_at(self, now):
+        """Return the frame to show at ticks now."""
+        index = int(self.progress(now) * len(self.frames))
+        return self.frames[min(index, len(self.frames) - 1)]
+
+    def draw(self, surface, camera, now):
+        """
+        Draw the current frame.
+
+        Args:
+            surface: Screen surface to draw on
+            camera: Camera converting world pixels to screen pixels
+            now: Current ticks (ms)
+        """
+        frame = self.frame_at(now)
+        x = self.world_center[0] - frame.get_width() // 2
+        y = self.world_center[1] - frame.get_height() // 2
+        surface.blit(frame, camera.world_to_screen((x, y)))
+
+
+class AnimationScheduler:
+    """
+    Queue of effects currently playing.
+
+    The main loop calls update() once per frame and, when it returns True,
+    redraws the map and then calls draw() on top of it.
+    """
+
+    def __init__(self):
+        """Initialize an empty scheduler."""
+        self._animations = []
+        self.started = 0
+        self.completed = 0
+
+    def play(self, animation):
+        """
+        Start playing an animation alongside any already running.
+
+        Args:
+            animation: SpriteSequence (or any object with finished, draw and on_complete)
+
+        Returns:
+            The animation, so callers can keep a handle on it
+        """
+        self._animations.append(animation)
+        self.started += 1
+        return animation
+
+    def play_frames(self, frames, world_center, duration, on_complete=None):
+        """
+        Start playing a list of frames centred on a world position.
+
+        Args:
+            frames: List of pygame Surfaces (or a single Surface to hold for the duration)
+            world_center: (x, y) world pixel to centre the frames on
+            duration: Length in seconds
+            on_complete: Optional callable run once when the frames end
+
+        Returns:
+            SpriteSequence: The queued animation
+        """
+        if isinstance(frames, pygame.Surface):
+            frames = [frames]
+        return self.play(SpriteSequence(frames, world_center, duration, on_complete=on_complete))
+
+    @property
+    def active(self):
+        """True while at least one animation is playing."""
+        return bool(self._animations)
+
+    def update(self, now=None):
+        """
+        Drop animations that have finished, running their completion callbacks.
+
+        Args:
+            now: Current ticks (ms); defaults to pygame.time.get_ticks()
+
+        Returns:
+            bool: True if anything was playing, i.e. the map needs redrawing this frame
+                  (including the frame that erases an animation which just ended)
+        """
+        if not self._animations:
+            return False
+        now = pygame.time.get_ticks() if now is None else now
+        playing = []
+        for animation in self._animations:
+            if not animation.finished(now):
+                playing.append(animation)
+                continue
+            self.completed += 1
+            if animation.on_complete is not None:
+                try:
+                    animation.on_complete()
+                except Exception as e:
+                    logger.error(f"Animation completion callback failed: {e}")
+        self._animations = playing
+        return True
+
+    def draw(self, surface, camera, now=None):
+        """
+        Draw every playing animation, clipped to the camera's view.
+
+        Args:
+            surface: Screen surface to draw on
+            camera: Camera of the map the animations are positioned in
+            now: Current ticks (ms); defaults to pygame.time.get_ticks()
+        """
+        if not self._animations:
+            return
+        now = pygame.time.get_ticks() if now is None else now
+        with camera.clipped(surface):
+            for animation in self._animations:
+                animation.draw(surface, camera, now)
+
+    def clear(self):
+        """Stop every animation without running completion callbacks (e.g. on a level change)."""
+        self._animations = []
+
+    def stats(self):
+        """
+        Get scheduler statistics.
+
+        Returns:
+            dict: playing, started and completed counts
+        """
+        return {"playing": len(self._animations), "started": self.started, "completed": self.completed}
+
+
+# Create a global animation scheduler instance
+animation_scheduler = AnimationScheduler()
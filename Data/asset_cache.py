@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Asset Cache for Blade & Sigil
+This module provides a process-wide cache of decoded and scaled pygame Surfaces,
+so that every tile, door, chest and monster sharing an image also shares one
+Surface instead of decoding the same file from disk again.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+import pygame
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Default memory budget for cached surfaces (in bytes)
+DEFAULT_BYTE_BUDGET = 64 * 1024 * 1024
+
+
+class AssetCache:
+    """
+    LRU cache of pygame Surfaces keyed by (path, target size, alpha mode).
+
+    Cached surfaces are shared between callers and must be treated as read-only.
+    Callers that want to draw on a sprite must take a copy() first.
+
+    The cache may be used from the dungeon prefetch worker thread as well as
+    the main loop; bookkeeping is guarded by a lock, while image loading and
+    building happen outside it.
+    """
+
+    def __init__(self, byte_budget=DEFAULT_BYTE_BUDGET):
+        """
+        Initialize the asset cache.
+
+        Args:
+            byte_budget: Maximum number of bytes of pixel data kept in the cache
+        """
+        self.byte_budget = byte_budget
+        self._entries = OrderedDict()  # key -> (surface, size_in_bytes)
+        self._lock = threading.RLock()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path, size=None, alpha=True, smooth=True):
+        """
+        Load an image from disk, converting and scaling it, or return the cached copy.
+
+        Args:
+            path: Path to the image file
+            size: Optional (width, height) to scale to; None keeps the native size
+            alpha: True to convert_alpha(), False to convert()
+            smooth: Use smoothscale (True) or scale (False) when resizing
+
+        Returns:
+            pygame.Surface: The shared, converted surface
+
+        Raises:
+            pygame.error, FileNotFoundError: If the image cannot be loaded
+        """
+        size = tuple(size) if size is not None else None
+        key = ("image", path, size, alpha, smooth)
+        surface = self._lookup(key)
+        if surface is not None:
+            return surface
+
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+        if size is not None and image.get_size() != size:
+            if smooth:
+                image = pygame.transform.smoothscale(image, size)
+            else:
+                image = pygame.transform.scale(image, size)
+        return self._store(key, image)
+
+    def get_or_build(self, key, builder):
+        """
+        Return a cached derived surface (e.g. a tinted door sprite), building it on a miss.
+
+        Args:
+            key: Hashable key identifying the derived surface
+            builder: Callable returning the pygame.Surface to cache
+
+        Returns:
+            pygame.Surface: The shared surface for this key
+        """
+        key = ("derived", key)
+        surface = self._lookup(key)
+        if surface is not None:
+            return surface
+
+        return self._store(key, builder())
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _store(self, key, surface):
+        # Returns the cached surface; if another thread stored this key first, its copy wins
+        nbytes = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry[0]
+            self._entries[key] = (surface, nbytes)
+            self.bytes_used += nbytes
+            self._evict()
+        return surface
+
+    def _evict(self):
+        # Always keep the most recently stored entry, even if it alone exceeds the budget
+        while self.bytes_used > self.byte_budget and len(self._entries) > 1:
+            key, (surface, nbytes) = self._entries.popitem(last=False)
+            self.bytes_used -= nbytes
+            self.evictions += 1
+            logger.debug(f"Evicted {key} from asset cache ({nbytes} bytes)")
+
+    def clear(self):
+        """Drop every cached surface. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: entries, bytes, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes_used,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+# Create a global instance of the asset cache
+asset_cache = AssetCache()
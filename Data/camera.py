@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Camera for Blade & Sigil
+This module provides the scrolling view onto a dungeon map. The camera
+follows the player, converts between world pixels (what positions are
+stored in) and screen pixels, and reports which tiles fall inside the view
+so drawing code can skip everything else. Maps that fit in the view are
+never scrolled, so they draw exactly where they always did.
+"""
+
+import logging
+from contextlib import contextmanager
+
+import pygame
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class Camera:
+    """
+    View rectangle over a map, in world pixels.
+
+    (x, y) is the world pixel shown at the view's top-left corner; the view
+    itself sits at screen_origin on the screen.
+    """
+
+    def __init__(self, view_width, view_height, tile_size, screen_origin=(0, 0)):
+        """
+        Initialize a camera at the top-left of the map.
+
+        Args:
+            view_width, view_height: Size of the view in pixels
+            tile_size: Size of one tile in pixels
+            screen_origin: Screen pixel of the view's top-left corner
+        """
+        self.view_width = view_width
+        self.view_height = view_height
+        self.tile_size = tile_size
+        self.screen_origin = screen_origin
+        self.x = 0
+        self.y = 0
+
+    @property
+    def view_rect(self):
+        """The part of the map in view, as a Rect in world pixels."""
+        return pygame.Rect(self.x, self.y, self.view_width, self.view_height)
+
+    @property
+    def screen_rect(self):
+        """The view's area on the screen, as a Rect in screen pixels."""
+        return pygame.Rect(self.screen_origin[0], self.screen_origin[1], self.view_width, self.view_height)
+
+    def follow(self, world_position, map_width, map_height):
+        """
+        Centre the view on a world position, clamped to the map edges.
+
+        Along an axis where the whole map fits in the view the camera stays at 0.
+
+        Args:
+            world_position: (x, y) world pixel to centre on (normally the player's position)
+            map_width, map_height: Map size in pixels
+        """
+        self.x = self._clamp(world_position[0] - self.view_width // 2, map_width - self.view_width)
+        self.y = self._clamp(world_position[1] - self.view_height // 2, map_height - self.view_height)
+
+    @staticmethod
+    def _clamp(value, maximum):
+        return max(0, min(value, maximum)) if maximum > 0 else 0
+
+    def world_to_view(self, position):
+        """Convert a world pixel to a pixel on the view surface."""
+        return position[0] - self.x, position[1] - self.y
+
+    def world_to_screen(self, position):
+        """Convert a world pixel to a screen pixel."""
+        return (position[0] - self.x + self.screen_origin[0],
+                position[1] - self.y + self.screen_origin[1])
+
+    def screen_to_world(self, position):
+        """Convert a screen pixel (e.g. a mouse click) to a world pixel."""
+        return (position[0] - self.screen_origin[0] + self.x,
+                position[1] - self.screen_origin[1] + self.y)
+
+    def screen_to_tile(self, position):
+        """Convert a screen pixel to the (x, y) tile under it."""
+        world_x, world_y = self.screen_to_world(position)
+        return world_x // self.tile_size, world_y // self.tile_size
+
+    def visible_tiles(self, map_width=None, map_height=None):
+        """
+        Get the range of tiles at least partly in view.
+
+        Args:
+            map_width, map_height: Optional map size in tiles to clamp to
+
+        Returns:
+            tuple: (x0, y0, x1, y1) with x1 and y1 exclusive
+        """
+        x0, y0 = self.x // self.tile_size, self.y // self.tile_size
+        x1 = (self.x + self.view_width - 1) // self.tile_size + 1
+        y1 = (self.y + self.view_height - 1) // self.tile_size + 1
+        if map_width is not None:
+            x0, x1 = max(0, x0), min(map_width, x1)
+        if map_height is not None:
+            y0, y1 = max(0, y0), min(map_height, y1)
+        return x0, y0, x1, y1
+
+    def is_tile_visible(self, x, y):
+        """Return True if tile (x, y) is at least partly in view."""
+        x0, y0, x1, y1 = self.visible_tiles()
+        return x0 <= x < x1 and y0 <= y < y1
+
+    @contextmanager
+    def clipped(self, surface):
+        """
+        Limit drawing on a screen surface to the view while the block runs.
+
+        Example:
+            with camera.clipped(screen):
+                screen.blit(effect, camera.world_to_screen(position))
+        """
+        previous = surface.get_clip()
+        surface.set_clip(self.screen_rect.clip(previous))
+        try:
+            yield surface
+        finally:
+            surface.set_clip(previous)
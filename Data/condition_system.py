@@ -11,6 +11,8 @@ import logging
 import random
 from enum import Enum, auto
 
+from .text_cache import text_cache
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -473,8 +475,8 @@ def render_conditions(screen, character, x, y):
         ConditionType.STRENGTHENED: (255, 0, 0), ConditionType.REGENERATING: (50, 205, 50),
         ConditionType.STUNNED: (255, 0, 255), ConditionType.IMMUNE_POISON: (0, 128, 0)
     }
-    try: font_small = pygame.font.Font(None, 12)
-    except pygame.error: font_small = pygame.font.SysFont("monospace", 10)
+    try: font_small = text_cache.font(None, 12)
+    except pygame.error: font_small = text_cache.font("monospace", 10)
 
     for i, cond in enumerate(character.conditions):
         condition_x = x + (icon_size + spacing) * i; condition_y = y
@@ -482,6 +484,6 @@ def render_conditions(screen, character, x, y):
         pygame.draw.rect(screen, color, (condition_x, condition_y, icon_size, icon_size))
         # Use global condition_manager to get current_turn for rendering
         remaining = cond.get_remaining_duration(condition_manager.current_turn)
-        duration_text = font_small.render(str(remaining), True, (255, 255, 255))
+        duration_text = text_cache.render(font_small, remaining, (255, 255, 255))
         text_rect = duration_text.get_rect(center=(condition_x + icon_size // 2, condition_y + icon_size // 2))
         screen.blit(duration_text, text_rect)
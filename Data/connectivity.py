@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Connectivity Checks for Blade & Sigil
+This module verifies after generation that the start, the chests and the
+level exit are all reachable, and works out the smallest repair when they
+are not: which locked doors to unlock so no lock has to be opened on the
+way, and which wall tiles to carve when a target is walled off entirely.
+Everything runs over the flat tile type layer (x * height + y).
+"""
+
+import logging
+import re
+from collections import deque
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Tile types that can be walked on without opening anything
+OPEN_TILE_TYPES = ('floor', 'corridor', 'door', 'stair_down', 'stair_up')
+
+# Tile types that can be crossed only by opening a lock
+LOCKED_TILE_TYPES = ('locked_door',)
+
+# Value used for tiles that cannot be reached at all
+UNREACHABLE = -1
+
+# A run of consecutive open tiles in an open mask
+_OPEN_RUN = re.compile(b"\x01+")
+
+
+def _column_runs(open_mask, width, height):
+    """Get the runs of open tiles in each column as (first y, last y + 1) pairs."""
+    runs = [[] for _ in range(width)]
+    for match in _OPEN_RUN.finditer(open_mask):
+        index, end = match.span()
+        while index < end:
+            # A run that wraps past the bottom of a column continues in the next one
+            x = index // height
+            stop = min(end, (x + 1) * height)
+            runs[x].append((index - x * height, stop - x * height))
+            index = stop
+    return runs
+
+
+def reaches_all(open_mask, width, height, start, targets):
+    """
+    Check whether every target is in the start's region of open tiles.
+
+    The flood fill works on vertical runs of open tiles rather than single
+    tiles, and stops as soon as the last target is found.
+
+    Args:
+        open_mask: Flat mask, 1 for open tiles
+        width, height: Map size in tiles
+        start: (x, y) start tile
+        targets: Iterable of (x, y) tiles
+
+    Returns:
+        bool: True if every target can be reached from start over open tiles
+    """
+    sx, sy = start
+    if not (0 <= sx < width and 0 <= sy < height) or not open_mask[sx * height + sy]:
+        return False
+    remaining = {}  # x -> y of targets not reached yet
+    count = 0
+    for x, y in targets:
+        if not (0 <= x < width and 0 <= y < height) or not open_mask[x * height + y]:
+            return False
+        if y not in remaining.setdefault(x, set()):
+            remaining[x].add(y)
+            count += 1
+    if not count:
+        return True
+
+    runs = _column_runs(open_mask, width, height)
+    first = next(run for run in runs[sx] if run[0] <= sy < run[1])
+    seen = {(sx, first)}
+    frontier = [(sx, first)]
+    while frontier:
+        x, (top, bottom) = frontier.pop()
+        ys = remaining.get(x)
+        if ys:
+            found = {y for y in ys if top <= y < bottom}
+            if found:
+                ys -= found
+                count -= len(found)
+                if not count:
+                    return True
+        for nx in (x - 1, x + 1):
+            if 0 <= nx < width:
+                for run in runs[nx]:
+                    if run[0] < bottom and top < run[1] and (nx, run) not in seen:
+                        seen.add((nx, run))
+                        frontier.append((nx, run))
+    return False
+
+
+def locked_door_costs(open_mask, locked_mask, width, height, start):
+    """
+    Find, for every tile, the fewest locked doors crossed on the way from start (0-1 BFS).
+
+    Args:
+        open_mask: Flat mask, 1 for tiles that can be walked on freely
+        locked_mask: Flat mask, 1 for tiles that need a lock opened
+        width, height: Map size in tiles
+        start: (x, y) start tile
+
+    Returns:
+        tuple: (costs, previous) flat lists; costs are UNREACHABLE where no
+        path exists, previous holds each tile's predecessor index on a cheapest path
+    """
+    size = width * height
+    costs = [UNREACHABLE] * size
+    previous = [-1] * size
+    start_index = start[0] * height + start[1]
+    costs[start_index] = 0
+    frontier = deque([start_index])
+    while frontier:
+        index = frontier.popleft()
+        cost = costs[index]
+        y = index % height
+        for neighbour in (index - height if index >= height else -1,
+                          index + height if index + height < size else -1,
+                          index - 1 if y else -1,
+                          index + 1 if y + 1 < height else -1):
+            if neighbour < 0:
+                continue
+            if open_mask[neighbour]:
+                new_cost = cost
+            elif locked_mask[neighbour]:
+                new_cost = cost + 1
+            else:
+                continue
+            if costs[neighbour] == UNREACHABLE or new_cost < costs[neighbour]:
+                costs[neighbour] = new_cost
+                previous[neighbour] = index
+                if new_cost == cost:
+                    frontier.appendleft(neighbour)
+                else:
+                    frontier.append(neighbour)
+    return costs, previous
+
+
+def plan_repairs(grid, start, targets, max_locked_doors=0):
+    """
+    Check that every target is reachable from start and plan the fixes if not.
+
+    Targets that cannot be reached at all get a corridor carved from the
+    nearest tile of the start region. Targets that need more than
+    max_locked_doors locks opened get the locked doors on their cheapest
+    path unlocked.
+
+    Args:
+        grid: TileGrid of the dungeon
+        start: (x, y) start tile
+        targets: Iterable of (x, y) tiles that must be reachable (chests, exits)
+        max_locked_doors: Locks the player may have to open to reach a target
+
+    Returns:
+        tuple: (doors_to_unlock, tiles_to_carve), a set of (x, y) locked door
+        tiles and a list of (x, y) wall tiles to turn into corridor. Both are
+        empty when the map is already fine.
+    """
+    width, height = grid.width, grid.height
+    open_mask = grid.type_mask(OPEN_TILE_TYPES)
+    target_indices = [x * height + y for x, y in targets if 0 <= x < width and 0 <= y < height]
+    start_index = start[0] * height + start[1]
+
+    # Fast path: every target shares the start's lock-free region
+    if reaches_all(open_mask, width, height, start, [divmod(index, height) for index in target_indices]):
+        return set(), []
+
+    locked_mask = grid.type_mask(LOCKED_TILE_TYPES)
+    costs, previous = locked_door_costs(open_mask, locked_mask, width, height, start)
+
+    doors_to_unlock = set()
+    tiles_to_carve = []
+    reached = None  # Every tile reachable from start, listed only if a target needs carving
+    for index in target_indices:
+        if costs[index] == UNREACHABLE:
+            if reached is None:
+                reached = [i for i in range(width * height) if costs[i] != UNREACHABLE]
+            tiles_to_carve.extend(_corridor_to(index, reached, grid, height))
+        elif costs[index] > max_locked_doors:
+            while index != start_index:
+                if locked_mask[index]:
+                    doors_to_unlock.add((index // height, index % height))
+                index = previous[index]
+    return doors_to_unlock, tiles_to_carve
+
+
+def _corridor_to(target_index, reached, grid, height):
+    """Plan an L-shaped corridor through walls from the nearest reached tile to a target."""
+    tx, ty = divmod(target_index, height)
+    nearest = min(reached, key=lambda index: abs(index // height - tx) + abs(index % height - ty))
+    nx, ny = divmod(nearest, height)
+    path = [(x, ny) for x in range(min(nx, tx), max(nx, tx) + 1)]
+    path += [(tx, y) for y in range(min(ny, ty), max(ny, ty) + 1)]
+    return [(x, y) for x, y in path if grid.type_at(x, y) == 'wall']
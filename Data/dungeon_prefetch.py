@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Dungeon Prefetching for Blade & Sigil
+This module builds the dungeons the player can reach next (the next level
+and any other maps on this level) on a background worker thread while the
+current map is being played, so stepping on stairs or a transition door
+hands over a finished dungeon instead of generating one on the spot.
+"""
+
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class DungeonPrefetcher:
+    """
+    Speculatively generates dungeons on a single worker thread.
+
+    Dungeons are keyed by their generation inputs (width, height, level,
+    map_number, max_maps). Each prefetch draws its seed up front on the
+    calling thread, so a prefetched map is exactly the map a synchronous
+    Dungeon(..., seed=seed) call would have produced.
+
+    A thread is used rather than a process pool because dungeons hold pygame
+    surfaces, which cannot be pickled across processes.
+    """
+
+    def __init__(self, max_workers=1):
+        """
+        Initialize the prefetcher. The worker thread is started on first use.
+
+        Args:
+            max_workers: Number of generation threads
+        """
+        self.max_workers = max_workers
+        self._executor = None
+        self._futures = {}  # key -> Future resolving to a Dungeon
+        self._lock = threading.Lock()
+        self.hits = 0  # Dungeon was ready when the transition happened
+        self.waits = 0  # Generation was still running; waited for it
+        self.misses = 0  # Not prefetched; generated synchronously
+        self.failures = 0
+
+    @staticmethod
+    def make_key(width, height, level=1, map_number=1, max_maps=1):
+        """Build the cache key for a dungeon's generation inputs."""
+        return (width, height, level, map_number, max_maps)
+
+    def prefetch(self, dungeon_class, keys):
+        """
+        Start generating dungeons for the given keys, dropping any other pending ones.
+
+        Args:
+            dungeon_class: Dungeon class (called as dungeon_class(width, height, level=..., ...))
+            keys: Iterable of keys from make_key
+        """
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for key in list(self._futures):
+                if key not in keys:
+                    # No longer reachable; a generation that already started just runs to completion
+                    self._futures.pop(key).cancel()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="dungeon-prefetch")
+            for key in keys:
+                if key not in self._futures:
+                    seed = random.randrange(2 ** 32)
+                    self._futures[key] = self._executor.submit(self._generate, dungeon_class, key, seed)
+                    logger.debug(f"Prefetching dungeon {key} with seed {seed}")
+
+    @staticmethod
+    def _generate(dungeon_class, key, seed):
+        width, height, level, map_number, max_maps = key
+        return dungeon_class(width, height, level=level, map_number=map_number, max_maps=max_maps, seed=seed)
+
+    def take(self, dungeon_class, key):
+        """
+        Get the dungeon for a key: the prefetched one if any, otherwise build it now.
+
+        If generation for the key is still running, this waits for it rather
+        than starting over.
+
+        Args:
+            dungeon_class: Dungeon class, used on a miss
+            key: Key from make_key
+
+        Returns:
+            Dungeon: The new dungeon
+        """
+        with self._lock:
+            future = self._futures.pop(key, None)
+
+        if future is not None and not future.cancelled():
+            ready = future.done()
+            try:
+                dungeon = future.result()
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Prefetching dungeon {key} failed: {e}")
+            else:
+                if ready:
+                    self.hits += 1
+                else:
+                    self.waits += 1
+                return dungeon
+
+        self.misses += 1
+        return self._generate(dungeon_class, key, random.randrange(2 ** 32))
+
+    def clear(self):
+        """Cancel and forget every pending prefetch. Counters are kept."""
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+
+    def shutdown(self):
+        """Cancel pending work and stop the worker thread."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self):
+        """
+        Get prefetch statistics.
+
+        Returns:
+            dict: pending, hits, waits, misses, failures and hit_rate
+        """
+        transitions = self.hits + self.waits + self.misses
+        return {
+            "pending": len(self._futures),
+            "hits": self.hits,
+            "waits": self.waits,
+            "misses": self.misses,
+            "failures": self.failures,
+            "hit_rate": (self.hits + self.waits) / transitions if transitions else 0.0,
+        }
+
+# Create a global instance of the dungeon prefetcher
+dungeon_prefetcher = DungeonPrefetcher()
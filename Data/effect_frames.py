@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Effect Frame Cache for Blade & Sigil
+This module bakes procedurally drawn spell effects (fireball explosions,
+frost rings) into sprite sheets once per (effect, size, frame count) and
+hands out the frames on every later cast, so replaying an effect costs
+only blits. Sheets can optionally be written to and read back from a
+directory, so the frames survive between runs.
+"""
+
+import logging
+import os
+
+import pygame
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class EffectFrameCache:
+    """
+    Baked effect frames keyed by (effect, cell size, frame count).
+
+    Each effect is stored as one horizontal sprite sheet of square cells;
+    the frames handed out are subsurfaces of it and must be treated as
+    read-only.
+    """
+
+    def __init__(self, sheet_dir=None):
+        """
+        Initialize an empty frame cache.
+
+        Args:
+            sheet_dir: Optional directory to persist sprite sheets in; None keeps them in memory only
+        """
+        self.sheet_dir = sheet_dir
+        self._sequences = {}  # (effect, cell_size, frame_count) -> list of frame Surfaces
+        self.hits = 0
+        self.bakes = 0
+        self.loads = 0
+
+    def frames(self, effect, cell_size, frame_count, draw_frame):
+        """
+        Get the frames of an effect, baking them on first use.
+
+        Args:
+            effect: Effect name, e.g. "fireball_explosion"
+            cell_size: Width and height of each frame in pixels
+            frame_count: Number of frames
+            draw_frame: Callable(cell, index, frame_count) drawing frame index onto an empty,
+                        transparent cell_size x cell_size surface
+
+        Returns:
+            list: frame_count pygame Surfaces
+        """
+        key = (effect, cell_size, frame_count)
+        sequence = self._sequences.get(key)
+        if sequence is not None:
+            self.hits += 1
+            return sequence
+
+        sheet = self._load_sheet(key)
+        if sheet is None:
+            sheet = self._bake_sheet(key, draw_frame)
+            self._save_sheet(key, sheet)
+
+        sequence = [sheet.subsurface((i * cell_size, 0, cell_size, cell_size)) for i in range(frame_count)]
+        self._sequences[key] = sequence
+        return sequence
+
+    def _bake_sheet(self, key, draw_frame):
+        effect, cell_size, frame_count = key
+        sheet = pygame.Surface((cell_size * frame_count, cell_size), pygame.SRCALPHA)
+        for index in range(frame_count):
+            draw_frame(sheet.subsurface((index * cell_size, 0, cell_size, cell_size)), index, frame_count)
+        self.bakes += 1
+        logger.debug(f"Baked {frame_count} frames of {effect} at {cell_size}px")
+        return sheet
+
+    def _sheet_path(self, key):
+        effect, cell_size, frame_count = key
+        return os.path.join(self.sheet_dir, f"{effect}_{cell_size}px_{frame_count}f.png")
+
+    def _load_sheet(self, key):
+        if not self.sheet_dir:
+            return None
+        path = self._sheet_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            sheet = pygame.image.load(path).convert_alpha()
+        except pygame.error as e:
+            logger.warning(f"Could not load effect sheet {path}: {e}")
+            return None
+        if sheet.get_size() != (key[1] * key[2], key[1]):
+            logger.warning(f"Ignoring effect sheet {path} with unexpected size {sheet.get_size()}")
+            return None
+        self.loads += 1
+        return sheet
+
+    def _save_sheet(self, key, sheet):
+        if not self.sheet_dir:
+            return
+        path = self._sheet_path(key)
+        try:
+            os.makedirs(self.sheet_dir, exist_ok=True)
+            pygame.image.save(sheet, path)
+        except (OSError, pygame.error) as e:
+            logger.warning(f"Could not save effect sheet {path}: {e}")
+
+    def clear(self):
+        """Drop every baked sequence from memory. Counters are kept."""
+        self._sequences.clear()
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: sequences, hits, bakes and loads
+        """
+        return {"sequences": len(self._sequences), "hits": self.hits, "bakes": self.bakes, "loads": self.loads}
+
+
+# Create a global effect frame cache instance
+effect_frames = EffectFrameCache()
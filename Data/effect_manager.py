@@ -10,6 +10,8 @@ effects on characters, such as buffs, debuffs, and damage over time.
 import logging
 import pygame
 
+from .text_cache import text_cache
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -276,10 +278,7 @@ def render_status_effects(screen, character, x, y):
         # Draw effect icon
         pygame.draw.rect(screen, color, (effect_x, effect_y, icon_size, icon_size))
         
-        # Create a small font for effect duration
-        font = pygame.font.Font(None, 12)
-        
-        # Render duration text
-        duration_text = font.render(str(turns_remaining), True, (255, 255, 255))
+        # Render duration text in a small font
+        duration_text = text_cache.render(text_cache.font(None, 12), turns_remaining, (255, 255, 255))
         text_rect = duration_text.get_rect(center=(effect_x + icon_size // 2, effect_y + icon_size // 2))
         screen.blit(duration_text, text_rect)
\ No newline at end of file
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Fog of War for Blade & Sigil
+This module tracks, per tile, whether it is unseen, remembered or currently
+visible, using the TileGrid's discovered and visible layers as the state.
+The alpha mask is only built for the tiles in the camera's view, so its
+size follows the view rather than the map, and it is rebuilt only when the
+view moves or a tile's state changes.
+"""
+
+import logging
+
+import pygame
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Tile visibility states
+UNSEEN = 0
+REMEMBERED = 1
+VISIBLE = 2
+
+# Darkness drawn over a tile in each state (0 = fully clear, 255 = black)
+FOG_ALPHA = {
+    UNSEEN: 240,
+    REMEMBERED: 180,
+    VISIBLE: 0,
+}
+
+
+class _FogLayers:
+    """Discovered/visible layers for maps whose tiles are not a TileGrid."""
+
+    def __init__(self, size):
+        self.discovered = bytearray(size)
+        self.visible = bytearray(size)
+
+
+class FogOfWar:
+    """
+    Fog of war for one dungeon map.
+
+    A tile's state is discovered + visible from the TileGrid layers (indexed
+    x * height + y): 0 unseen, 1 remembered, 2 visible. The discovered layer
+    is persisted by save_game, so remembered tiles survive a reload. Plain
+    tiles[x][y] grids get layers of their own, seeded from the tiles'
+    `discovered` flags and kept in sync as tiles are seen.
+    """
+
+    def __init__(self, width, height, tile_size, tiles=None):
+        """
+        Initialize the fog for a map.
+
+        Args:
+            width, height: Map size in tiles
+            tile_size: Size of one tile in pixels
+            tiles: Optional tiles[x][y] grid or TileGrid; tiles with discovered=True start remembered
+        """
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.visible = set()
+        self._last_cells = None  # Last FOV result applied, to skip repeated frames
+
+        if tiles is not None and hasattr(tiles, "discovered") and hasattr(tiles, "visible"):
+            # Tile grid: its layers are the fog state. Nothing is in view until the first update.
+            self.layers = tiles
+            self.layers.visible[:] = bytearray(len(self.layers.visible))
+        else:
+            self.layers = _FogLayers(width * height)
+            if tiles is not None:
+                for x in range(width):
+                    column = tiles[x]
+                    for y in range(height):
+                        if getattr(column[y], "discovered", False):
+                            self.layers.discovered[x * height + y] = 1
+
+        # View-sized mask, rebuilt when the tile window moves or a state changes
+        self._mask = None
+        self._mask_window = None
+        self._mask_stale = True
+
+    def state(self, x, y):
+        """Return UNSEEN, REMEMBERED or VISIBLE for tile (x, y)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = x * self.height + y
+            return self.layers.discovered[index] + self.layers.visible[index]
+        return UNSEEN
+
+    def update(self, visible_cells, tiles=None):
+        """
+        Apply a new FOV result, touching only tiles whose state changed.
+
+        Args:
+            visible_cells: Set of (x, y) tiles currently visible
+            tiles: Optional plain tiles[x][y] grid whose discovered flags are kept in sync
+                (a TileGrid is already in sync through its layers)
+
+        Returns:
+            int: Number of tiles whose state changed
+        """
+        if visible_cells is self._last_cells:
+            return 0
+        self._last_cells = visible_cells
+
+        visible_cells = {
+            (x, y) for x, y in visible_cells
+            if 0 <= x < self.width and 0 <= y < self.height
+        }
+        layers = self.layers
+        sync_tiles = tiles is not None and tiles is not layers
+        changed = 0
+
+        for x, y in self.visible - visible_cells:
+            layers.visible[x * self.height + y] = 0
+            changed += 1
+
+        for x, y in visible_cells - self.visible:
+            index = x * self.height + y
+            layers.visible[index] = 1
+            layers.discovered[index] = 1
+            if sync_tiles:
+                tiles[x][y].discovered = True
+            changed += 1
+
+        self.visible = visible_cells
+        if changed:
+            self._mask_stale = True
+        return changed
+
+    def is_visible(self, x, y):
+        """Return True if tile (x, y) is in the current FOV."""
+        return (x, y) in self.visible
+
+    def is_discovered(self, x, y):
+        """Return True if tile (x, y) has ever been seen."""
+        return self.state(x, y) != UNSEEN
+
+    def _tile_window(self, area):
+        """Tiles (x0, y0, x1, y1) at least partly inside a pixel area, clamped to the map."""
+        ts = self.tile_size
+        x0 = max(0, area.x // ts)
+        y0 = max(0, area.y // ts)
+        x1 = min(self.width, -(-area.right // ts))
+        y1 = min(self.height, -(-area.bottom // ts))
+        return x0, y0, max(x0, x1), max(y0, y1)
+
+    def _build_mask(self, window):
+        """Rebuild the mask for a tile window: one pixel per tile, scaled up to tile size."""
+        x0, y0, x1, y1 = window
+        w, h = x1 - x0, y1 - y0
+        size = (w * self.tile_size, h * self.tile_size)
+        if self._mask is None or self._mask.get_size() != size:
+            self._mask = pygame.Surface(size, pygame.SRCALPHA)
+        self._mask_window = window
+        self._mask_stale = False
+        if not w or not h:
+            return
+
+        alpha = bytes(FOG_ALPHA[state] for state in range(3))
+        discovered, visible = self.layers.discovered, self.layers.visible
+        rgba = bytearray(4 * w * h)
+        for column, x in enumerate(range(x0, x1)):
+            start = x * self.height + y0
+            rgba[4 * column + 3::4 * w] = bytes(
+                alpha[d + v] for d, v in zip(discovered[start:start + h], visible[start:start + h])
+            )
+        tiles = pygame.image.frombuffer(bytes(rgba), (w, h), "RGBA")
+        pygame.transform.scale(tiles, size, self._mask)
+
+    def draw(self, surface, offset=(0, 0), area=None):
+        """
+        Blit the fog for the tiles inside an area onto a surface.
+
+        Args:
+            surface: Pygame surface to draw on
+            offset: Pixel position on the surface of the area's top-left corner
+            area: Optional Rect of the map to draw, in map pixels (e.g. a camera's view_rect);
+                defaults to the whole map
+        """
+        if area is None:
+            area = pygame.Rect(0, 0, self.width * self.tile_size, self.height * self.tile_size)
+        window = self._tile_window(area)
+        if self._mask_stale or window != self._mask_window:
+            self._build_mask(window)
+        surface.blit(self._mask, (offset[0] + window[0] * self.tile_size - area.x,
+                                  offset[1] + window[1] * self.tile_size - area.y))
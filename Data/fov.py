@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Field of View for Blade & Sigil
+This module computes visible tiles with symmetric shadowcasting over a
+flat opacity grid. Each tile in the light radius is visited at most once
+per octant pair, so the cost grows with the area of the light (O(r^2))
+instead of tracing a separate line to every tile.
+"""
+
+import logging
+from collections import OrderedDict
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Tile types that always block sight
+OPAQUE_TILE_TYPES = ('wall',)
+
+# Tile types that block sight unless their door is open
+DOOR_TILE_TYPES = ('door', 'locked_door')
+
+
+def is_opaque(tile_type, door=None):
+    """
+    Check whether a tile blocks sight.
+
+    Args:
+        tile_type: Tile type string
+        door: Door object on this tile, if any
+
+    Returns:
+        bool: True for walls and for door tiles whose door is missing or closed
+    """
+    if tile_type in OPAQUE_TILE_TYPES:
+        return True
+    if tile_type in DOOR_TILE_TYPES:
+        return door is None or not door.open
+    return False
+
+
+def build_opacity_grid(dungeon):
+    """
+    Build a flat opacity grid for a dungeon.
+
+    Args:
+        dungeon: Dungeon with width, height, tiles[x][y] and doors {(x, y): Door}
+
+    Returns:
+        bytearray: 1 for opaque tiles, 0 for transparent ones, indexed x * height + y
+    """
+    width, height = dungeon.width, dungeon.height
+    doors = dungeon.doors
+    tiles = dungeon.tiles
+    if hasattr(tiles, "type_mask"):
+        # Walls straight from the type layer; door tiles are few, so check them one by one
+        opacity = tiles.type_mask(OPAQUE_TILE_TYPES)
+        door_mask = tiles.type_mask(DOOR_TILE_TYPES)
+        index = door_mask.find(1)
+        while index >= 0:
+            x, y = divmod(index, height)
+            if is_opaque(tiles.type_names[tiles.types[index]], doors.get((x, y))):
+                opacity[index] = 1
+            index = door_mask.find(1, index + 1)
+        return opacity
+
+    opacity = bytearray(width * height)
+    for x in range(width):
+        column = dungeon.tiles[x]
+        base = x * height
+        for y in range(height):
+            tile_type = column[y].type
+            if tile_type in OPAQUE_TILE_TYPES:
+                opacity[base + y] = 1
+            elif tile_type in DOOR_TILE_TYPES and is_opaque(tile_type, doors.get((x, y))):
+                opacity[base + y] = 1
+    return opacity
+
+
+def _round_ties_up(num, den):
+    # floor(num / den + 1/2) for den > 0
+    return (2 * num + den) // (2 * den)
+
+
+def _round_ties_down(num, den):
+    # ceil(num / den - 1/2) for den > 0
+    return -((den - 2 * num) // (2 * den))
+
+
+def shadowcast_fov(opacity, width, height, origin, radius):
+    """
+    Compute visible tiles from an origin using symmetric shadowcasting.
+
+    Opaque tiles are themselves visible but hide what lies behind them.
+    Tiles outside the map are treated as opaque and never returned.
+
+    Args:
+        opacity: Flat opacity grid from build_opacity_grid (x * height + y)
+        width, height: Map size in tiles
+        origin: (x, y) tile of the viewer
+        radius: Light radius in tiles (Euclidean)
+
+    Returns:
+        set: (x, y) tiles visible from the origin
+    """
+    ox, oy = origin
+    visible = set()
+    if 0 <= ox < width and 0 <= oy < height:
+        visible.add((ox, oy))
+    if radius <= 0:
+        return visible
+    radius_sq = radius * radius
+
+    # (depth axis, column axis) transforms for the north, south, east and west quadrants
+    for qx_row, qy_row, qx_col, qy_col in ((0, -1, 1, 0), (0, 1, 1, 0), (1, 0, 0, 1), (-1, 0, 0, 1)):
+        # Each row is (depth, start_num, start_den, end_num, end_den); slopes are kept as integer fractions
+        rows = [(1, -1, 1, 1, 1)]
+        while rows:
+            depth, start_num, start_den, end_num, end_den = rows.pop()
+            if depth > radius:
+                continue
+
+            min_col = _round_ties_up(depth * start_num, start_den)
+            max_col = _round_ties_down(depth * end_num, end_den)
+            prev_opaque = None  # None until the first tile of the row is seen
+
+            for col in range(min_col, max_col + 1):
+                x = ox + qx_row * depth + qx_col * col
+                y = oy + qy_row * depth + qy_col * col
+                in_bounds = 0 <= x < width and 0 <= y < height
+                opaque = not in_bounds or opacity[x * height + y] == 1
+
+                if in_bounds and depth * depth + col * col <= radius_sq:
+                    # Walls are always revealed; floors only when symmetric
+                    if opaque or (col * start_den >= depth * start_num and col * end_den <= depth * end_num):
+                        visible.add((x, y))
+
+                if prev_opaque and not opaque:
+                    # Leaving a wall: the row now starts at this tile's left edge
+                    start_num, start_den = 2 * col - 1, 2 * depth
+                if prev_opaque is False and opaque:
+                    # Entering a wall: scan the next row up to this tile's left edge
+                    rows.append((depth + 1, start_num, start_den, 2 * col - 1, 2 * depth))
+                prev_opaque = opaque
+
+            if prev_opaque is False:
+                rows.append((depth + 1, start_num, start_den, end_num, end_den))
+
+    return visible
+
+
+class FOVCache:
+    """
+    Cache of FOV results keyed by (viewer tile, radius, dungeon opacity version).
+
+    The player only moves on discrete turns, so most frames ask for the same
+    field of view again. Any change that affects sight must bump the dungeon's
+    opacity_version (see Dungeon.set_tile_type), which retires old entries.
+    Dungeons that carry a packed `opacity` bitmap have it read directly.
+    """
+
+    def __init__(self, max_entries=32):
+        """
+        Initialize the FOV cache.
+
+        Args:
+            max_entries: Number of FOV results kept for the current dungeon
+        """
+        self.max_entries = max_entries
+        self._dungeon = None
+        self._opacity = None
+        self._opacity_version = None
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_visible(self, dungeon, origin, radius):
+        """
+        Return the visible tiles from an origin, computing them only on a cache miss.
+
+        Args:
+            dungeon: Dungeon being viewed
+            origin: (x, y) tile of the viewer
+            radius: Light radius in tiles
+
+        Returns:
+            frozenset: (x, y) tiles visible from the origin
+        """
+        if dungeon is not self._dungeon:
+            self.clear()
+            self._dungeon = dungeon
+
+        version = getattr(dungeon, "opacity_version", 0)
+        key = (tuple(origin), radius, version)
+        visible = self._entries.get(key)
+        if visible is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return visible
+
+        self.misses += 1
+        opacity = getattr(dungeon, "opacity", None)
+        if opacity is None:
+            if self._opacity is None or self._opacity_version != version:
+                self._opacity = build_opacity_grid(dungeon)
+                self._opacity_version = version
+            opacity = self._opacity
+        visible = frozenset(shadowcast_fov(opacity, dungeon.width, dungeon.height, key[0], radius))
+
+        self._entries[key] = visible
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return visible
+
+    def clear(self):
+        """Drop all cached results. Counters are kept."""
+        self._dungeon = None
+        self._opacity = None
+        self._opacity_version = None
+        self._entries.clear()
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: entries, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+# Create a global instance of the FOV cache
+fov_cache = FOVCache()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Frame Compositor for Blade & Sigil
+This module decides each frame which parts of the screen need redrawing.
+The screen is split into named layers (map, panels, overlays). A layer is
+redrawn only when it has been invalidated or its signature (a cheap value
+describing what it shows) has changed, together with every layer that
+overlaps it. Only the redrawn rectangles are pushed to the display, and
+the frame rate drops to an idle rate once nothing has changed for a while,
+so the game does not keep a CPU core busy while the player is reading.
+"""
+
+import logging
+from collections import OrderedDict
+
+import pygame
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Default frame rate cap while something is changing
+DEFAULT_FPS = 60
+
+# Default frame rate once nothing has changed for idle_after_ms
+DEFAULT_IDLE_FPS = 10
+
+# Default time without changes before throttling to the idle rate
+DEFAULT_IDLE_AFTER_MS = 500
+
+# Marker for a signature that has never been set
+_UNSET = object()
+
+
+class FrameCompositor:
+    """
+    Dirty-rectangle bookkeeping for the screen.
+
+    Layers are drawn bottom to top in the order they were added. Each frame:
+
+        redraw = compositor.begin_frame()
+        if "map" in redraw:
+            ...draw the map...
+        compositor.present()
+        compositor.tick(clock)
+    """
+
+    def __init__(self, fps=DEFAULT_FPS, idle_fps=DEFAULT_IDLE_FPS, idle_after_ms=DEFAULT_IDLE_AFTER_MS):
+        """
+        Initialize a compositor with no layers.
+
+        Args:
+            fps: Frame rate cap while the screen is changing
+            idle_fps: Frame rate cap once it has been still for idle_after_ms
+            idle_after_ms: Time without redraws or input before throttling
+        """
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_after_ms = idle_after_ms
+        self._layers = OrderedDict()  # name -> {"rect", "signature", "dirty"}
+        self._redraw = []  # Layers being redrawn this frame, bottom to top
+        self._last_change = 0  # Ticks of the last redraw or input
+        self.frames = 0
+        self.idle_frames = 0  # Frames that pushed nothing to the display
+        self.pixels_updated = 0
+
+    def add_layer(self, name, rect):
+        """
+        Add a layer above the existing ones. New layers start dirty.
+
+        Args:
+            name: Layer name
+            rect: Screen area the layer draws into (Rect or (x, y, w, h))
+        """
+        self._layers[name] = {"rect": pygame.Rect(rect), "signature": _UNSET, "dirty": True}
+
+    def set_rect(self, name, rect):
+        """Move or resize a layer; both its old and new areas are redrawn."""
+        layer = self._layers[name]
+        rect = pygame.Rect(rect)
+        if rect != layer["rect"]:
+            self.invalidate_rect(layer["rect"])
+            layer["rect"] = rect
+            layer["dirty"] = True
+
+    def invalidate(self, name=None):
+        """
+        Force a layer (or, with no name, every layer) to be redrawn next frame.
+
+        Call this after input, after a game turn, or when a modal screen drew over everything.
+        """
+        if name is None:
+            for layer in self._layers.values():
+                layer["dirty"] = True
+        else:
+            self._layers[name]["dirty"] = True
+
+    def invalidate_rect(self, rect):
+        """Force every layer overlapping a screen area to be redrawn next frame."""
+        rect = pygame.Rect(rect)
+        for layer in self._layers.values():
+            if layer["rect"].colliderect(rect):
+                layer["dirty"] = True
+
+    def set_signature(self, name, signature):
+        """
+        Record what a layer currently shows; the layer is redrawn when this differs from last frame.
+
+        Args:
+            name: Layer name
+            signature: Any comparable value, e.g. a tuple of the state the layer draws
+        """
+        layer = self._layers[name]
+        if layer["signature"] != signature:
+            layer["signature"] = signature
+            layer["dirty"] = True
+
+    def begin_frame(self):
+        """
+        Work out which layers to redraw this frame.
+
+        Every dirty layer is redrawn along with all layers that overlap it
+        (repeatedly, so overlaps of overlaps are included): layers below
+        provide its background and layers above must be drawn back on top.
+
+        Returns:
+            list: Names of the layers to redraw, bottom to top
+        """
+        names = list(self._layers)
+        redraw = {name for name in names if self._layers[name]["dirty"]}
+        pending = list(redraw)
+        while pending:
+            rect = self._layers[pending.pop()]["rect"]
+            for name in names:
+                if name not in redraw and self._layers[name]["rect"].colliderect(rect):
+                    redraw.add(name)
+                    pending.append(name)
+        self._redraw = [name for name in names if name in redraw]
+        for name in self._redraw:
+            self._layers[name]["dirty"] = False
+        return self._redraw
+
+    def present(self):
+        """
+        Push the redrawn layers' areas to the display.
+
+        Returns:
+            list: Rects passed to pygame.display.update (empty if nothing changed)
+        """
+        rects = [self._layers[name]["rect"] for name in self._redraw]
+        self.frames += 1
+        if rects:
+            pygame.display.update(rects)
+            self._last_change = pygame.time.get_ticks()
+            self.pixels_updated += sum(rect.width * rect.height for rect in rects)
+        else:
+            self.idle_frames += 1
+        self._redraw = []
+        return rects
+
+    def note_activity(self):
+        """Keep the full frame rate, e.g. while input is arriving or a path is being walked."""
+        self._last_change = pygame.time.get_ticks()
+
+    def is_idle(self):
+        """Return True once nothing has changed for idle_after_ms."""
+        return pygame.time.get_ticks() - self._last_change >= self.idle_after_ms
+
+    def tick(self, clock):
+        """
+        Wait out the rest of the frame at the full or idle frame rate.
+
+        Args:
+            clock: pygame.time.Clock of the main loop
+
+        Returns:
+            int: Milliseconds since the previous tick
+        """
+        return clock.tick(self.idle_fps if self.is_idle() else self.fps)
+
+    def stats(self):
+        """
+        Get redraw statistics.
+
+        Returns:
+            dict: frames, idle_frames, idle_rate and mean pixels pushed per frame
+        """
+        return {
+            "frames": self.frames,
+            "idle_frames": self.idle_frames,
+            "idle_rate": self.idle_frames / self.frames if self.frames else 0.0,
+            "pixels_per_frame": self.pixels_updated / self.frames if self.frames else 0.0,
+        }
@@ -0,0 +1,408 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Pathfinding for Blade & Sigil
+This module provides a breadth-first flow field toward a goal tile (usually
+the player) that every monster can share to pick its next step, so chasing
+around corners costs one search per turn regardless of monster count. The
+search is expanded lazily, only as far as the farthest monster that asks,
+so its cost does not grow with the size of the map.
+It also provides budgeted A* point-to-point paths with a cache, used for
+long-range monster pursuit and click-to-travel.
+"""
+
+import heapq
+import logging
+from collections import OrderedDict, deque
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Tile types monsters can walk on
+WALKABLE_TILE_TYPES = ('floor', 'corridor', 'door')
+
+# Tile types the player can walk on (stairs included)
+PLAYER_WALKABLE_TILE_TYPES = ('floor', 'corridor', 'door', 'stair_down', 'stair_up')
+
+# No tiles restricted to being the goal of a path
+NO_GOAL_ONLY_TILES = frozenset()
+
+# Default number of tiles A* may expand before giving up
+DEFAULT_NODE_BUDGET = 2000
+
+# Orthogonal neighbour offsets
+NEIGHBOUR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def is_walkable(dungeon, x, y):
+    """
+    Check whether a tile can be walked on.
+
+    Args:
+        dungeon: Dungeon with width, height and tiles[x][y]
+        x, y: Tile coordinates
+
+    Returns:
+        bool: True if the tile is in bounds and of a walkable type
+    """
+    return 0 <= x < dungeon.width and 0 <= y < dungeon.height and dungeon.tiles[x][y].type in WALKABLE_TILE_TYPES
+
+
+def walkable_mask(dungeon, walkable_types=WALKABLE_TILE_TYPES):
+    """
+    Build a flat mask of tiles of the given types.
+
+    Args:
+        dungeon: Dungeon with width, height and tiles[x][y]
+        walkable_types: Tile types that may be entered
+
+    Returns:
+        bytearray: 1 for walkable tiles, 0 otherwise, indexed x * height + y
+    """
+    tiles = dungeon.tiles
+    if hasattr(tiles, "type_mask"):
+        return tiles.type_mask(walkable_types)
+    mask = bytearray(dungeon.width * dungeon.height)
+    for x in range(dungeon.width):
+        column = tiles[x]
+        for y in range(dungeon.height):
+            if column[y].type in walkable_types:
+                mask[x * dungeon.height + y] = 1
+    return mask
+
+
+class FlowField:
+    """
+    Distance map from the walkable tiles around a goal tile to the goal.
+
+    The breadth-first search is resumed on demand: asking for a tile's
+    distance expands the search just until that tile is reached (or the
+    search runs out of tiles). Its cost therefore follows the area between
+    the goal and the monsters that chase, not the size of the map. Tiles
+    that cannot reach the goal have no distance (-1).
+    """
+
+    def __init__(self, dungeon, goal, walkable=None):
+        """
+        Start the breadth-first search from the goal.
+
+        Args:
+            dungeon: Dungeon to search
+            goal: (x, y) goal tile
+            walkable: Optional walkable mask from walkable_mask(), to reuse between fields
+        """
+        self.width = dungeon.width
+        self.height = dungeon.height
+        self.goal = tuple(goal)
+        self.distances = {}  # x * height + y -> steps to the goal
+        self._frontier = deque()
+
+        gx, gy = self.goal
+        if not (0 <= gx < self.width and 0 <= gy < self.height):
+            return
+
+        self._walkable = walkable if walkable is not None else walkable_mask(dungeon)
+        self.distances[gx * self.height + gy] = 0
+        self._frontier.append(self.goal)
+
+    def _expand_to(self, index):
+        """Continue the search until tile index has a distance or no tiles are left."""
+        height, width = self.height, self.width
+        walkable, distances, frontier = self._walkable, self.distances, self._frontier
+        while frontier and index not in distances:
+            x, y = frontier.popleft()
+            next_distance = distances[x * height + y] + 1
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    neighbour = nx * height + ny
+                    if walkable[neighbour] and neighbour not in distances:
+                        distances[neighbour] = next_distance
+                        frontier.append((nx, ny))
+
+    def distance(self, x, y):
+        """
+        Get the walking distance from a tile to the goal.
+
+        Returns:
+            int: Number of steps, or -1 if unreachable or out of bounds
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = x * self.height + y
+            if index not in self.distances:
+                self._expand_to(index)
+            return self.distances.get(index, -1)
+        return -1
+
+    def next_step(self, x, y, blocked=None):
+        """
+        Pick the neighbouring tile that moves closer to the goal.
+
+        Ties are broken toward the axis with the larger remaining offset,
+        which keeps movement looking like the old straight-line chase.
+
+        Args:
+            x, y: Current tile
+            blocked: Optional set of (x, y) tiles that may not be entered
+
+        Returns:
+            tuple: (x, y) of the next tile, or None if no neighbour is closer
+        """
+        current = self.distance(x, y)
+        if current <= 0:
+            return None
+
+        gx, gy = self.goal
+        if abs(gx - x) > abs(gy - y):
+            offsets = sorted(NEIGHBOUR_OFFSETS, key=lambda offset: offset[0] == 0)
+        else:
+            offsets = sorted(NEIGHBOUR_OFFSETS, key=lambda offset: offset[1] == 0)
+
+        best, best_distance = None, current
+        for dx, dy in offsets:
+            nx, ny = x + dx, y + dy
+            if blocked and (nx, ny) in blocked:
+                continue
+            # Closer neighbours were labelled before this tile, so no expansion is needed
+            candidate = self.distances.get(nx * self.height + ny, -1) \
+                if 0 <= nx < self.width and 0 <= ny < self.height else -1
+            if 0 <= candidate < best_distance:
+                best, best_distance = (nx, ny), candidate
+        return best
+
+
+class FlowFieldCache:
+    """
+    Holds the current flow field for one dungeon, rebuilt only when the goal
+    tile or the dungeon's map_version changes.
+
+    The walkable mask is kept per map_version, so a goal change (the player
+    taking a step) only costs the search out to the monsters that chase.
+    """
+
+    def __init__(self):
+        self._dungeon = None
+        self._key = None
+        self._field = None
+        self._walkable = None
+        self._walkable_version = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, dungeon, goal):
+        """
+        Get the flow field toward a goal tile, building it on a miss.
+
+        Args:
+            dungeon: Dungeon to search
+            goal: (x, y) goal tile
+
+        Returns:
+            FlowField: Shared flow field
+        """
+        version = getattr(dungeon, "map_version", 0)
+        key = (tuple(goal), version)
+        if dungeon is self._dungeon and key == self._key:
+            self.hits += 1
+            return self._field
+
+        self.misses += 1
+        if dungeon is not self._dungeon or version != self._walkable_version:
+            self._walkable = walkable_mask(dungeon)
+            self._walkable_version = version
+        self._dungeon = dungeon
+        self._key = key
+        self._field = FlowField(dungeon, goal, self._walkable)
+        return self._field
+
+    def clear(self):
+        """Drop the cached flow field. Counters are kept."""
+        self._dungeon = None
+        self._key = None
+        self._field = None
+        self._walkable = None
+        self._walkable_version = None
+
+# Create a global instance of the flow field cache
+flow_field_cache = FlowFieldCache()
+
+
+def find_path(dungeon, start, goal, walkable_types=WALKABLE_TILE_TYPES, max_nodes=DEFAULT_NODE_BUDGET,
+              goal_only=NO_GOAL_ONLY_TILES, walkable=None):
+    """
+    Find a shortest orthogonal path with A* (Manhattan heuristic).
+
+    Args:
+        dungeon: Dungeon to search
+        start: (x, y) start tile
+        goal: (x, y) goal tile; must itself be walkable
+        walkable_types: Tile types that may be entered
+        max_nodes: Maximum number of tiles to expand before giving up
+        goal_only: (x, y) tiles that may only be entered as the goal (e.g. stairs)
+        walkable: Optional mask from walkable_mask(dungeon, walkable_types), to reuse between searches
+
+    Returns:
+        tuple: (path, expanded) where path is a tuple of tiles from start to goal
+        (inclusive), or None if no path was found within the budget
+    """
+    start, goal = tuple(start), tuple(goal)
+    if start == goal:
+        return (start,), 0
+    gx, gy = goal
+    if not (0 <= gx < dungeon.width and 0 <= gy < dungeon.height) or dungeon.tiles[gx][gy].type not in walkable_types:
+        return None, 0
+
+    width, height = dungeon.width, dungeon.height
+    if walkable is None:
+        walkable = walkable_mask(dungeon, walkable_types)
+    came_from = {start: None}
+    cost = {start: 0}
+    open_heap = [(abs(gx - start[0]) + abs(gy - start[1]), 0, start)]
+    expanded = 0
+
+    while open_heap:
+        _, current_cost, current = heapq.heappop(open_heap)
+        if current == goal:
+            path = []
+            while current is not None:
+                path.append(current)
+                current = came_from[current]
+            path.reverse()
+            return tuple(path), expanded
+        if current_cost > cost[current]:
+            continue  # Stale heap entry
+
+        expanded += 1
+        if expanded > max_nodes:
+            logger.debug(f"A* budget of {max_nodes} nodes exhausted from {start} to {goal}")
+            return None, expanded
+
+        x, y = current
+        next_cost = current_cost + 1
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbour = (nx, ny)
+            if neighbour in goal_only and neighbour != goal:
+                continue
+            if next_cost < cost.get(neighbour, next_cost + 1) and walkable[nx * height + ny]:
+                cost[neighbour] = next_cost
+                came_from[neighbour] = current
+                heapq.heappush(open_heap, (next_cost + abs(gx - nx) + abs(gy - ny), next_cost, neighbour))
+
+    return None, expanded
+
+
+class PathCache:
+    """
+    Cache of A* paths keyed by (start, goal, walkable types, goal-only tiles, dungeon map_version).
+
+    Every tile along a found path is indexed too, so an entity walking the
+    path gets cache hits for the rest of the trip. Entries are dropped as soon
+    as the dungeon's map_version changes (e.g. a door is unlocked). The
+    walkable mask for each set of tile types is kept per map_version too, so a
+    miss only costs the A* search itself.
+    """
+
+    def __init__(self, max_entries=2048):
+        """
+        Initialize the path cache.
+
+        Args:
+            max_entries: Maximum number of (start, goal) entries kept
+        """
+        self.max_entries = max_entries
+        self._dungeon = None
+        self._map_version = None
+        self._entries = OrderedDict()  # (start, goal, walkable_types, goal_only) -> (path, offset) or None
+        self._walkable = {}  # walkable_types -> walkable mask for the current map_version
+        self.hits = 0
+        self.misses = 0
+        self.budget_exhausted = 0
+
+    def get_path(self, dungeon, start, goal, walkable_types=WALKABLE_TILE_TYPES, max_nodes=DEFAULT_NODE_BUDGET,
+                 goal_only=NO_GOAL_ONLY_TILES):
+        """
+        Get the path from start to goal, searching only on a cache miss.
+
+        Args:
+            dungeon: Dungeon to search
+            start: (x, y) start tile
+            goal: (x, y) goal tile
+            walkable_types: Tile types that may be entered
+            max_nodes: A* node budget for a miss
+            goal_only: frozenset of (x, y) tiles that may only be entered as the goal
+
+        Returns:
+            tuple: Tiles after start up to and including goal (empty if start == goal),
+            or None if no path was found
+        """
+        version = getattr(dungeon, "map_version", 0)
+        if dungeon is not self._dungeon or version != self._map_version:
+            self._entries.clear()
+            self._walkable.clear()
+            self._dungeon = dungeon
+            self._map_version = version
+
+        key = (tuple(start), tuple(goal), walkable_types, goal_only)
+        if key[0] == key[1]:
+            return ()
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            entry = self._entries[key]
+            if entry is None:
+                return None
+            path, offset = entry
+            return path[offset + 1:]
+
+        self.misses += 1
+        walkable = self._walkable.get(walkable_types)
+        if walkable is None:
+            walkable = self._walkable[walkable_types] = walkable_mask(dungeon, walkable_types)
+        path, expanded = find_path(dungeon, start, goal, walkable_types, max_nodes, goal_only, walkable)
+        if path is None:
+            if expanded > max_nodes:
+                # Out of budget: don't remember the failure, the caller may retry later
+                self.budget_exhausted += 1
+            else:
+                self._store(key, None)
+            return None
+
+        for offset, tile in enumerate(path[:-1]):
+            self._store((tile, key[1], walkable_types, goal_only), (path, offset))
+        return path[1:]
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached paths. Counters are kept."""
+        self._dungeon = None
+        self._map_version = None
+        self._entries.clear()
+        self._walkable.clear()
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: entries, hits, misses, budget_exhausted and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "budget_exhausted": self.budget_exhausted,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+# Create a global instance of the path cache
+path_cache = PathCache()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Spatial Index for Blade & Sigil
+This module buckets dungeon entities (monsters, dropped items, chests) by
+the tile they stand on, so "what is on this tile" is a dictionary lookup
+instead of a scan of every entity list, and radius or nearest queries only
+visit the tiles they cover.
+"""
+
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Entity kinds stored in the index
+MONSTER = 'monster'
+ITEM = 'item'
+CHEST = 'chest'
+
+
+class SpatialIndex:
+    """
+    Tile-bucketed index of dungeon entities.
+
+    Buckets map (x, y) tiles to lists of (kind, entity) pairs. Entities are
+    tracked by id() so unhashable ones (dropped items are dicts) work too.
+    """
+
+    def __init__(self):
+        self._buckets = {}  # (x, y) -> [(kind, entity), ...]
+        self._where = {}  # id(entity) -> (x, y)
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, entity):
+        return id(entity) in self._where
+
+    def add(self, entity, kind, tile):
+        """
+        Add an entity at a tile, moving it there if it is already indexed.
+
+        Args:
+            entity: Monster, dropped item dict or chest
+            kind: One of MONSTER, ITEM or CHEST
+            tile: (x, y) tile the entity occupies
+        """
+        if id(entity) in self._where:
+            self.remove(entity)
+        tile = (tile[0], tile[1])
+        self._buckets.setdefault(tile, []).append((kind, entity))
+        self._where[id(entity)] = tile
+
+    def remove(self, entity):
+        """
+        Remove an entity from the index.
+
+        Returns:
+            bool: True if the entity was indexed
+        """
+        tile = self._where.pop(id(entity), None)
+        if tile is None:
+            return False
+        bucket = self._buckets[tile]
+        for i, (_, other) in enumerate(bucket):
+            if other is entity:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._buckets[tile]
+        return True
+
+    def move(self, entity, tile):
+        """
+        Move an indexed entity to a new tile.
+
+        Returns:
+            bool: True if the entity was indexed (and has been moved)
+        """
+        old_tile = self._where.get(id(entity))
+        if old_tile is None:
+            return False
+        tile = (tile[0], tile[1])
+        if tile == old_tile:
+            return True
+        bucket = self._buckets[old_tile]
+        for i, (kind, other) in enumerate(bucket):
+            if other is entity:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._buckets[old_tile]
+        self._buckets.setdefault(tile, []).append((kind, entity))
+        self._where[id(entity)] = tile
+        return True
+
+    def tile_of(self, entity):
+        """Return the (x, y) tile of an indexed entity, or None."""
+        return self._where.get(id(entity))
+
+    def at(self, tile, kind=None):
+        """
+        Get the entities on a tile.
+
+        Args:
+            tile: (x, y) tile
+            kind: Optional kind filter
+
+        Returns:
+            list: Entities on the tile, in insertion order
+        """
+        bucket = self._buckets.get((tile[0], tile[1]))
+        if not bucket:
+            return []
+        return [entity for entity_kind, entity in bucket if kind is None or entity_kind == kind]
+
+    def within_radius(self, tile, radius, kind=None):
+        """
+        Get the entities within a Euclidean tile radius.
+
+        Whichever is smaller is walked: the square of tiles around the
+        centre or the occupied buckets.
+
+        Args:
+            tile: (x, y) centre tile
+            radius: Radius in tiles
+            kind: Optional kind filter
+
+        Returns:
+            list: Entities within the radius
+        """
+        cx, cy = tile[0], tile[1]
+        radius_sq = radius * radius
+        result = []
+        span = int(radius)
+        if (2 * span + 1) ** 2 <= len(self._buckets):
+            for x in range(cx - span, cx + span + 1):
+                for y in range(cy - span, cy + span + 1):
+                    if (x - cx) ** 2 + (y - cy) ** 2 <= radius_sq:
+                        result.extend(self.at((x, y), kind))
+        else:
+            for (x, y), bucket in self._buckets.items():
+                if (x - cx) ** 2 + (y - cy) ** 2 <= radius_sq:
+                    result.extend(entity for entity_kind, entity in bucket
+                                  if kind is None or entity_kind == kind)
+        return result
+
+    def nearest(self, tile, kind=MONSTER, max_radius=None, predicate=None):
+        """
+        Find the nearest entity of a kind by Manhattan distance.
+
+        Args:
+            tile: (x, y) tile to search from
+            kind: Kind of entity to find
+            max_radius: Optional maximum Manhattan distance
+            predicate: Optional callable; entities for which it is false are skipped
+
+        Returns:
+            Entity or None: The nearest match, or None if there is none in range
+        """
+        cx, cy = tile[0], tile[1]
+        if max_radius is not None and 2 * max_radius * (max_radius + 1) + 1 <= len(self._buckets):
+            # Small radius: walk outward ring by ring instead of over every bucket
+            for distance in range(max_radius + 1):
+                for dx in range(-distance, distance + 1):
+                    dy = distance - abs(dx)
+                    for y in {cy - dy, cy + dy}:
+                        for entity in self.at((cx + dx, y), kind):
+                            if predicate is None or predicate(entity):
+                                return entity
+            return None
+
+        best, best_distance = None, None
+        for (x, y), bucket in self._buckets.items():
+            distance = abs(x - cx) + abs(y - cy)
+            if max_radius is not None and distance > max_radius:
+                continue
+            if best_distance is not None and distance >= best_distance:
+                continue
+            for entity_kind, entity in bucket:
+                if entity_kind == kind and (predicate is None or predicate(entity)):
+                    best, best_distance = entity, distance
+                    break
+        return best
+
+    def clear(self):
+        """Remove every entity from the index."""
+        self._buckets.clear()
+        self._where.clear()
@@ -15,6 +15,7 @@ import sys
 from .spell_helpers import *
 from .spell_system import cast_spell as new_cast_spell
 from .effect_manager import effect_manager
+from .text_cache import text_cache
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -93,9 +94,9 @@ def update_spells_dialogue(screen, player, clock):
     dialogue_rect = pygame.Rect(50, 50, 600, 500)  # Larger panel for descriptions and scrolling
     panel_color = (30, 30, 30)
     border_color = (200, 200, 200)
-    title_font = pygame.font.Font(None, 28)
-    font = pygame.font.Font(None, 24)
-    small_font = pygame.font.Font(None, 20)
+    title_font = text_cache.font(None, 28)
+    font = text_cache.font(None, 24)
+    small_font = text_cache.font(None, 20)
     
     selected_spell = None
     waiting = True
@@ -152,7 +153,7 @@ def update_spells_dialogue(screen, player, clock):
         pygame.draw.rect(screen, border_color, dialogue_rect, 2)
         
         # Header text
-        header = title_font.render(f"Available Spells ({player.spell_points}/{player.calculate_spell_points()} SP)", True, (255, 255, 255))
+        header = text_cache.render(title_font, f"Available Spells ({player.spell_points}/{player.calculate_spell_points()} SP)", (255, 255, 255))
         screen.blit(header, (dialogue_rect.x + 10, dialogue_rect.y + 10))
         
         # Draw level separators and spells
@@ -170,7 +171,7 @@ def update_spells_dialogue(screen, player, clock):
             if spell_level != current_level:
                 current_level = spell_level
                 level_text = f"--- Level {current_level} Spells ---"
-                level_surface = font.render(level_text, True, (200, 200, 100))
+                level_surface = text_cache.render(font, level_text, (200, 200, 100))
                 screen.blit(level_surface, (dialogue_rect.x + (dialogue_rect.width - level_surface.get_width()) // 2, y_offset))
                 y_offset += 25
             
@@ -197,7 +198,7 @@ def update_spells_dialogue(screen, player, clock):
                 
             color = (255, 255, 255) if player.spell_points >= spell_cost else (150, 150, 150)
             
-            text_surface = font.render(spell_text, True, color)
+            text_surface = text_cache.render(font, spell_text, color)
             screen.blit(text_surface, (dialogue_rect.x + 20, y_offset))
             
             # Add spell type indicator
@@ -208,7 +209,7 @@ def update_spells_dialogue(screen, player, clock):
                 "Utility": (255, 255, 100)    # Yellow for utility
             }
             type_color = type_colors.get(spell_type, (200, 200, 200))
-            type_text = small_font.render(spell_type, True, type_color)
+            type_text = text_cache.render(small_font, spell_type, type_color)
             screen.blit(type_text, (dialogue_rect.x + dialogue_rect.width - 120, y_offset))
             
             y_offset += 30
@@ -263,7 +264,7 @@ def update_spells_dialogue(screen, player, clock):
             
             # Draw description with simple word wrap
             for i, line in enumerate(lines[:2]):  # Show max 2 lines
-                desc_text = small_font.render(line, True, (200, 200, 200))
+                desc_text = text_cache.render(small_font, line, (200, 200, 200))
                 screen.blit(desc_text, (dialogue_rect.x + 20, detail_y + i * 20))
             
             detail_y += max(1, len(lines)) * 20 + 5
@@ -274,23 +275,23 @@ def update_spells_dialogue(screen, player, clock):
             targets = spell.get("targets", "Unknown")
             
             targeting_text = f"Type: {effect_type} | Range: {range_type} | Targets: {targets}"
-            target_surface = small_font.render(targeting_text, True, (180, 180, 180))
+            target_surface = text_cache.render(small_font, targeting_text, (180, 180, 180))
             screen.blit(target_surface, (dialogue_rect.x + 20, detail_y))
             detail_y += 20
             
             # Damage/healing info if applicable
             if "damage_dice" in spell:
                 damage_text = f"Damage: {spell.get('damage_dice')}"
-                damage_surface = small_font.render(damage_text, True, (255, 150, 150))
+                damage_surface = text_cache.render(small_font, damage_text, (255, 150, 150))
                 screen.blit(damage_surface, (dialogue_rect.x + 20, detail_y))
             elif "healing_dice" in spell:
                 healing_text = f"Healing: {spell.get('healing_dice')}"
-                healing_surface = small_font.render(healing_text, True, (150, 255, 150))
+                healing_surface = text_cache.render(small_font, healing_text, (150, 255, 150))
                 screen.blit(healing_surface, (dialogue_rect.x + 20, detail_y))
         
         # Draw instructions
-        instructions = small_font.render("↑↓: Navigate | Enter: Select | PgUp/PgDn: Scroll | Esc: Cancel", 
-                                      True, (180, 180, 180))
+        instructions = text_cache.render(small_font, "↑↓: Navigate | Enter: Select | PgUp/PgDn: Scroll | Esc: Cancel",
+                                         (180, 180, 180))
         screen.blit(instructions, (dialogue_rect.x + 20, dialogue_rect.y + dialogue_rect.height - 25))
         
         pygame.display.flip()
@@ -10,9 +10,20 @@ calculating line of sight, and handling area of effect targeting.
 import logging
 import math
 
+from .fov import FOVCache
+from .spatial_index import MONSTER
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Line of sight fields are computed with a radius rounded up to a multiple of
+# this, so queries at nearby distances from the same tile share a cache entry
+LOS_RADIUS_STEP = 4
+
+# Line of sight keeps its own FOV cache, so monster and spell queries do not
+# evict the player's field of view or skew its hit rate
+los_cache = FOVCache(max_entries=64)
+
 # Target selection modes
 class TargetMode:
     SINGLE = "single"       # Target a single character/monster
@@ -156,6 +167,11 @@ class TargetingSystem:
         """
         Check if there's a clear line of sight between source and target.
         
+        Walks a single Bresenham ray over the dungeon's opacity bitmap, so the
+        cost follows the length of the ray. The ray is always traced from the
+        lower of the two tiles, so swapping source and target gives the same
+        answer.
+        
         Args:
             source: Source character or position
             target: Target character or position
@@ -183,44 +199,73 @@ class TargetingSystem:
         if self.are_adjacent(source_tile, target_tile):
             return True
         
-        # Use Bresenham's algorithm to trace line of sight
-        cells = self.bresenham_line(source_tile[0], source_tile[1], target_tile[0], target_tile[1])
+        # Trace from the lower tile so the ray (and the answer) is symmetric
+        (x0, y0), (x1, y1) = sorted((source_tile, target_tile))
         
-        # Check if the cells list is empty or has only source/target
-        if len(cells) <= 2:
-            return True
+        # Walls and closed doors are read from the dungeon's packed opacity bitmap
+        width, height = self.dungeon.width, self.dungeon.height
+        opacity = self.dungeon.opacity
         
-        # Skip the first cell (source) and check all intermediate cells
-        for x, y in cells[1:-1]:  # Skip source and target
-            # Check if cell is out of bounds
-            if x < 0 or y < 0 or x >= self.dungeon.width or y >= self.dungeon.height:
+        # Bresenham's algorithm, checking every cell between the two ends
+        dx = abs(x1 - x0)
+        dy = abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx - dy
+        while True:
+            e2 = 2 * err
+            if e2 > -dy:
+                err -= dy
+                x0 += sx
+            if e2 < dx:
+                err += dx
+                y0 += sy
+            if x0 == x1 and y0 == y1:
+                return True
+            if x0 < 0 or y0 < 0 or x0 >= width or y0 >= height:
                 return False  # Out of bounds
-            
-            # Check if the tile exists in the dungeon
-            if x >= len(self.dungeon.tiles) or y >= len(self.dungeon.tiles[x]):
+            if opacity[x0 * height + y0]:
                 return False
-            
-            tile = self.dungeon.tiles[x][y]
-            
-            # Check if tile is a wall (always blocks LOS)
-            if hasattr(tile, 'type') and tile.type == 'wall':
-                return False
-            
-            # Check if tile is a door
-            if hasattr(tile, 'type') and tile.type == 'door':
-                # Check all doors to find if this one is open
-                door_is_open = False
-                for coord, door in self.dungeon.doors.items():
-                    if coord == (x, y):
-                        door_is_open = door.open
-                        break
-                
-                # Closed doors block line of sight
-                if not door_is_open:
-                    return False
         
-        return True
+    def line_of_sight_many(self, source, targets):
+        """
+        Check line of sight from one source to many targets in a single pass.
+        
+        One symmetric shadowcasting field (see Data/fov.py) is computed around
+        the source, just large enough to reach the farthest target, and each
+        target becomes a set lookup. Adjacent targets always have line of sight.
         
+        Args:
+            source: Source character or position
+            targets: List of target characters or positions
+            
+        Returns:
+            list: One bool per target, in the same order
+        """
+        if not targets:
+            return []
+        if not self.dungeon:
+            return [True] * len(targets)  # Default to true if no dungeon
+        
+        source_tile = self.pixel_to_tile(self.get_position(source))
+        target_tiles = [self.pixel_to_tile(self.get_position(target)) for target in targets]
+        return self._line_of_sight_tiles(source_tile, target_tiles)
+    
+    def _line_of_sight_tiles(self, source_tile, target_tiles):
+        sx, sy = source_tile
+        reach_sq = max((tx - sx) ** 2 + (ty - sy) ** 2 for tx, ty in target_tiles)
+        radius = math.isqrt(reach_sq)
+        if radius * radius < reach_sq:
+            radius += 1
+        # Visibility of a tile only depends on nearer rows, so a larger field gives the same answers
+        radius = -(-radius // LOS_RADIUS_STEP) * LOS_RADIUS_STEP
+        
+        visible = los_cache.get_visible(self.dungeon, source_tile, radius)
+        return [
+            abs(tx - sx) <= 1 and abs(ty - sy) <= 1 or (tx, ty) in visible
+            for tx, ty in target_tiles
+        ]
+    
     def are_adjacent(self, tile1, tile2):
         """
         Check if two tiles are adjacent (including diagonals).
@@ -414,9 +459,7 @@ class TargetingSystem:
                     if distance <= area_size:
                         # Check bounds if requested
                         if not check_bounds or (0 <= x < max_x and 0 <= y < max_y):
-                            # Check line of sight if requested
-                            if not check_los or source is None or self.has_los_to_tile(source, (x, y)):
-                                result.append((x, y))
+                            result.append((x, y))
                                 
         elif shape == "diamond":
             # For a diamond (Manhattan distance), get tiles within radius
@@ -429,9 +472,7 @@ class TargetingSystem:
                     if distance <= area_size:
                         # Check bounds if requested
                         if not check_bounds or (0 <= x < max_x and 0 <= y < max_y):
-                            # Check line of sight if requested
-                            if not check_los or source is None or self.has_los_to_tile(source, (x, y)):
-                                result.append((x, y))
+                            result.append((x, y))
                                 
         elif shape == "square":
             # For a square (Chebyshev distance), get all tiles within the square
@@ -441,9 +482,13 @@ class TargetingSystem:
                     
                     # Check bounds if requested
                     if not check_bounds or (0 <= x < max_x and 0 <= y < max_y):
-                        # Check line of sight if requested
-                        if not check_los or source is None or self.has_los_to_tile(source, (x, y)):
-                            result.append((x, y))
+                        result.append((x, y))
+        
+        # Check line of sight if requested, for all tiles in one batched query
+        if check_los and source is not None and result and self.dungeon:
+            source_tile = self.pixel_to_tile(self.get_position(source))
+            clear = self._line_of_sight_tiles(source_tile, result)
+            result = [tile for tile, has_los in zip(result, clear) if has_los]
         
         return result
         
@@ -458,24 +503,16 @@ class TargetingSystem:
         Returns:
             bool: True if line of sight exists
         """
-        # Create a dummy target positioned at the center of the target tile
         from common_b_s import TILE_SIZE
         
         # Convert target tile to pixel position (center of tile)
-        target_pos = [
+        target_pos = (
             target_tile[0] * TILE_SIZE + TILE_SIZE // 2,
             target_tile[1] * TILE_SIZE + TILE_SIZE // 2
-        ]
-        
-        # Create a dummy target object
-        class DummyTarget:
-            def __init__(self, pos):
-                self.position = pos
-        
-        dummy_target = DummyTarget(target_pos)
+        )
         
         # Use the existing line of sight function
-        return self.has_line_of_sight(source, dummy_target)
+        return self.has_line_of_sight(source, target_pos)
     
     def get_line_of_effect(self, start, end, width=1):
         """
@@ -683,43 +720,50 @@ def get_area_targets(center, area_size, all_characters=None, shape="circle", cas
     if dungeon:
         targeting_system.set_dungeon(dungeon)
     
-    # Get the area tiles with requested filters
-    source = caster if check_los else None
-    tiles = targeting_system.get_area_of_effect(
+    # Get the area tiles; line of sight is checked per character below
+    tiles = set(targeting_system.get_area_of_effect(
         targeting_system.get_position(center), 
         area_size, 
         shape=shape,
-        check_bounds=True,
-        check_los=check_los,
-        source=source
-    )
+        check_bounds=True
+    ))
+    
+    # Skip dead characters
+    living = [character for character in all_characters if not getattr(character, 'is_dead', False)]
+    
+    # Find all characters within those tiles. Monsters in the dungeon's spatial
+    # index are looked up per area tile; anyone else (caster, player) by position.
+    # Candidates keep the order of all_characters either way.
+    spatial_index = getattr(targeting_system.dungeon, 'spatial_index', None)
+    if spatial_index is not None:
+        in_area = {id(monster) for tile in tiles for monster in spatial_index.at(tile, MONSTER)}
+        candidates = [character for character in living
+                      if id(character) in in_area or (character not in spatial_index and
+                          targeting_system.pixel_to_tile(targeting_system.get_position(character)) in tiles)]
+    else:
+        candidates = [character for character in living
+                      if targeting_system.pixel_to_tile(targeting_system.get_position(character)) in tiles]
     
-    # Find all characters within those tiles
     result = []
-    for character in all_characters:
-        # Skip dead characters
-        if hasattr(character, 'is_dead') and character.is_dead:
-            continue
-            
-        # Get character position
-        pos = targeting_system.get_position(character)
-        tile = targeting_system.pixel_to_tile(pos)
-        
-        # Check if character is in the area
-        if tile in tiles:
-            # Check ally/enemy status if caster is provided
-            if caster is not None:
-                is_ally = targeting_system.is_ally(caster, character)
+    for character in candidates:
+        # Check ally/enemy status if caster is provided
+        if caster is not None:
+            is_ally = targeting_system.is_ally(caster, character)
                 
-                # Skip allies if we're not including them
-                if is_ally and not include_allies:
-                    continue
+            # Skip allies if we're not including them
+            if is_ally and not include_allies:
+                continue
                     
-                # Skip enemies if we're not including them
-                if not is_ally and not include_enemies:
-                    continue
+            # Skip enemies if we're not including them
+            if not is_ally and not include_enemies:
+                continue
             
-            # Character passes all filters, add to result
-            result.append(character)
+        # Character passes all filters, add to result
+        result.append(character)
+    
+    # Check line of sight from the caster to every candidate in one batched query
+    if check_los and caster is not None and result:
+        clear = targeting_system.line_of_sight_many(caster, result)
+        result = [character for character, has_los in zip(result, clear) if has_los]
     
     return result
\ No newline at end of file
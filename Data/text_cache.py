@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Text Cache for Blade & Sigil
+This module caches rendered text so UI code stops calling font.render for
+the same strings every frame. Rendered strings are kept in an LRU cache
+keyed by (font, text, color, antialias). Strings made only of digits and a
+few separators (coordinates, hit points, counters) change often, so they
+get a cache of their own where their churn cannot evict the labels and
+messages that are drawn every frame.
+"""
+
+import logging
+from collections import OrderedDict
+
+import pygame
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Default number of rendered strings kept in the cache
+DEFAULT_MAX_ENTRIES = 1024
+
+# Default number of numeric strings kept in their own cache
+DEFAULT_MAX_NUMERIC_ENTRIES = 2048
+
+# Strings made only of these characters go to the numeric cache
+NUMERIC_CHARACTERS = frozenset("0123456789,.:/+-%() ")
+
+
+class TextCache:
+    """
+    LRU caches of rendered text surfaces, one for general text and one for numeric strings.
+
+    Cached surfaces are shared between callers and must be treated as
+    read-only. The cache is meant for the main thread, where all drawing happens.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_numeric_entries=DEFAULT_MAX_NUMERIC_ENTRIES):
+        """
+        Initialize an empty text cache.
+
+        Args:
+            max_entries: Maximum number of rendered strings kept
+            max_numeric_entries: Maximum number of numeric strings kept
+        """
+        self.max_entries = max_entries
+        self.max_numeric_entries = max_numeric_entries
+        self._entries = OrderedDict()  # (font, text, color, antialias) -> Surface
+        self._numeric = OrderedDict()  # Same, for strings made only of NUMERIC_CHARACTERS
+        self._fonts = {}  # (name, size, bold) -> Font
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, name, size, bold=False):
+        """
+        Get a shared font, loading it on first use.
+
+        Fonts are part of the cache key, so code that draws every frame should
+        use a font from here rather than creating a new one each call.
+
+        Args:
+            name: System font name, or None for pygame's default font
+            size: Font size
+            bold: Whether to use the bold variant
+
+        Returns:
+            pygame.font.Font: The shared font
+        """
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+            else:
+                font = pygame.font.SysFont(name, size, bold=bold)
+            self._fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Render a string, or return the cached surface for it.
+
+        Args:
+            font: pygame.font.Font to render with
+            text: String to render (other values are converted with str())
+            color: Text color
+            antialias: Whether to antialias the text
+
+        Returns:
+            pygame.Surface: The shared surface for this string
+        """
+        key = (font, str(text), tuple(color), antialias)
+        numeric = NUMERIC_CHARACTERS.issuperset(key[1])
+        entries = self._numeric if numeric else self._entries
+        surface = entries.get(key)
+        if surface is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(key[1], antialias, color)
+        entries[key] = surface
+        if len(entries) > (self.max_numeric_entries if numeric else self.max_entries):
+            entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def blit(self, surface, font, text, color, position, antialias=True):
+        """
+        Draw a string onto a surface through the cache.
+
+        Args:
+            surface: Surface to draw on
+            font: pygame.font.Font to render with
+            text: String to draw (other values are converted with str())
+            color: Text color
+            position: (x, y) of the top-left corner of the text
+            antialias: Whether to antialias the text
+
+        Returns:
+            pygame.Rect: Area drawn to
+        """
+        return surface.blit(self.render(font, text, color, antialias), position)
+
+    def clear(self):
+        """Drop every cached string (fonts are kept). Counters are kept."""
+        self._entries.clear()
+        self._numeric.clear()
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: entries, numeric_entries, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "numeric_entries": len(self._numeric),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Create a global text cache instance
+text_cache = TextCache()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Tile Grid for Blade & Sigil
+This module stores a dungeon map as flat byte layers (tile type codes and
+discovered/visible flags) plus a small sprite palette, instead of
+one Tile object per cell. Existing code keeps using tiles[x][y].type,
+.sprite and .discovered through lightweight views that read and write the
+layers, while whole-map work (pathfinding masks, opacity, saves, door
+carving) can run over the flat layers directly, with NumPy when available.
+"""
+
+import logging
+from array import array
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Built-in tile types; the position in this tuple is the type code. Other
+# type strings are given new codes per grid the first time they are used.
+TILE_TYPES = ('wall', 'floor', 'corridor', 'door', 'locked_door', 'stair_down', 'stair_up')
+
+
+class TileView:
+    """
+    Tile-compatible view of one cell of a TileGrid.
+
+    Views are created on access and hold no state of their own, so writes
+    such as `tiles[x][y].type = 'floor'` go straight to the grid.
+    """
+
+    __slots__ = ('_grid', '_index', 'x', 'y')
+
+    def __init__(self, grid, x, y):
+        self._grid = grid
+        self._index = x * grid.height + y
+        self.x = x
+        self.y = y
+
+    @property
+    def type(self):
+        return self._grid.type_names[self._grid.types[self._index]]
+
+    @type.setter
+    def type(self, tile_type):
+        self._grid.types[self._index] = self._grid.type_code(tile_type)
+
+    @property
+    def sprite(self):
+        return self._grid.palette[self._grid.sprite_ids[self._index]]
+
+    @sprite.setter
+    def sprite(self, sprite):
+        self._grid.sprite_ids[self._index] = self._grid.sprite_code(sprite)
+
+    @property
+    def discovered(self):
+        return bool(self._grid.discovered[self._index])
+
+    @discovered.setter
+    def discovered(self, value):
+        self._grid.discovered[self._index] = 1 if value else 0
+
+    @property
+    def visible(self):
+        return bool(self._grid.visible[self._index])
+
+    @visible.setter
+    def visible(self, value):
+        self._grid.visible[self._index] = 1 if value else 0
+
+    def __repr__(self):
+        return f"TileView({self.x}, {self.y}, {self.type!r})"
+
+
+class TileColumn:
+    """One column of a TileGrid, indexed by y like the old tiles[x] lists."""
+
+    __slots__ = ('_grid', '_x')
+
+    def __init__(self, grid, x):
+        self._grid = grid
+        self._x = x
+
+    def __len__(self):
+        return self._grid.height
+
+    def __getitem__(self, y):
+        height = self._grid.height
+        if y < 0:
+            y += height
+        if not 0 <= y < height:
+            raise IndexError("tile row index out of range")
+        return TileView(self._grid, self._x, y)
+
+    def __iter__(self):
+        for y in range(self._grid.height):
+            yield TileView(self._grid, self._x, y)
+
+
+class TileGrid:
+    """
+    Compact tile map.
+
+    Every layer is a flat buffer indexed x * height + y:
+        types:       bytearray of type codes (names in type_names)
+        sprite_ids:  array('H') of indices into palette (0 = no sprite)
+        discovered:  bytearray, 1 once the player has seen the tile
+        visible:     bytearray, 1 while the tile is in the player's FOV
+
+    tiles[x][y] returns a TileView, so the grid is a drop-in replacement for
+    the old list of lists of Tile objects.
+    """
+
+    def __init__(self, width, height, fill='wall'):
+        """
+        Initialize a grid with every tile of one type and no sprites.
+
+        Args:
+            width, height: Map size in tiles
+            fill: Tile type for every tile
+        """
+        self.width = width
+        self.height = height
+        self.type_names = list(TILE_TYPES)
+        self._type_codes = {name: code for code, name in enumerate(self.type_names)}
+        self.palette = [None]  # Sprite surfaces; index 0 means no sprite
+        self._palette_codes = {}  # id(surface) -> palette index
+        size = width * height
+        self.types = bytearray([self.type_code(fill)]) * size
+        self.sprite_ids = array('H', [0]) * size
+        self.discovered = bytearray(size)
+        self.visible = bytearray(size)
+        self._columns = [TileColumn(self, x) for x in range(width)]
+
+    def __len__(self):
+        return self.width
+
+    def __getitem__(self, x):
+        return self._columns[x]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def type_code(self, tile_type):
+        """
+        Get the code for a tile type, registering new type strings.
+
+        Raises:
+            ValueError: If more than 256 distinct types are used in one grid
+        """
+        code = self._type_codes.get(tile_type)
+        if code is None:
+            code = len(self.type_names)
+            if code > 255:
+                raise ValueError(f"Too many tile types in one grid; cannot add {tile_type!r}")
+            self.type_names.append(tile_type)
+            self._type_codes[tile_type] = code
+        return code
+
+    def sprite_code(self, sprite):
+        """Get the palette index for a sprite surface, adding it if new."""
+        if sprite is None:
+            return 0
+        code = self._palette_codes.get(id(sprite))
+        if code is None:
+            code = len(self.palette)
+            self.palette.append(sprite)
+            self._palette_codes[id(sprite)] = code
+        return code
+
+    def fill(self, tile_type='wall', sprite=None):
+        """
+        Reset every tile to one type and sprite and clear all flags.
+
+        Args:
+            tile_type: Tile type for every tile
+            sprite: Optional sprite for every tile
+        """
+        size = self.width * self.height
+        self.types[:] = bytearray([self.type_code(tile_type)]) * size
+        self.sprite_ids[:] = array('H', [self.sprite_code(sprite)]) * size
+        self.discovered[:] = bytearray(size)
+        self.visible[:] = bytearray(size)
+
+    def type_at(self, x, y):
+        """Return the type string of tile (x, y)."""
+        return self.type_names[self.types[x * self.height + y]]
+
+    def type_mask(self, tile_types):
+        """
+        Build a flat mask of tiles whose type is one of tile_types.
+
+        Args:
+            tile_types: Iterable of type strings
+
+        Returns:
+            bytearray: 1 where the tile type matches, 0 elsewhere (x * height + y)
+        """
+        table = bytearray(256)
+        for tile_type in tile_types:
+            code = self._type_codes.get(tile_type)
+            if code is not None:
+                table[code] = 1
+        return bytearray(self.types.translate(table))
+
+
+def find_door_candidates(grid):
+    """
+    Find corridor tiles where a door could join a room to a corridor.
+
+    A candidate is an interior (non-border) 'corridor' tile with at least one
+    orthogonal 'floor' neighbour and at least one orthogonal 'corridor'
+    neighbour. Neighbour counts are taken with shifted NumPy masks when NumPy
+    is installed, otherwise over the flat type layer.
+
+    Args:
+        grid: TileGrid to scan
+
+    Returns:
+        list: (x, y) candidates sorted by x, then y
+    """
+    width, height = grid.width, grid.height
+    if width < 3 or height < 3:
+        return []
+    floor = grid.type_mask(('floor',))
+    corridor = grid.type_mask(('corridor',))
+
+    if HAS_NUMPY:
+        floor = np.frombuffer(bytes(floor), dtype=np.uint8).reshape(width, height).astype(bool)
+        corridor = np.frombuffer(bytes(corridor), dtype=np.uint8).reshape(width, height).astype(bool)
+        # Neighbours of the interior tiles: west, east, north, south
+        shifts = ((slice(0, -2), slice(1, -1)), (slice(2, None), slice(1, -1)),
+                  (slice(1, -1), slice(0, -2)), (slice(1, -1), slice(2, None)))
+        floor_near = np.zeros((width - 2, height - 2), dtype=bool)
+        corridor_near = np.zeros((width - 2, height - 2), dtype=bool)
+        for shift in shifts:
+            floor_near |= floor[shift]
+            corridor_near |= corridor[shift]
+        xs, ys = np.nonzero(corridor[1:-1, 1:-1] & floor_near & corridor_near)
+        return [(int(x) + 1, int(y) + 1) for x, y in zip(xs, ys)]
+
+    candidates = []
+    index = corridor.find(1, height)
+    last = (width - 1) * height
+    while 0 <= index < last:
+        y = index % height
+        if 0 < y < height - 1:
+            if (floor[index - 1] or floor[index + 1] or floor[index - height] or floor[index + height]) and \
+                    (corridor[index - 1] or corridor[index + 1] or corridor[index - height] or corridor[index + height]):
+                candidates.append((index // height, y))
+        index = corridor.find(1, index + 1)
+    return candidates
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+FOV Benchmark for Blade & Sigil
+Compares the shadowcasting field of view in Data/fov.py against the previous
+per-tile Bresenham approach (one line-of-sight trace per tile in the radius).
+
+Usage:
+    python benchmark_fov.py [--maps N] [--repeat N] [--radii 2 6 12]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+
+# Run headless; the game modules create a display on import
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import common_b_s
+    from common_b_s import Dungeon, TILE_SIZE
+    from Data.targeting_system import targeting_system
+    from Data.fov import build_opacity_grid, shadowcast_fov
+
+
+class _Viewer:
+    def __init__(self, tile):
+        self.position = [tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2]
+
+
+def bresenham_fov(dungeon, viewer, radius):
+    """The previous compute_fov: a Bresenham line-of-sight check to every tile in the radius."""
+    targeting_system.set_dungeon(dungeon)
+    player_tile = targeting_system.pixel_to_tile(viewer.position)
+    visible_cells = set()
+    for x, y in targeting_system.get_area_of_effect(viewer.position, radius, "circle"):
+        if (x, y) == player_tile:
+            visible_cells.add((x, y))
+            continue
+        tile_position = (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+        if targeting_system.has_line_of_sight(viewer, tile_position):
+            visible_cells.add((x, y))
+    return visible_cells
+
+
+_opacity_grids = {}
+
+
+def shadowcast(dungeon, viewer, radius):
+    """The current compute_fov: symmetric shadowcasting over the opacity grid (built once per map)."""
+    opacity = _opacity_grids.get(id(dungeon))
+    if opacity is None:
+        opacity = _opacity_grids[id(dungeon)] = build_opacity_grid(dungeon)
+    origin = (viewer.position[0] // TILE_SIZE, viewer.position[1] // TILE_SIZE)
+    return shadowcast_fov(opacity, dungeon.width, dungeon.height, origin, radius)
+
+
+def time_fov(fov_function, samples, radius, repeat):
+    """Return the mean time per call in milliseconds and the mean number of visible tiles."""
+    total_cells = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for dungeon, viewer in samples:
+            total_cells += len(fov_function(dungeon, viewer, radius))
+    calls = repeat * len(samples)
+    return (time.perf_counter() - start) * 1000 / calls, total_cells / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FOV implementations")
+    parser.add_argument("--maps", type=int, default=5, help="Number of dungeon maps to sample")
+    parser.add_argument("--viewers", type=int, default=20, help="Viewer positions per map")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over all samples")
+    parser.add_argument("--radii", type=int, nargs="+", default=[2, 6, 12], help="Light radii to test")
+    parser.add_argument("--size", type=int, default=40, help="Map width and height in tiles")
+    args = parser.parse_args()
+
+    random.seed(1234)
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(args.maps):
+            dungeon = Dungeon(args.size, args.size)
+            floor_tiles = [(x, y) for x in range(dungeon.width) for y in range(dungeon.height)
+                           if dungeon.tiles[x][y].type in ('floor', 'corridor')]
+            for tile in random.sample(floor_tiles, min(args.viewers, len(floor_tiles))):
+                samples.append((dungeon, _Viewer(tile)))
+
+    print(f"{len(samples)} viewer positions on {args.maps} maps of {args.size}x{args.size}")
+    dungeons = {id(dungeon): dungeon for dungeon, _ in samples}
+    start = time.perf_counter()
+    for dungeon in dungeons.values():
+        _opacity_grids[id(dungeon)] = build_opacity_grid(dungeon)
+    print(f"Opacity grid build: {(time.perf_counter() - start) * 1000 / len(dungeons):.3f} ms per map (once per map change)")
+    print(f"{'radius':>6}  {'bresenham ms':>12}  {'shadowcast ms':>13}  {'speedup':>7}  {'tiles (old/new)':>15}")
+    for radius in args.radii:
+        old_ms, old_cells = time_fov(bresenham_fov, samples, radius, args.repeat)
+        new_ms, new_cells = time_fov(shadowcast, samples, radius, args.repeat)
+        print(f"{radius:>6}  {old_ms:>12.3f}  {new_ms:>13.3f}  {old_ms / new_ms:>6.1f}x  "
+              f"{old_cells:>7.1f}/{new_cells:<7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Particle Benchmark for Blade & Sigil
+Compares the particle system in Data/particles.py against the previous
+spark drawing (per spark cos/sin, random size and color, and one
+pygame.draw.circle call) at increasing particle counts. Each frame updates
+every particle and draws it onto a playable-area sized surface; reports the
+mean frame time and how many particles fit in a 60 FPS frame budget.
+
+Usage:
+    python benchmark_particles.py [--counts 50 500 2000 5000] [--frames N] [--no-numpy]
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import time
+
+# Run headless; the game modules create a display on import
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import pygame
+    from common_b_s import DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT, DUNGEON_TILE_SIZE
+    from Data import particles
+    from Data.camera import Camera
+
+FRAME_BUDGET_MS = 1000 / 60
+SPARK_COLORS = [(255, 255, 255, 255), (255, 255, 200, 255), (255, 200, 100, 255)]
+
+
+def draw_circle_sparks(surface, center, count, radius):
+    """The previous spark loop: per spark trigonometry, random size and color, and a draw.circle call."""
+    for _ in range(count):
+        angle = random.uniform(0, 6.28)
+        distance = random.uniform(0.1, 1.0) * radius
+        spark_x = int(center[0] + distance * math.cos(angle))
+        spark_y = int(center[1] + distance * math.sin(angle))
+        pygame.draw.circle(surface, random.choice(SPARK_COLORS), (spark_x, spark_y), random.randint(2, 5))
+
+
+def time_frames(frames, step):
+    """Run step() frames times and return the mean milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(frames):
+        step()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the particle system against per-spark draw.circle")
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 500, 2000, 5000], help="Particle counts")
+    parser.add_argument("--frames", type=int, default=120, help="Frames to time per count")
+    parser.add_argument("--no-numpy", action="store_true", help="Use the pure Python particle path")
+    args = parser.parse_args()
+
+    if args.no_numpy:
+        particles.HAS_NUMPY = False
+    surface = pygame.Surface((DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT))
+    camera = Camera(DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT, DUNGEON_TILE_SIZE)
+    center = (DUNGEON_PLAYABLE_AREA_WIDTH // 2, DUNGEON_PLAYABLE_AREA_HEIGHT // 2)
+    radius = min(center)
+
+    print(f"Particle path: {'NumPy' if particles.HAS_NUMPY else 'pure Python'}; "
+          f"60 FPS frame budget {FRAME_BUDGET_MS:.1f} ms")
+    print(f"{'particles':>10} {'draw.circle ms':>15} {'particle system ms':>19}")
+    for count in args.counts:
+        circle_ms = time_frames(args.frames, lambda: draw_circle_sparks(surface, center, count, radius))
+
+        # Long-lived particles so the pool holds count live particles for the whole run
+        system = particles.ParticleSystem(capacity=count, seed=0)
+        system.emit(center, count, **dict(particles.FIREBALL_SPARKS, speed=(5.0, 30.0), life=(60.0, 60.0)))
+
+        def step():
+            system.update(1 / 60)
+            system.draw(surface, camera)
+
+        system_ms = time_frames(args.frames, step)
+        print(f"{count:>10} {circle_ms:>15.2f} {system_ms:>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,17 @@ import debug_system # Import the module itself
 from test_arena import create_test_arena, create_emergency_arena, handle_test_arena_activation, handle_teleport_button_click # Import functions from test_arena.py
 # Import condition system
 from Data.condition_system import condition_manager, ConditionType
+from Data.asset_cache import asset_cache
+from Data.fov import fov_cache
+from Data.pathfinding import path_cache, PLAYER_WALKABLE_TILE_TYPES
+from Data.spatial_index import ITEM
+from Data.dungeon_prefetch import dungeon_prefetcher
+from Data.frame_compositor import FrameCompositor
+from Data.text_cache import text_cache
+from Data.animation import animation_scheduler
+from Data.effect_frames import effect_frames
+from Data.particles import particle_system
+from collections import deque
 
 # Reset condition manager's turn counter at the start of the game
 condition_manager.current_turn = 0
@@ -74,7 +85,7 @@ from common_b_s import (
     
     # UI Drawing functions (if used in dungeon mode)
     draw_text, draw_panel, draw_text_lines, draw_playable_area, draw_right_panel, draw_bottom_panel,
-    handle_scroll_events, draw_attack_prompt, draw_equipment_panel, roll_ability_helper, roll_dice_expression,
+    dungeon_camera, emit_condition_particles, handle_scroll_events, draw_attack_prompt, draw_equipment_panel, roll_ability_helper, roll_dice_expression,
     
     # Helper and utility functions
     add_message, update_message_queue, roll_dice_expression, roll_ability_helper,
@@ -89,14 +100,14 @@ from common_b_s import (
     bresenham, has_line_of_sight, spells_dialogue, cast_spell, 
  
     #Combat
-    draw_attack_prompt, handle_monster_turn, process_monster_death,
+    draw_attack_prompt, handle_monster_turn, process_monster_death, process_monster_turns,
     handle_scroll_events,
     
     # Game Classes
     Character, Tile, Door, Chest, Monster, Dungeon, # Player removed
     
     # Debug console
-    debug_console, MessageCategory, get_memory_usage,
+    debug_console, message_manager, MessageCategory, get_memory_usage,
     process_game_turn, # Added process_game_turn
 )
 from player import Player # Player imported from player.py
@@ -108,8 +119,7 @@ print("Blade & Sigil v5.5 starting up...")
 add_message("Debug system initialized", (200, 200, 255), MessageCategory.DEBUG)
 add_message("Press D to toggle debug console", (255, 255, 0), MessageCategory.DEBUG)
 
-# Create spell effect images
-import math
+# Create spell effect images (only generated if the files are missing)
 from common_b_s import create_fireball_image, create_frost_nova_image
 fireball_path = create_fireball_image()
 frost_nova_path = create_frost_nova_image()
@@ -124,52 +134,14 @@ screen = pygame.display.set_mode((DUNGEON_SCREEN_WIDTH, DUNGEON_SCREEN_HEIGHT))
 pygame.display.set_caption("Blade & Sigil v5.5")
 clock = pygame.time.Clock()
 FPS = 60
+IDLE_FPS = 10  # Frame rate once nothing on screen has changed for a moment
 
 # Debug logging setup is now in debug_system.py
 
 # Key diagnostics globals DEBUG_MODE, KEY_DIAGNOSTIC_ENABLED, keys_pressed, key_state
 # are now defined in debug_system.py
 
-# Function to create a fireball explosion image
-def create_fireball_image():
-    """
-    Creates a simple fireball explosion image and saves it to the disk
-    """
-    # Create a new surface with transparency
-    size = 256
-    img = pygame.Surface((size, size), pygame.SRCALPHA)
-    
-    # Define colors for the fireball
-    colors = [
-        (255, 255, 0, 255),   # Bright yellow
-        (255, 200, 0, 225),   # Orange-yellow
-        (255, 150, 0, 200),   # Orange
-        (255, 100, 0, 150),   # Dark orange
-        (255, 50, 0, 100),    # Red-orange
-        (200, 0, 0, 50)       # Red edge (semi-transparent)
-    ]
-    
-    # Draw concentric circles from outside in
-    for i, color in enumerate(reversed(colors)):
-        radius = size // 2 - (i * size // 12)
-        pygame.draw.circle(img, color, (size // 2, size // 2), radius)
-    
-    # Add some small flames/sparks around the edge
-    for _ in range(16):
-        angle = random.random() * 2 * 3.14159  # Random angle
-        distance = size // 2 - random.randint(0, size // 8)  # Random distance from center
-        x = int(size // 2 + math.cos(angle) * distance)
-        y = int(size // 2 + math.sin(angle) * distance)
-        radius = random.randint(5, 15)  # Random spark size
-        color = random.choice(colors[:3])  # Choose from bright colors
-        pygame.draw.circle(img, color, (x, y), radius)
-    
-    # Save the image
-    output_path = "./Fantasy_Game_Art_Assets/Misc/spell_assets/fireball_explosion.png"
-    pygame.image.save(img, output_path)
-    print(f"Created fireball image at {output_path}")
-    return output_path
-
+# Function create_fireball_image is in common_b_s.py (imported above)
 # Function to create the emergency test arena has been moved to test_arena.py
 # Function draw_debug_info is now in debug_system.py
 # Function draw_key_diagnostics is now in debug_system.py
@@ -242,6 +214,86 @@ def combat(player, monster, dungeon_instance):
     return combat_messages
 
 
+# =============================================================================
+# === Player Movement & Click-to-Travel ===
+# =============================================================================
+
+def handle_player_move(player, game_dungeon, dx, dy):
+    """
+    Move the player one tile by (dx, dy) pixels, handling map and level transitions.
+
+    Returns:
+        tuple: (game_dungeon, moved) - the (possibly new) dungeon and whether a turn was taken
+    """
+    move_result = player.move(dx, dy, game_dungeon)
+
+    if len(move_result) == 3:
+        success, transition_type, message = move_result
+        destination_map = None
+    elif len(move_result) == 4:
+        success, transition_type, destination_map, message = move_result
+    else:
+        success, transition_type, message = move_result[0], "", move_result[1]
+        destination_map = None
+
+    if success:
+        process_game_turn(player, game_dungeon)
+
+    player_tile_x = player.position[0] // TILE_SIZE
+    player_tile_y = player.position[1] // TILE_SIZE
+
+    door_obj = game_dungeon.doors.get((player_tile_x, player_tile_y))
+    if door_obj is not None and door_obj.door_type == "map_transition" and hasattr(door_obj, "destination_map"):
+        transition_type = "map_transition"
+        destination_map = door_obj.destination_map
+        message = f"You found a passage to another area! (Map {door_obj.destination_map})"
+
+    if success and transition_type == "map_transition" and destination_map is not None:
+        game_dungeon = handle_dungeon_map_transition(player, game_dungeon, destination_map)
+    elif success and transition_type == "level_transition":
+        game_dungeon = handle_dungeon_level_transition(player, game_dungeon)
+    elif message and message.strip():
+        add_message(message)
+    return game_dungeon, success
+
+
+def plan_travel(player, game_dungeon, goal_tile):
+    """
+    Plan a click-to-travel route to a tile the player has already discovered.
+
+    Returns:
+        deque: Tiles to step through, or None if there is no known route
+    """
+    goal_x, goal_y = goal_tile
+    if not (0 <= goal_x < game_dungeon.width and 0 <= goal_y < game_dungeon.height) or \
+            not getattr(game_dungeon.tiles[goal_x][goal_y], 'discovered', False):
+        add_message("You don't know the way there.")
+        return None
+
+    # Stairs and transition doors are only entered if they are the destination
+    start_tile = (player.position[0] // TILE_SIZE, player.position[1] // TILE_SIZE)
+    path = path_cache.get_path(game_dungeon, start_tile, goal_tile, PLAYER_WALKABLE_TILE_TYPES,
+                               goal_only=game_dungeon.transition_tiles())
+    if not path:
+        if start_tile != tuple(goal_tile):
+            add_message("There is no path there.")
+        return None
+    return deque(path)
+
+
+def nearest_visible_hostile(player, game_dungeon):
+    """Return the nearest living monster inside the player's current field of view, or None."""
+    light_radius = getattr(player, "light_radius", 2)
+    visible = compute_fov(game_dungeon, player, light_radius)
+    player_tile = (player.position[0] // TILE_SIZE, player.position[1] // TILE_SIZE)
+    return game_dungeon.nearest_hostile(player_tile, visible=visible)
+
+
+def hostile_in_view(player, game_dungeon):
+    """Return True if a living monster is inside the player's current field of view."""
+    return nearest_visible_hostile(player, game_dungeon) is not None
+
+
 # Removed Character Creation & Selection Functions as they are now in character_creation_ui.py
 
 # In[ ]:
@@ -254,7 +306,8 @@ from game_state_manager import (
     show_title_screen, save_game, load_game,
     initialize_game_after_title, transition_to_hub, transition_from_hub_to_dungeon,
     handle_dungeon_level_transition, handle_dungeon_map_transition,
-    handle_test_arena_teleport, set_game_state # Added set_game_state
+    handle_test_arena_teleport, set_game_state, # Added set_game_state
+    prefetch_reachable_dungeons
 )
 
 # === Main Game Loop with Proper Monster Reaction ===
@@ -273,6 +326,7 @@ if __name__ == "__main__":
 
 
     combat_occurred = False
+    combat_target = None  # Monster next to the player when the attack prompt was shown
 
     # Fallback if somehow game_state wasn't set (should be handled by initialize_game_after_title)
     if game_state is None: # Should ideally not be None if initialize_game_after_title is robust
@@ -297,6 +351,26 @@ if __name__ == "__main__":
     print(f"DEBUG: T key handler is enabled")
 
     current_event_for_activation = None # Will be set in the event loop
+    travel_path = None # Queued tiles for click-to-travel, one step per frame
+
+    # Screen layers, bottom to top; each frame only the layers that changed are redrawn and pushed
+    compositor_rects = {
+        "map": pygame.Rect(0, 0, DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT),
+        "teleport_button": pygame.Rect(DUNGEON_SCREEN_WIDTH - 150, 10, 140, 30),
+        "right_panel": pygame.Rect(DUNGEON_PLAYABLE_AREA_WIDTH, 0, DUNGEON_RIGHT_PANEL_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT),
+        "message_log": pygame.Rect(0, DUNGEON_PLAYABLE_AREA_HEIGHT, DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_BOTTOM_PANEL_HEIGHT),
+        "corner": pygame.Rect(DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT,
+                              DUNGEON_RIGHT_PANEL_WIDTH, DUNGEON_BOTTOM_PANEL_HEIGHT),
+        "debug_overlay": pygame.Rect(10, 10, 400, 300),  # draw_debug_info
+        "key_diagnostics": pygame.Rect(DUNGEON_SCREEN_WIDTH - 360, 10, 350, 270),  # draw_key_diagnostics
+        "debug_console": pygame.Rect(DUNGEON_SCREEN_WIDTH - debug_console.width - 10,
+                                     DUNGEON_SCREEN_HEIGHT - debug_console.height - 10,
+                                     debug_console.width, debug_console.height),
+    }
+    compositor = FrameCompositor(fps=FPS, idle_fps=IDLE_FPS)
+    for layer_name, layer_rect in compositor_rects.items():
+        compositor.add_layer(layer_name, layer_rect)
+    frame_ms = 0  # Length of the previous frame, for animating particles
 
     while running:
         key_states = pygame.key.get_pressed()
@@ -320,11 +394,14 @@ if __name__ == "__main__":
                 player, screen, activated_dungeon_instance, new_arena_game_state, new_arena_in_dungeon
             )
             current_event_for_activation = None # Consume the event
+            compositor.invalidate()
 
         if game_state == "hub":
             game_state = set_game_state("hub")
+            prefetch_reachable_dungeons(None)  # Build the first dungeon level while the player is in town
             
             novamagus_hub.run_hub(screen, clock, player)
+            compositor.invalidate()  # The hub drew over the whole screen
 
             if novamagus_hub.transition_to_dungeon:
                 game_dungeon = transition_from_hub_to_dungeon(player, screen, clock)
@@ -342,6 +419,9 @@ if __name__ == "__main__":
         current_event_for_activation = None
         for event in pygame.event.get():
             current_event_for_activation = event
+            if event.type != pygame.MOUSEMOTION:
+                # Input can change anything on screen (moves, turns, dialogs drawn over the map)
+                compositor.invalidate()
 
             if event.type == pygame.QUIT:
                 running = False
@@ -357,6 +437,11 @@ if __name__ == "__main__":
                     )
                     continue
 
+                # Left click inside the map: travel to the clicked tile
+                if (event.button == 1 and game_state == "dungeon" and player_initialized and game_dungeon and
+                        event.pos[0] < DUNGEON_PLAYABLE_AREA_WIDTH and event.pos[1] < DUNGEON_PLAYABLE_AREA_HEIGHT):
+                    travel_path = plan_travel(player, game_dungeon, dungeon_camera.screen_to_tile(event.pos))
+
             elif event.type == pygame.USEREVENT + 1:
                 levelup_sound.play()
                 pygame.time.set_timer(pygame.USEREVENT + 1, 0)
@@ -379,6 +464,7 @@ if __name__ == "__main__":
                 
                 handle_scroll_events(event)
                 moved = False
+                travel_path = None # Any key press interrupts click-to-travel
 
                 if event.key in [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN]:
                     dx, dy = 0, 0
@@ -387,37 +473,7 @@ if __name__ == "__main__":
                     elif event.key == pygame.K_UP: dy = -TILE_SIZE
                     elif event.key == pygame.K_DOWN: dy = TILE_SIZE
 
-                    move_result = player.move(dx, dy, game_dungeon)
-
-                    if len(move_result) == 3:
-                        success, transition_type, message = move_result
-                        destination_map = None
-                    elif len(move_result) == 4:
-                        success, transition_type, destination_map, message = move_result
-                    else:
-                        success, transition_type, message = move_result[0], "", move_result[1]
-                        destination_map = None
-
-                    if success:
-                        process_game_turn(player, game_dungeon)
-
-                    player_tile_x = player.position[0] // TILE_SIZE
-                    player_tile_y = player.position[1] // TILE_SIZE
-
-                    for coords, door_obj in game_dungeon.doors.items(): # Renamed door to door_obj
-                        if (player_tile_x, player_tile_y) == coords:
-                            if door_obj.door_type == "map_transition" and hasattr(door_obj, "destination_map"):
-                                transition_type = "map_transition"
-                                destination_map = door_obj.destination_map
-                                message = f"You found a passage to another area! (Map {door_obj.destination_map})"
-
-                    if success and transition_type == "map_transition" and destination_map is not None:
-                        game_dungeon = handle_dungeon_map_transition(player, game_dungeon, destination_map)
-                    elif success and transition_type == "level_transition":
-                        game_dungeon = handle_dungeon_level_transition(player, game_dungeon)
-                    elif message and message.strip():
-                        add_message(message)
-                    moved = success
+                    game_dungeon, moved = handle_player_move(player, game_dungeon, dx, dy)
 
                 elif event.key == pygame.K_i:
                     current_game_state_before_inventory = game_state
@@ -425,8 +481,8 @@ if __name__ == "__main__":
                     manage_inventory(player, screen, clock, game_dungeon)
                     game_state = set_game_state(current_game_state_before_inventory)
                     
-                elif event.key == pygame.K_y and combat_occurred:
-                    combat_messages = combat(player, game_dungeon.monsters[0], game_dungeon)
+                elif event.key == pygame.K_y and combat_occurred and combat_target is not None:
+                    combat_messages = combat(player, combat_target, game_dungeon)
                     for msg in combat_messages: add_message(msg)
                     combat_occurred = False
                     moved = True
@@ -462,7 +518,11 @@ if __name__ == "__main__":
                             loaded_player, loaded_dungeon_data, loaded_game_state_str, saved_cm_turn = loaded_data
                             player = loaded_player
                             if isinstance(loaded_dungeon_data, dict):
-                                game_dungeon = Dungeon(loaded_dungeon_data.get("width", 20), loaded_dungeon_data.get("height", 15))
+                                game_dungeon = Dungeon(
+                                    loaded_dungeon_data.get("width", 20), loaded_dungeon_data.get("height", 15),
+                                    level=loaded_dungeon_data.get("level", 1), map_number=loaded_dungeon_data.get("map_number", 1),
+                                    max_maps=loaded_dungeon_data.get("max_maps", 1), seed=loaded_dungeon_data.get("seed")
+                                )
                                 add_message("Warning: Simplified dungeon load via F9. Full state may not be restored.", RED)
                                 # Full reconstruction logic from initialize_game_after_title would be needed here for complete F9 load
                             else:
@@ -487,8 +547,7 @@ if __name__ == "__main__":
                                 success, message = door.try_force_open(player)
                                 add_message(message)
                                 if success:
-                                    game_dungeon.tiles[door_x][door_y].type = 'door'
-                                    game_dungeon.tiles[door_x][door_y].sprite = door.sprite
+                                    game_dungeon.set_tile_type(door_x, door_y, 'door', door.sprite)
                                     if door.door_type == "level_transition":
                                         game_dungeon = handle_dungeon_level_transition(player, game_dungeon)
                                     elif door.door_type == "map_transition":
@@ -512,8 +571,7 @@ if __name__ == "__main__":
                                 success, message = door.try_pick_lock(player)
                                 add_message(message)
                                 if success:
-                                    game_dungeon.tiles[door_x][door_y].type = 'door'
-                                    game_dungeon.tiles[door_x][door_y].sprite = door.sprite
+                                    game_dungeon.set_tile_type(door_x, door_y, 'door', door.sprite)
                                     if door.door_type == "level_transition":
                                         game_dungeon = handle_dungeon_level_transition(player, game_dungeon)
                                     elif door.door_type == "map_transition":
@@ -529,7 +587,9 @@ if __name__ == "__main__":
                                 if chest.locked and not chest.open:
                                     success, message = chest.try_pick_lock(player)
                                     add_message(message)
-                                    if success: add_message(f"The chest contains {len(chest.contents)} items and {chest.gold} gold!")
+                                    if success:
+                                        game_dungeon.mark_dirty(chest_x, chest_y)
+                                        add_message(f"The chest contains {len(chest.contents)} items and {chest.gold} gold!")
                                     chest_found = True
                                     moved = True
                                     break
@@ -549,8 +609,7 @@ if __name__ == "__main__":
                                 success, message = door.try_magic_unlock(player)
                                 add_message(message)
                                 if success:
-                                    game_dungeon.tiles[door_x][door_y].type = 'door'
-                                    game_dungeon.tiles[door_x][door_y].sprite = door.sprite
+                                    game_dungeon.set_tile_type(door_x, door_y, 'door', door.sprite)
                                     if door.door_type == "level_transition":
                                         game_dungeon = handle_dungeon_level_transition(player, game_dungeon)
                                     elif door.door_type == "map_transition":
@@ -566,7 +625,9 @@ if __name__ == "__main__":
                                 if chest.locked and not chest.open:
                                     success, message = chest.try_magic_unlock(player)
                                     add_message(message)
-                                    if success: add_message(f"The chest contains {len(chest.contents)} items and {chest.gold} gold!")
+                                    if success:
+                                        game_dungeon.mark_dirty(chest_x, chest_y)
+                                        add_message(f"The chest contains {len(chest.contents)} items and {chest.gold} gold!")
                                     chest_found = True
                                     moved = True
                                     break
@@ -582,57 +643,58 @@ if __name__ == "__main__":
 
                     if selected_spell is None: continue
                     elif selected_spell["name"] in ["Cure Light Wounds", "Light", "Mage Armor", "Wicked Weapon"]: target = player
-                    else: target = game_dungeon.monsters[0] if game_dungeon.monsters else None
+                    else: target = nearest_visible_hostile(player, game_dungeon)
 
                     if target and target.hit_points > 0:
                         spell_messages = cast_spell(player, target, selected_spell["name"], game_dungeon)
                         for msg in spell_messages: add_message(msg)
                         moved = True
                         process_game_turn(player, game_dungeon)
-                
-                    if moved: # Monster turn processing after spell
-                        for monster in game_dungeon.monsters:
-                            if monster.hit_points > 0 or getattr(monster, 'pending_death_from_dot', False):
-                                handle_monster_turn(monster, player, game_dungeon)
-                                if getattr(monster, 'pending_death_from_dot', False) and monster.hit_points <= 0:
-                                    death_messages = process_monster_death(monster, player, game_dungeon)
-                                    if death_messages:
-                                        for msg in death_messages: add_message(msg)
-                                    if hasattr(monster, 'pending_death_from_dot'): delattr(monster, 'pending_death_from_dot')
 
                 elif event.key == pygame.K_a and player.char_class == "Archer":
-                    if game_dungeon.monsters and game_dungeon.monsters[0].hit_points > 0:
-                        spell_messages = cast_spell(player, game_dungeon.monsters[0], "Arrow Shot", game_dungeon)
+                    archer_target = nearest_visible_hostile(player, game_dungeon)
+                    if archer_target is not None:
+                        spell_messages = cast_spell(player, archer_target, "Arrow Shot", game_dungeon)
                         for msg in spell_messages: add_message(msg)
                         moved = True
                         process_game_turn(player, game_dungeon)
 
                 if moved: # General monster turn processing if player action caused a turn
-                    for monster in game_dungeon.monsters:
-                        if monster.hit_points > 0 or getattr(monster, 'pending_death_from_dot', False):
-                            handle_monster_turn(monster, player, game_dungeon)
-                            if getattr(monster, 'pending_death_from_dot', False) and monster.hit_points <= 0:
-                                death_messages = process_monster_death(monster, player, game_dungeon)
-                                if death_messages:
-                                    for msg in death_messages: add_message(msg)
-                                if hasattr(monster, 'pending_death_from_dot'): delattr(monster, 'pending_death_from_dot')
-
-        # === DRAW GAME STATE ===
-        screen.fill(BLACK)
-        if player_initialized and game_dungeon:
-            draw_playable_area(screen, game_dungeon, player)
+                    process_monster_turns(player, game_dungeon)
+
+        # === CLICK-TO-TRAVEL: take one queued step per frame ===
+        if travel_path and game_state == "dungeon" and player_initialized and game_dungeon:
+            player_tile_x = player.position[0] // TILE_SIZE
+            player_tile_y = player.position[1] // TILE_SIZE
+            next_x, next_y = travel_path.popleft()
+            compositor.invalidate()
+            if hostile_in_view(player, game_dungeon):
+                add_message("You stop: an enemy is in sight.")
+                travel_path = None
+            elif abs(next_x - player_tile_x) + abs(next_y - player_tile_y) != 1:
+                travel_path = None
+            elif travel_path and game_dungeon.is_transition_tile((next_x, next_y)):
+                # Never leave the level or map partway through a trip
+                travel_path = None
+            else:
+                travel_dungeon = game_dungeon
+                game_dungeon, moved = handle_player_move(
+                    player, game_dungeon, (next_x - player_tile_x) * TILE_SIZE, (next_y - player_tile_y) * TILE_SIZE
+                )
+                if moved:
+                    process_monster_turns(player, game_dungeon)
+                if not moved or game_dungeon is not travel_dungeon:
+                    travel_path = None
 
         # === HANDLE ITEM PICKUPS (Fixed) ===
         if player_initialized and game_dungeon:
             player_tile_x = player.position[0] // TILE_SIZE
             player_tile_y = player.position[1] // TILE_SIZE
 
-            for drop in game_dungeon.dropped_items[:]:
-                drop_tile_x = drop['position'][0] // TILE_SIZE
-                drop_tile_y = drop['position'][1] // TILE_SIZE
-                if player_tile_x == drop_tile_x and player_tile_y == drop_tile_y:
-                    player.pickup_item(drop['item'])
-                    game_dungeon.dropped_items.remove(drop)
+            for drop in game_dungeon.spatial_index.at((player_tile_x, player_tile_y), ITEM):
+                player.pickup_item(drop['item'])
+                game_dungeon.remove_dropped_item(drop)
+                compositor.invalidate()
 
             chest_coords = (player_tile_x, player_tile_y)
             if chest_coords in game_dungeon.chests:
@@ -647,42 +709,17 @@ if __name__ == "__main__":
                         add_message(f"You found {chest.gold} gold in the chest!")
                     chest.contents = []
                     chest.gold = 0
+                    compositor.invalidate()
 
         # === HANDLE MONSTER ATTACK PROMPT ===
-        if player_initialized and game_dungeon and game_dungeon.monsters and game_dungeon.monsters[0].hit_points > 0:
-            monster_tile_x = game_dungeon.monsters[0].position[0] // TILE_SIZE
-            monster_tile_y = game_dungeon.monsters[0].position[1] // TILE_SIZE
+        adjacent_monster = None
+        if player_initialized and game_dungeon:
             player_tile_x = player.position[0] // TILE_SIZE # Ensure player_tile_x is defined here too
             player_tile_y = player.position[1] // TILE_SIZE # Ensure player_tile_y is defined here too
-            if abs(player_tile_x - monster_tile_x) + abs(player_tile_y - monster_tile_y) == 1:
-                draw_attack_prompt(screen, game_dungeon.monsters[0].name)
+            adjacent_monster = game_dungeon.nearest_hostile((player_tile_x, player_tile_y), max_distance=1)
+            if adjacent_monster is not None:
                 combat_occurred = True
-
-        # === DRAW TELEPORT TO ARENA BUTTON (more subtle) ===
-        teleport_button = pygame.Rect(DUNGEON_SCREEN_WIDTH - 150, 10, 140, 30)
-        pygame.draw.rect(screen, (100, 100, 200), teleport_button)
-        pygame.draw.rect(screen, (200, 200, 255), teleport_button, 2)
-        draw_text(screen, "Teleport to Arena", BLACK, DUNGEON_SCREEN_WIDTH - 145, 15)
-
-        # === DRAW UI PANELS ===
-        if player_initialized:
-            draw_right_panel(
-                screen, player, DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT,
-                DUNGEON_RIGHT_PANEL_WIDTH, offset_x=0
-            )
-            draw_bottom_panel(
-                screen, DUNGEON_PLAYABLE_AREA_HEIGHT, DUNGEON_SCREEN_WIDTH,
-                DUNGEON_BOTTOM_PANEL_HEIGHT, offset_y=0
-            )
-            
-        if debug_system.DEBUG_MODE:
-            if player_initialized and game_dungeon:
-                debug_system.draw_debug_info(screen, player, game_dungeon, font)
-        
-        debug_system.draw_key_diagnostics(screen, font, small_font, DUNGEON_SCREEN_WIDTH)
-
-        draw_text(screen, "Press F1 for Test Arena", WHITE,
-                DUNGEON_SCREEN_WIDTH - 200, DUNGEON_SCREEN_HEIGHT - 20)
+                combat_target = adjacent_monster
 
         current_time = pygame.time.get_ticks()
         if current_time - last_debug_update > 5000:
@@ -699,12 +736,102 @@ if __name__ == "__main__":
                     chest_count = len(game_dungeon.chests) if hasattr(game_dungeon, 'chests') else 0
                     add_message(f"Entities: {monster_count} monsters, {item_count} items, {chest_count} chests",
                             (200, 200, 255), MessageCategory.DEBUG)
+                cache_stats = asset_cache.stats()
+                add_message(f"Sprite cache: {cache_stats['entries']} surfaces, {cache_stats['bytes'] // 1024} KB, "
+                            f"hits {cache_stats['hits']}, misses {cache_stats['misses']}, evictions {cache_stats['evictions']}",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                fov_stats = fov_cache.stats()
+                add_message(f"FOV cache: hits {fov_stats['hits']}, misses {fov_stats['misses']} "
+                            f"({fov_stats['hit_rate']:.0%} hit rate)",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                path_stats = path_cache.stats()
+                add_message(f"Path cache: hits {path_stats['hits']}, misses {path_stats['misses']}, "
+                            f"over budget {path_stats['budget_exhausted']}",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                prefetch_stats = dungeon_prefetcher.stats()
+                add_message(f"Dungeon prefetch: ready {prefetch_stats['hits']}, waited {prefetch_stats['waits']}, "
+                            f"generated on the spot {prefetch_stats['misses']}, pending {prefetch_stats['pending']}",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                frame_stats = compositor.stats()
+                add_message(f"Frames: {frame_stats['idle_rate']:.0%} idle, "
+                            f"{frame_stats['pixels_per_frame'] / 1000:.0f}k pixels updated per frame",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                text_stats = text_cache.stats()
+                add_message(f"Text cache: {text_stats['hit_rate']:.0%} hits, {text_stats['entries']} strings, "
+                            f"{text_stats['numeric_entries']} numbers, evicted {text_stats['evictions']}",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                animation_stats = animation_scheduler.stats()
+                add_message(f"Animations: {animation_stats['playing']} playing, {animation_stats['completed']} finished",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                particle_stats = particle_system.stats()
+                add_message(f"Particles: {particle_stats['live']} live, {particle_stats['emitted']} emitted, "
+                            f"{particle_stats['dropped']} dropped{'' if particle_stats['numpy'] else ' (no NumPy)'}",
+                            (200, 200, 255), MessageCategory.DEBUG)
+                frame_cache_stats = effect_frames.stats()
+                add_message(f"Effect frames: {frame_cache_stats['sequences']} baked sequences, "
+                            f"replayed {frame_cache_stats['hits']}, baked {frame_cache_stats['bakes']}",
+                            (200, 200, 255), MessageCategory.DEBUG)
             last_debug_update = current_time
 
-        debug_console.draw(screen)
+        # === DRAW GAME STATE (only the layers that changed) ===
+        if player_initialized and game_dungeon:
+            emit_condition_particles(player, game_dungeon, frame_ms / 1000)
+        particles_playing = particle_system.active
+        particle_system.update(frame_ms / 1000)
+        if animation_scheduler.update() or particles_playing:
+            # Spell effects or particles are playing over the map; keep redrawing it at the full frame rate
+            compositor.invalidate("map")
+        compositor.set_signature("message_log", message_manager.display_signature())
+        compositor.set_signature("debug_console", debug_console.display_signature())
+        compositor.set_signature("key_diagnostics", debug_system.KEY_DIAGNOSTIC_ENABLED and pygame.time.get_ticks() // 50)
+        redraw = compositor.begin_frame()
+
+        if "map" in redraw:
+            screen.fill(BLACK, compositor_rects["map"])
+            if player_initialized and game_dungeon:
+                draw_playable_area(screen, game_dungeon, player)
+                animation_scheduler.draw(screen, dungeon_camera)
+                particle_system.draw(screen, dungeon_camera)
+                if adjacent_monster is not None:
+                    draw_attack_prompt(screen, adjacent_monster.name)
+
+        # === DRAW TELEPORT TO ARENA BUTTON (more subtle) ===
+        if "teleport_button" in redraw:
+            teleport_button = compositor_rects["teleport_button"]
+            pygame.draw.rect(screen, (100, 100, 200), teleport_button)
+            pygame.draw.rect(screen, (200, 200, 255), teleport_button, 2)
+            draw_text(screen, "Teleport to Arena", BLACK, DUNGEON_SCREEN_WIDTH - 145, 15)
+
+        # === DRAW UI PANELS ===
+        if "right_panel" in redraw and player_initialized:
+            draw_right_panel(
+                screen, player, DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT,
+                DUNGEON_RIGHT_PANEL_WIDTH, offset_x=0
+            )
+        if "message_log" in redraw and player_initialized:
+            draw_bottom_panel(
+                screen, DUNGEON_PLAYABLE_AREA_HEIGHT, DUNGEON_SCREEN_WIDTH,
+                DUNGEON_BOTTOM_PANEL_HEIGHT, offset_y=0
+            )
+        if "corner" in redraw:
+            screen.fill(BLACK, compositor_rects["corner"])
+            draw_text(screen, "Press F1 for Test Arena", WHITE,
+                    DUNGEON_SCREEN_WIDTH - 200, DUNGEON_SCREEN_HEIGHT - 20)
+
+        if "debug_overlay" in redraw and debug_system.DEBUG_MODE:
+            if player_initialized and game_dungeon:
+                debug_system.draw_debug_info(screen, player, game_dungeon, font)
+
+        if "key_diagnostics" in redraw:
+            debug_system.draw_key_diagnostics(screen, font, small_font, DUNGEON_SCREEN_WIDTH)
+
+        if "debug_console" in redraw:
+            debug_console.draw(screen)
 
-        pygame.display.flip()
+        compositor.present()
+        frame_ms = min(compositor.tick(clock), 100)  # Capped so a long pause doesn't dump a burst of particles
 
+    dungeon_prefetcher.shutdown()
     pygame.quit()
     sys.exit()
 
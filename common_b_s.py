@@ -14,6 +14,18 @@ import random
 import re
 from copy import deepcopy
 from Data.condition_system import condition_manager
+from Data.asset_cache import asset_cache
+from Data.text_cache import text_cache
+from Data.animation import animation_scheduler
+from Data.effect_frames import effect_frames
+from Data.particles import particle_system, FIREBALL_SPARKS, EMBERS
+from Data.fog_of_war import FogOfWar
+from Data.fov import fov_cache, build_opacity_grid, is_opaque
+from Data.pathfinding import flow_field_cache, path_cache, NEIGHBOUR_OFFSETS
+from Data.spatial_index import SpatialIndex, MONSTER, ITEM, CHEST
+from Data.tile_grid import TileGrid, find_door_candidates
+from Data.connectivity import plan_repairs
+from Data.camera import Camera
 from debug_system import DEBUG_MODE # Import DEBUG_MODE
 import debug_system
 
@@ -39,6 +51,10 @@ DOOR_CHANCE = 0.2  # Percentage of eligible corridor tiles that become doors (re
 LOCKED_DOOR_CHANCE = 1.0  # All doors are locked (100%)
 DOOR_DIFFICULTY = 7  # Fixed difficulty for door checks
 
+# Stepping onto these tile types or door types moves the player to another level or map
+TRANSITION_TILE_TYPES = ('stair_down', 'stair_up')
+TRANSITION_DOOR_TYPES = ('level_transition', 'map_transition')
+
 # --- Treasure Chest Configuration ---
 CHEST_DIFFICULTY = 8  # Slightly harder than doors
 CHEST_ITEMS_COUNT = 3  # Number of random items per chest
@@ -91,12 +107,14 @@ font = pygame.font.SysFont('monospace', 15)
 # logging.basicConfig is expected to be called once, now in debug_system.py.
 
 # === Helper Functions ===
-def load_sprite(path):
+def load_sprite(path, size=None, alpha=True):
     """
     Load an image from the given path, convert it for pygame, and scale it to TILE_SIZE.
+    Surfaces come from the shared asset cache, so callers must copy() before drawing on them.
     """
-    sprite = pygame.image.load(path).convert_alpha()
-    return pygame.transform.smoothscale(sprite, (TILE_SIZE, TILE_SIZE))
+    if size is None:
+        size = (TILE_SIZE, TILE_SIZE)
+    return asset_cache.load(path, size, alpha=alpha)
 
 def load_json(file_path):
     """
@@ -114,8 +132,7 @@ def load_json(file_path):
 # =============================================================================
 
 def draw_text(surface, text, color, x, y):
-    text_surface = font.render(str(text), True, color)
-    surface.blit(text_surface, (x, y))
+    text_cache.blit(surface, font, text, color, (x, y))
 
 def draw_panel(screen, rect, fill_color, border_color, border_width=2):
     pygame.draw.rect(screen, fill_color, rect)
@@ -140,52 +157,114 @@ def draw_text_lines(screen, lines, start_x, start_y, line_spacing=4, color=WHITE
     
     return y
 
+# Playable area surface, reused across frames
+_playable_surface = None
+
+# Tiles rendered into a dungeon's static layer beyond each edge of the view
+STATIC_LAYER_MARGIN = 2
+
+# Scrolling view onto the dungeon; follows the player in draw_playable_area
+dungeon_camera = Camera(DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT, DUNGEON_TILE_SIZE)
+
 def draw_playable_area(screen, game_dungeon, player):
-    # Create a surface for the playable area using the dungeon-specific constants.
-    playable_surface = pygame.Surface((DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT))
+    global _playable_surface
+    # Reuse one surface for the playable area using the dungeon-specific constants.
+    if _playable_surface is None:
+        _playable_surface = pygame.Surface((DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT))
+    playable_surface = _playable_surface
     playable_surface.fill(BLACK)
+    camera = dungeon_camera
+    camera.follow(player.position, game_dungeon.width * DUNGEON_TILE_SIZE, game_dungeon.height * DUNGEON_TILE_SIZE)
     
-    # Draw the dungeon.
-    game_dungeon.draw(playable_surface)
+    # Draw the dungeon (only the tiles in view).
+    game_dungeon.draw(playable_surface, camera)
     
     # Draw the player sprite, centering it on the tile.
-    player_pos = (player.position[0] - DUNGEON_TILE_SIZE // 2, player.position[1] - DUNGEON_TILE_SIZE // 2)
-    playable_surface.blit(player.sprite, player_pos)
+    player_x, player_y = camera.world_to_view(player.position)
+    playable_surface.blit(player.sprite, (player_x - DUNGEON_TILE_SIZE // 2, player_y - DUNGEON_TILE_SIZE // 2))
     
-    # Draw any monsters.
-    for monster in game_dungeon.monsters:
-        if monster.position:
-            monster_pos = (monster.position[0] - DUNGEON_TILE_SIZE // 2, monster.position[1] - DUNGEON_TILE_SIZE // 2)
-            playable_surface.blit(monster.sprite, monster_pos)
-    
-    # Compute visible cells based on the player's light radius.
+    # Compute visible cells based on the player's light radius and update the fog.
     light_radius = getattr(player, "light_radius", 2)
     visible = compute_fov(game_dungeon, player, light_radius)
+    fog = game_dungeon.get_fog_of_war()
+    fog.update(visible, game_dungeon.tiles)
+    
+    # Draw any monsters the player can currently see (only the light radius is searched).
+    player_tile = (player.position[0] // DUNGEON_TILE_SIZE, player.position[1] // DUNGEON_TILE_SIZE)
+    for monster in game_dungeon.spatial_index.within_radius(player_tile, light_radius, MONSTER):
+        if game_dungeon.spatial_index.tile_of(monster) not in visible:
+            continue
+        monster_x, monster_y = camera.world_to_view(monster.position)
+        playable_surface.blit(monster.sprite, (monster_x - DUNGEON_TILE_SIZE // 2, monster_y - DUNGEON_TILE_SIZE // 2))
     
-    # Overlay darkness on cells not in the visible set.
-    for x in range(game_dungeon.width):
-        for y in range(game_dungeon.height):
-            if (x, y) not in visible:
-                rect = pygame.Rect(x * DUNGEON_TILE_SIZE, y * DUNGEON_TILE_SIZE, DUNGEON_TILE_SIZE, DUNGEON_TILE_SIZE)
-                darkness = pygame.Surface((DUNGEON_TILE_SIZE, DUNGEON_TILE_SIZE))
-                darkness.fill((0, 0, 0))
-                darkness.set_alpha(240)  # More opacity for complete coverage
-                playable_surface.blit(darkness, rect)
+    # Overlay darkness over the tiles in view (unseen, remembered, visible).
+    fog.draw(playable_surface, area=camera.view_rect)
     
     # Blit the playable area onto the screen and draw a border.
     screen.blit(playable_surface, (0, 0))
     pygame.draw.rect(screen, WHITE, (0, 0, DUNGEON_PLAYABLE_AREA_WIDTH, DUNGEON_PLAYABLE_AREA_HEIGHT), 2)
 
+# Right panel surface and the signature of what it shows, rebuilt only when the signature changes
+_right_panel_cache = {"signature": None, "surface": None}
+
+def _right_panel_signature(player, playable_area_width, panel_height, right_panel_width):
+    """Return the player state shown in the right panel, along with its layout."""
+    jewelry = tuple(
+        (item.name, getattr(item, 'bonus_stat', getattr(item, 'stat_bonus', 'unknown')), getattr(item, 'bonus_value', 1))
+        for item in player.equipment.get("jewelry", [])
+    )
+    equipment = tuple(getattr(player.equipment.get(slot), 'name', None) for slot in ("weapon", "armor", "shield"))
+    return (
+        in_dungeon, playable_area_width, panel_height, right_panel_width,
+        player.name, player.race, player.char_class, player.level,
+        getattr(player, 'dungeon_depth', 1), getattr(player, 'experience', 0),
+        player.get_effective_ac(), player.hit_points, player.max_hit_points, player.spell_points,
+        player.attack_bonus, getattr(player, "wicked_weapon_bonus", 0),
+        player.get_effective_ability("strength"), tuple(player.abilities.items()),
+        equipment, jewelry,
+    )
+
+def emit_condition_particles(player, game_dungeon, dt):
+    """Emit embers from the player and any monster in the player's FOV that is Burning."""
+    from Data.condition_system import ConditionType
+    # Same monsters as draw_playable_area draws: those in the light radius and in the FOV
+    light_radius = getattr(player, "light_radius", 2)
+    visible = compute_fov(game_dungeon, player, light_radius)
+    player_tile = (player.position[0] // TILE_SIZE, player.position[1] // TILE_SIZE)
+    creatures = [player] + [
+        monster for monster in game_dungeon.spatial_index.within_radius(player_tile, light_radius, MONSTER)
+        if monster.hit_points > 0 and game_dungeon.spatial_index.tile_of(monster) in visible
+    ]
+    for creature in creatures:
+        if condition_manager.has_condition(creature, ConditionType.BURNING):
+            # Positions are already tile centres
+            particle_system.emit_rate(creature.position, 25, dt, **EMBERS)
+
 def draw_right_panel(screen, player, playable_area_width, playable_area_height, right_panel_width, offset_x=0):
     # For hub mode, we need to make sure the right panel height goes to the bottom of the screen
     # not just to the top of the bottom panel
     panel_height = playable_area_height
     if not in_dungeon:
         panel_height = HUB_SCREEN_HEIGHT  # Use the full screen height
-    
+
+    # Redraw the panel only when something it shows has changed.
+    signature = _right_panel_signature(player, playable_area_width, panel_height, right_panel_width)
+    if signature != _right_panel_cache["signature"]:
+        panel_surface = _right_panel_cache["surface"]
+        if panel_surface is None or panel_surface.get_size() != (right_panel_width, panel_height):
+            panel_surface = pygame.Surface((right_panel_width, panel_height))
+        _render_right_panel(panel_surface, player, panel_height, right_panel_width)
+        _right_panel_cache["signature"] = signature
+        _right_panel_cache["surface"] = panel_surface
+
     # The right panel starts exactly at the end of the playable area.
-    panel_rect = pygame.Rect(playable_area_width, 0, right_panel_width, panel_height)
-    draw_panel(screen, panel_rect, BLACK, WHITE)
+    screen.blit(_right_panel_cache["surface"], (playable_area_width, 0))
+
+def _render_right_panel(panel_surface, player, panel_height, right_panel_width):
+    """Render the portrait, stats and equipment onto the right panel surface."""
+    # The panel surface sits at the top of the screen, so y positions match screen positions.
+    panel_rect = pygame.Rect(0, 0, right_panel_width, panel_height)
+    draw_panel(panel_surface, panel_rect, BLACK, WHITE)
     
     # Use a margin for inner content.
     x_offset = panel_rect.x + 10
@@ -202,13 +281,12 @@ def draw_right_panel(screen, player, playable_area_width, playable_area_height,
     portrait_percent = 0.35  # Portrait takes 35% of panel height
     portrait_size = min(right_panel_width - 20, int(panel_height * portrait_percent))
     
-    # Draw the character portrait.
+    # Draw the character portrait (decoded and scaled once per class and size).
     if y_offset + portrait_size <= max_y:
         class_lower = player.char_class.lower()  # e.g., "wizard"
         portrait_path = assets_data["sprites"]["heroes"][class_lower]["portrait"]
-        portrait = pygame.image.load(portrait_path).convert_alpha()
-        portrait = pygame.transform.scale(portrait, (portrait_size, portrait_size))
-        screen.blit(portrait, (x_offset, y_offset))
+        portrait = asset_cache.load(portrait_path, (portrait_size, portrait_size), smooth=False)
+        panel_surface.blit(portrait, (x_offset, y_offset))
         y_offset += portrait_size + 10
 
     # Set standard line height
@@ -254,7 +332,7 @@ def draw_right_panel(screen, player, playable_area_width, playable_area_height,
     
     for line in basic_info:
         if y_offset + line_height <= max_y:
-            draw_text(screen, line, WHITE, x_offset, y_offset)
+            draw_text(panel_surface, line, WHITE, x_offset, y_offset)
             y_offset += line_height
 
     # Draw abilities in two columns if there's space
@@ -263,19 +341,19 @@ def draw_right_panel(screen, player, playable_area_width, playable_area_height,
         
         # First row of abilities
         if y_offset + line_height <= max_y:
-            draw_text(screen, f"Str: {player.abilities['strength']}", WHITE, x_offset, y_offset)
-            draw_text(screen, f"Dex: {player.abilities['dexterity']}", WHITE, col2_x, y_offset)
+            draw_text(panel_surface, f"Str: {player.abilities['strength']}", WHITE, x_offset, y_offset)
+            draw_text(panel_surface, f"Dex: {player.abilities['dexterity']}", WHITE, col2_x, y_offset)
             y_offset += line_height
             
         # Second row of abilities    
         if y_offset + line_height <= max_y:
-            draw_text(screen, f"Int: {player.abilities['intelligence']}", WHITE, x_offset, y_offset)
-            draw_text(screen, f"Con: {player.abilities['constitution']}", WHITE, col2_x, y_offset)
+            draw_text(panel_surface, f"Int: {player.abilities['intelligence']}", WHITE, x_offset, y_offset)
+            draw_text(panel_surface, f"Con: {player.abilities['constitution']}", WHITE, col2_x, y_offset)
             y_offset += line_height
             
         # Third row of abilities
         if y_offset + line_height <= max_y:
-            draw_text(screen, f"Wis: {player.abilities['wisdom']}", WHITE, x_offset, y_offset)
+            draw_text(panel_surface, f"Wis: {player.abilities['wisdom']}", WHITE, x_offset, y_offset)
             y_offset += line_height
 
     # Extra margin before equipment panel
@@ -284,7 +362,7 @@ def draw_right_panel(screen, player, playable_area_width, playable_area_height,
         
     # Draw equipment if there's space
     if y_offset < max_y:
-        y_offset = draw_equipment_panel(screen, player, x_offset, y_offset)
+        y_offset = draw_equipment_panel(panel_surface, player, x_offset, y_offset)
     
 def draw_bottom_panel(screen, playable_area_height, screen_width, bottom_panel_height, offset_y=0):
     """
@@ -490,10 +568,6 @@ spells_data = load_json(SPELLS_FILE)
 items_data = load_json(ITEMS_FILE)
 monsters_data = load_json(MONSTERS_FILE) 
 
-def load_sprite(path):
-    sprite = pygame.image.load(path).convert_alpha()
-    return pygame.transform.smoothscale(sprite, (TILE_SIZE, TILE_SIZE))
-
 # Load misc.sprites
 DICE_SPRITE_PATH = assets_data['sprites']['misc']['dice']
 dice_sprite = load_sprite(DICE_SPRITE_PATH)
@@ -1845,6 +1919,12 @@ class DebugConsole:
                 
         return False
         
+    def display_signature(self):
+        """Return a value that changes whenever the console would be drawn differently"""
+        if not self.visible:
+            return False
+        return (len(self.messages), id(self.messages[-1]) if self.messages else None, self.scroll_offset)
+
     def draw(self, screen):
         """Draw the debug console if visible"""
         if not self.visible:
@@ -1861,7 +1941,7 @@ class DebugConsole:
         pygame.draw.rect(console_surface, self.border_color, (0, 0, self.width, self.height), 2)
         
         # Draw title
-        title_text = self.font.render("DEBUG CONSOLE (Press D to hide)", True, self.title_color)
+        title_text = text_cache.render(self.font, "DEBUG CONSOLE (Press D to hide)", self.title_color)
         console_surface.blit(title_text, (10, 5))
         
         # Draw a separator line
@@ -1872,8 +1952,7 @@ class DebugConsole:
         visible_messages = visible_messages[self.scroll_offset:self.scroll_offset+self.max_visible_messages]
         
         for i, msg in enumerate(visible_messages):
-            message_text = self.font.render(msg["text"], True, msg["color"])
-            console_surface.blit(message_text, (10, 30 + i * 15))
+            text_cache.blit(console_surface, self.font, msg["text"], msg["color"], (10, 30 + i * 15))
             
         # Draw scrollbar if needed
         if len(self.messages) > self.max_visible_messages:
@@ -2096,6 +2175,12 @@ class MessageManager:
             
         max_index = min(self.scroll_offset + self.max_visible_messages, len(self.messages))
         return list(self.messages)[self.scroll_offset:max_index]
+
+    def display_signature(self):
+        """Return a value that changes whenever the message log would be drawn differently"""
+        return (len(self.messages), self.scroll_offset, self.scroll_indicator_alpha,
+                tuple((id(message), message["time"], message.get("batch_count", 1))
+                      for message in self.get_visible_messages()))
     
     def handle_scroll(self, event):
         """Handle scrolling through the message history"""
@@ -2340,8 +2425,7 @@ class Monster:
 
         try:
             if self.sprites and self.sprites.get('live') and os.path.exists(self.sprites['live']):
-                self.sprite = pygame.image.load(self.sprites['live']).convert_alpha()
-                self.sprite = pygame.transform.smoothscale(self.sprite, (TILE_SIZE, TILE_SIZE))
+                self.sprite = load_sprite(self.sprites['live'])
             else:
                 fallback_sprites = {
                     'beast': './Fantasy_Game_Art_Assets/Enemies/beast/giant_rat.jpg',
@@ -2351,13 +2435,13 @@ class Monster:
                     'default': './Fantasy_Game_Art_Assets/Enemies/monstrosity/green_slime.jpg'
                 }
                 fallback_path = fallback_sprites.get(self.monster_type, fallback_sprites['default'])
-                self.sprite = pygame.image.load(fallback_path).convert_alpha()
-                self.sprite = pygame.transform.smoothscale(self.sprite, (TILE_SIZE, TILE_SIZE))
+                self.sprite = load_sprite(fallback_path)
         except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading sprite for {self.name}: {e}. Using placeholder.")
             self.sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
             self.sprite.fill(RED)
         self.position = None
+        self.last_seen_player_tile = None  # Where the player was last in sight, for pursuit
 
     def move_towards(self, target, dungeon, is_player=False):
         if self.position is None or target.position is None: return
@@ -2365,6 +2449,20 @@ class Monster:
 
         monster_x, monster_y = self.position[0] // TILE_SIZE, self.position[1] // TILE_SIZE
         target_x, target_y = target.position[0] // TILE_SIZE, target.position[1] // TILE_SIZE
+
+        # Neighbouring tiles already holding a living monster can't be entered
+        blocked = {(monster_x + dx, monster_y + dy) for dx, dy in NEIGHBOUR_OFFSETS
+                   if dungeon.monster_at((monster_x + dx, monster_y + dy)) is not None}
+
+        # Follow the shared flow field toward the target; it routes around walls
+        flow_field = flow_field_cache.get(dungeon, (target_x, target_y))
+        if flow_field.distance(monster_x, monster_y) > 0:
+            step = flow_field.next_step(monster_x, monster_y, blocked)
+            if step is not None and step != (target_x, target_y):
+                dungeon.move_monster(self, step)
+            return
+
+        # Target unreachable over walkable tiles: fall back to a greedy step
         dx = target_x - monster_x
         dy = target_y - monster_y
 
@@ -2387,8 +2485,29 @@ class Monster:
                 if 0 <= monster_x + step_x < dungeon.width and dungeon.tiles[monster_x + step_x][monster_y].type in ('floor', 'corridor', 'door'):
                     new_pos_x = monster_x + step_x
 
-        if new_pos_x != monster_x or new_pos_y != monster_y:
-            self.position = [new_pos_x * TILE_SIZE + TILE_SIZE // 2, new_pos_y * TILE_SIZE + TILE_SIZE // 2]
+        if (new_pos_x != monster_x or new_pos_y != monster_y) and (new_pos_x, new_pos_y) not in blocked:
+            dungeon.move_monster(self, (new_pos_x, new_pos_y))
+
+    def pursue(self, goal_tile, dungeon):
+        """
+        Take one step along an A* path toward a remembered tile (long-range pursuit).
+
+        Returns:
+            bool: True if the monster moved
+        """
+        if self.position is None or not self.can_move: return False
+        monster_tile = (self.position[0] // TILE_SIZE, self.position[1] // TILE_SIZE)
+        path = path_cache.get_path(dungeon, monster_tile, goal_tile)
+        if not path:
+            # Reached the spot or it cannot be reached: give up the chase
+            self.last_seen_player_tile = None
+            return False
+        if dungeon.monster_at(path[0]) is not None:
+            return False  # Another monster is in the way; wait for it to move
+        dungeon.move_monster(self, path[0])
+        if len(path) == 1:
+            self.last_seen_player_tile = None
+        return True
 
     def get_effective_ac(self):
         return self.ac
@@ -2399,8 +2518,7 @@ class Monster:
     def set_dead_sprite(self):
         if 'dead' in self.sprites and self.sprites['dead'] and os.path.exists(self.sprites['dead']):
             try:
-                self.sprite = pygame.image.load(self.sprites['dead']).convert_alpha()
-                self.sprite = pygame.transform.smoothscale(self.sprite, (TILE_SIZE, TILE_SIZE))
+                self.sprite = load_sprite(self.sprites['dead'])
             except (pygame.error, FileNotFoundError): self._tint_sprite_gray()
         else: self._tint_sprite_gray()
 
@@ -2429,23 +2547,40 @@ class Monster:
 
 class Dungeon:
     def __init__(self, width, height, level=1, map_number=1, max_maps=1,
-                 max_rooms=None, min_room_size=None, max_room_size=None):
+                 max_rooms=None, min_room_size=None, max_room_size=None, seed=None, rng=None):
+        # Every generation step draws from self.rng, so the same seed (and size and
+        # level) always produces the same map, chests and monsters. Without a seed
+        # one is drawn from the global random module and recorded for saves.
+        if rng is None:
+            if seed is None:
+                seed = random.randrange(2 ** 32)
+            rng = random.Random(seed)
+        self.seed = seed  # None only when a caller supplied its own rng
+        self.rng = rng
+
         self.width = width
         self.height = height
         self.level = level  # Current dungeon level (increases as player descends)
         self.map_number = map_number  # Current map within this level (1-based)
         self.max_maps = max_maps  # Total number of maps on this level
 
-        # Room generation parameters (can be modified as player progresses)
-        self.max_rooms = max_rooms or (width // 4 + level)  # Default scales with level
+        # Room generation parameters (can be modified as player progresses). max_rooms caps the
+        # number of BSP leaves and max_room_size the room width and height; None leaves them
+        # uncapped, which keeps the maps of existing seeds unchanged.
+        self.max_rooms = max_rooms
         self.min_room_size = min_room_size or 3  # Default minimum room size
-        self.max_room_size = max_room_size or (6 + level // 3)  # Default scales with level
+        self.max_room_size = max_room_size
 
-        self.tiles = [[Tile(x, y, 'wall') for y in range(height)] for x in range(width)]
+        self.tiles = TileGrid(width, height)  # Flat type/flag layers; tiles[x][y] gives a Tile-like view
         self.monsters = []  # List to store spawned monsters
         self.dropped_items = []  # List for item drops
         self.doors = {}  # Dictionary to store door objects keyed by (x,y) coords
         self.chests = {}  # Dictionary to store chest objects keyed by (x,y) coords
+        self.rooms = []  # (x, y, w, h) of every generated room, nearest the top-left first
+        self.corridor_lengths = []  # Length in tiles of each corridor joining two BSP subtrees
+        self.connectivity_repairs = None  # Result of ensure_connectivity() after generation
+        # Tile -> monsters, dropped items and chests; kept in sync by the add/move/remove helpers below
+        self.spatial_index = SpatialIndex()
 
         # --- Special Features ---
         # Transition points
@@ -2455,8 +2590,22 @@ class Dungeon:
         # Debug flag for verbose door reporting
         self._debug_doors_verbose = True
 
+        # Pre-rendered static layer (floor, walls, doors, chests) around the view, built lazily by draw()
+        self._static_layer = None
+        self._static_window = (0, 0, 0, 0)  # (x0, y0, x1, y1) tiles covered by the static layer
+        self._dirty_tiles = set()  # (x, y) tiles to re-render into the static layer
+        self._fog_of_war = None  # Created on first use from the tiles' discovered flags
+
+        # Packed opacity bitmap (1 = blocks sight), indexed x * height + y; built after generation
+        self.opacity = bytearray(width * height)
+        # Bumped whenever a tile or door changes whether it blocks sight (keys the FOV cache)
+        self.opacity_version = 0
+        # Bumped whenever a tile type changes, e.g. a door unlocking (keys the pathfinding caches)
+        self.map_version = 0
+
         # Create the dungeon structure and get starting position
         self.start_position = self.create_rooms_and_corridors()  # Now returns just the start position
+        self.rebuild_opacity()
 
     def place_chest(self, room):
         """Place a treasure chest in a random position within the given room."""
@@ -2466,18 +2615,19 @@ class Dungeon:
         if w <= 2:  # Room too narrow
             chest_x = x + w // 2  # Place in center of width
         else:
-            chest_x = random.randint(x + 1, x + w - 2)  # Avoid edges
+            chest_x = self.rng.randint(x + 1, x + w - 2)  # Avoid edges
 
         if h <= 2:  # Room too short
             chest_y = y + h // 2  # Place in center of height
         else:
-            chest_y = random.randint(y + 1, y + h - 2)  # Avoid edges
+            chest_y = self.rng.randint(y + 1, y + h - 2)  # Avoid edges
 
         # Create a new chest
-        chest = Chest(chest_x, chest_y)
+        chest = Chest(chest_x, chest_y, rng=self.rng)
 
         # Store the chest in our dictionary
         self.chests[(chest_x, chest_y)] = chest
+        self.spatial_index.add(chest, CHEST, (chest_x, chest_y))
 
         print(f"Placed a treasure chest at ({chest_x}, {chest_y}) with {len(chest.contents)} items and {chest.gold} gold")
 
@@ -2487,15 +2637,18 @@ class Dungeon:
         """Create a random room within a rectangular area and return its dimensions."""
         # Generate random room dimensions within the container
         # Ensure we respect min_room_size and don't exceed container
-        room_w = random.randint(self.min_room_size, max(self.min_room_size, w - 2))
-        room_h = random.randint(self.min_room_size, max(self.min_room_size, h - 2))
+        max_w, max_h = w - 2, h - 2
+        if self.max_room_size is not None:
+            max_w, max_h = min(max_w, self.max_room_size), min(max_h, self.max_room_size)
+        room_w = self.rng.randint(self.min_room_size, max(self.min_room_size, max_w))
+        room_h = self.rng.randint(self.min_room_size, max(self.min_room_size, max_h))
 
         # Center the room in the container with some jitter
         max_x_offset = w - room_w
         max_y_offset = h - room_h
 
-        room_x = x + random.randint(0, max(0, max_x_offset))
-        room_y = y + random.randint(0, max(0, max_y_offset))
+        room_x = x + self.rng.randint(0, max(0, max_x_offset))
+        room_y = y + self.rng.randint(0, max(0, max_y_offset))
 
         # Ensure room is within map bounds (accounting for outer walls)
         room_x = max(1, min(room_x, self.width - room_w - 1))
@@ -2509,9 +2662,11 @@ class Dungeon:
 
         return (room_x, room_y, room_w, room_h)
 
-    def _generate_bsp(self, x, y, w, h, depth):
+    def _generate_bsp(self, x, y, w, h, depth, room_budget=None):
         """
         Recursively split the dungeon area using Binary Space Partitioning.
+        room_budget caps the rooms this subtree may create (None for no cap); it is
+        shared between the two halves of each split in proportion to their size.
         Returns a list of rooms created in this subtree.
         """
         # Base case: Stop if max depth reached or area too small
@@ -2525,7 +2680,9 @@ class Dungeon:
         stop_chance = 0.05 * depth
 
         # If we are deep enough or small enough, make a leaf (room)
-        if depth >= 5 or w < min_split_size or h < min_split_size or (depth > 2 and random.random() < stop_chance):
+        if depth >= 5 or w < min_split_size or h < min_split_size or (depth > 2 and self.rng.random() < stop_chance):
+            return [self._create_room(x, y, w, h)]
+        if room_budget is not None and room_budget < 2:
             return [self._create_room(x, y, w, h)]
 
         # Determine split direction
@@ -2536,7 +2693,7 @@ class Dungeon:
         elif h > w * 1.25:
             split_horizontally = False
         else:
-            split_horizontally = random.choice([True, False])
+            split_horizontally = self.rng.choice([True, False])
 
         # Perform split
         rooms_left = []
@@ -2550,10 +2707,11 @@ class Dungeon:
             # Define split range (avoid making tiny slivers)
             split_min = int(w * 0.4)
             split_max = int(w * 0.6)
-            split_at = random.randint(split_min, split_max)
+            split_at = self.rng.randint(split_min, split_max)
+            budget_left, budget_right = self._split_room_budget(room_budget, split_at, w)
 
-            rooms_left = self._generate_bsp(x, y, split_at, h, depth + 1)
-            rooms_right = self._generate_bsp(x + split_at, y, w - split_at, h, depth + 1)
+            rooms_left = self._generate_bsp(x, y, split_at, h, depth + 1, budget_left)
+            rooms_right = self._generate_bsp(x + split_at, y, w - split_at, h, depth + 1, budget_right)
         else:
             # Split height (horizontal cut)
             if h < min_split_size: # Cannot split effectively
@@ -2561,16 +2719,17 @@ class Dungeon:
 
             split_min = int(h * 0.4)
             split_max = int(h * 0.6)
-            split_at = random.randint(split_min, split_max)
+            split_at = self.rng.randint(split_min, split_max)
+            budget_left, budget_right = self._split_room_budget(room_budget, split_at, h)
 
-            rooms_left = self._generate_bsp(x, y, w, split_at, depth + 1)
-            rooms_right = self._generate_bsp(x, y + split_at, w, h - split_at, depth + 1)
+            rooms_left = self._generate_bsp(x, y, w, split_at, depth + 1, budget_left)
+            rooms_right = self._generate_bsp(x, y + split_at, w, h - split_at, depth + 1, budget_right)
 
         # Connect the two subtrees
         # We pick one room from left and one from right to connect
         if rooms_left and rooms_right:
-            r1 = random.choice(rooms_left)
-            r2 = random.choice(rooms_right)
+            r1 = self.rng.choice(rooms_left)
+            r2 = self.rng.choice(rooms_right)
 
             # Calculate center points
             c1_x = r1[0] + r1[2] // 2
@@ -2580,7 +2739,8 @@ class Dungeon:
             c2_y = r2[1] + r2[3] // 2
 
             # Carve corridor connecting the two centers
-            if random.choice([True, False]):
+            self.corridor_lengths.append(abs(c2_x - c1_x) + abs(c2_y - c1_y) + 1)
+            if self.rng.choice([True, False]):
                 self._carve_h_corridor(c1_x, c2_x, c1_y)
                 self._carve_v_corridor(c1_y, c2_y, c2_x)
             else:
@@ -2589,6 +2749,14 @@ class Dungeon:
 
         return rooms_left + rooms_right
 
+    @staticmethod
+    def _split_room_budget(room_budget, split_at, length):
+        """Share a BSP room budget between the two halves of a split, at least one room each."""
+        if room_budget is None:
+            return None, None
+        left = min(room_budget - 1, max(1, round(room_budget * split_at / length)))
+        return left, room_budget - left
+
     def place_level_exit(self, room):
         """
         Place a level exit (stairs down) in the center of the specified room.
@@ -2618,11 +2786,12 @@ class Dungeon:
 
     def create_rooms_and_corridors(self):
         # Clear existing tiles to be safe
-        self.tiles = [[Tile(x, y, 'wall') for y in range(self.height)] for x in range(self.width)]
+        self.tiles.fill('wall')
 
         # Use BSP to generate rooms and corridors
         # Start with the full map area (minus 1 tile border)
-        rooms = self._generate_bsp(1, 1, self.width - 2, self.height - 2, 0)
+        self.corridor_lengths = []
+        rooms = self._generate_bsp(1, 1, self.width - 2, self.height - 2, 0, self.max_rooms)
 
         if not rooms:
             # Fallback if BSP fails (shouldn't happen)
@@ -2632,6 +2801,7 @@ class Dungeon:
         # Sort rooms by distance from Top-Left (0,0) to ensure start/end separation
         # We use Euclidean distance squared (x^2 + y^2) for accurate sorting
         rooms.sort(key=lambda r: r[0]**2 + r[1]**2)
+        self.rooms = rooms
 
         start_room = rooms[0]
         end_room = rooms[-1] # Farthest room from start
@@ -2668,7 +2838,7 @@ class Dungeon:
 
             if spawn_rooms:
                 for _ in range(num_monsters):
-                    monster_choice = random.choice(level_appropriate_monsters)
+                    monster_choice = self.rng.choice(level_appropriate_monsters)
                     monster = Monster(
                         name=monster_choice['name'],
                         hit_points=monster_choice['hit_points'],
@@ -2681,13 +2851,13 @@ class Dungeon:
                         level=monster_choice.get('level', 1)
                     )
 
-                    spawn_room = random.choice(spawn_rooms)
+                    spawn_room = self.rng.choice(spawn_rooms)
                     monster_tile_x = spawn_room[0] + (spawn_room[2] // 2)
                     monster_tile_y = spawn_room[1] + (spawn_room[3] // 2)
 
                     # Jitter position slightly in room
-                    jitter_x = random.randint(-1, 1)
-                    jitter_y = random.randint(-1, 1)
+                    jitter_x = self.rng.randint(-1, 1)
+                    jitter_y = self.rng.randint(-1, 1)
 
                     # Ensure jitter keeps inside room bounds
                     mx = max(spawn_room[0], min(spawn_room[0] + spawn_room[2] - 1, monster_tile_x + jitter_x))
@@ -2696,7 +2866,7 @@ class Dungeon:
                     monster.position = [mx * TILE_SIZE + (TILE_SIZE // 2),
                                         my * TILE_SIZE + (TILE_SIZE // 2)]
 
-                    self.monsters.append(monster)
+                    self.add_monster(monster)
 
             print(f"Spawned {len(self.monsters)} monsters.")
         else:
@@ -2707,9 +2877,9 @@ class Dungeon:
         non_starting_rooms = [room for room in rooms if room != start_room]
         if non_starting_rooms:
             # 1-2 chests per level
-            num_chests = random.randint(1, 2)
+            num_chests = self.rng.randint(1, 2)
             for _ in range(num_chests):
-                chest_room = random.choice(non_starting_rooms)
+                chest_room = self.rng.choice(non_starting_rooms)
                 self.place_chest(chest_room)
                 non_starting_rooms.remove(chest_room) # Don't put two chests in same room if possible
                 if not non_starting_rooms:
@@ -2731,14 +2901,70 @@ class Dungeon:
             if transition_door and transition_door.door_type == "map_transition":
                  print(f"DEBUG: Destination map: {transition_door.destination_map}")
 
+        # Make sure the chests and the exit can be reached without picking a lock
+        self.connectivity_repairs = self.ensure_connectivity((start_tile_x, start_tile_y))
+
         return start_position
 
+    def ensure_connectivity(self, start_tile, max_locked_doors=0, max_passes=3):
+        """
+        Verify that every chest and the level exit can be reached from the start and repair the map if not.
+
+        Targets walled off entirely get a corridor carved to them; targets behind
+        more than max_locked_doors locked doors get the doors on their cheapest
+        path unlocked, so classes that cannot open locks are never stuck.
+
+        Args:
+            start_tile: (x, y) tile the player starts on
+            max_locked_doors: Locks a player may have to open to reach a target
+            max_passes: Repair rounds before giving up
+
+        Returns:
+            dict: unlocked (doors unlocked), carved (tiles carved) and ok (all targets reachable)
+        """
+        targets = list(self.chests)
+        targets.extend(self.map_transition_doors)
+        if self.level_transition_door is not None:
+            targets.append((self.level_transition_door.x, self.level_transition_door.y))
+        stairs = self.tiles.type_mask(('stair_down',))
+        index = stairs.find(1)
+        while index >= 0:
+            targets.append(divmod(index, self.height))
+            index = stairs.find(1, index + 1)
+
+        result = {"unlocked": 0, "carved": 0, "ok": False}
+        for _ in range(max_passes):
+            doors_to_unlock, tiles_to_carve = plan_repairs(self.tiles, start_tile, targets, max_locked_doors)
+            if not doors_to_unlock and not tiles_to_carve:
+                result["ok"] = True
+                break
+            for x, y in doors_to_unlock:
+                door = self.doors.get((x, y))
+                if door is not None:
+                    door.locked = False
+                    door.load_sprites()
+                    self.set_tile_type(x, y, 'door', door.sprite)
+                else:
+                    self.set_tile_type(x, y, 'door')
+            floor_sprite = load_sprite(assets_data["sprites"]["tiles"]["floor"])
+            for x, y in tiles_to_carve:
+                self.set_tile_type(x, y, 'corridor', floor_sprite)
+            result["unlocked"] += len(doors_to_unlock)
+            result["carved"] += len(tiles_to_carve)
+
+        if result["unlocked"] or result["carved"]:
+            print(f"Connectivity repair: unlocked {result['unlocked']} doors, carved {result['carved']} tiles")
+        if not result["ok"]:
+            print("Warning: some chests or exits are still unreachable after connectivity repair")
+        return result
+
     def _fallback_generation(self):
         """Fallback to simple generation if BSP fails."""
         # Simple 1 room center
         cx, cy = self.width // 2, self.height // 2
         w, h = 10, 10
         x, y = cx - 5, cy - 5
+        self.rooms = [(x, y, w, h)]
         for i in range(x, x+w):
             for j in range(y, y+h):
                 self.tiles[i][j].type = 'floor'
@@ -2765,6 +2991,7 @@ class Dungeon:
         Remove the specified monster from the dungeon.
         Assumes that the monster is in the self.monsters list.
         """
+        self.spatial_index.remove(monster)
         if monster in self.monsters:
             self.monsters.remove(monster)
             print(f"Monster {monster.name} has been removed from the dungeon.")
@@ -2774,7 +3001,7 @@ class Dungeon:
     def draw_corridor(self, x1, y1, x2, y2):
         # (This method is not used in the grid-based method but kept for reference.)
         if x1 != x2 and y1 != y2:
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 for x_coord in range(min(x1, x2), max(x1, x2) + 1): # Renamed x to x_coord
                     self.tiles[x_coord][y1].type = 'floor'
                 for y_coord in range(min(y1, y2), max(y1, y2) + 1): # Renamed y to y_coord
@@ -2793,86 +3020,328 @@ class Dungeon:
 
     def find_start_position_in_room(self, room):
         x_coord, y_coord, w, h = room # Renamed x,y to x_coord,y_coord
-        start_x = random.randint(x_coord, x_coord + w - 1)
-        start_y = random.randint(y_coord, y_coord + h - 1)
+        start_x = self.rng.randint(x_coord, x_coord + w - 1)
+        start_y = self.rng.randint(y_coord, y_coord + h - 1)
         return [start_x * TILE_SIZE + TILE_SIZE // 2, start_y * TILE_SIZE + TILE_SIZE // 2]
 
     def find_random_position_in_room(self, room):
         x_coord, y_coord, w, h = room # Renamed x,y to x_coord,y_coord
-        return (random.randint(x_coord, x_coord + w - 1), random.randint(y_coord, y_coord + h - 1))
-
-    def draw(self, surface):
-        # Draw the background
-        pygame.draw.rect(surface, LIGHT_GRAY, (0, 0, self.width * TILE_SIZE, self.height * TILE_SIZE))
-
-        # Draw grid lines (optional)
-        for x_coord in range(self.width + 1): # Renamed x to x_coord
-            pygame.draw.line(surface, BLACK, (x_coord * TILE_SIZE, 0), (x_coord * TILE_SIZE, self.height * TILE_SIZE), 1)
-        for y_coord in range(self.height + 1): # Renamed y to y_coord
-            pygame.draw.line(surface, BLACK, (0, y_coord * TILE_SIZE), (self.width * TILE_SIZE, y_coord * TILE_SIZE), 1)
-
-        # Collect door information for debug output
-        door_count = 0
-        transition_door_count = 0
-        door_info = []
-
-        # FIRST PASS: Draw regular tiles
-        for x_coord in range(self.width): # Renamed x to x_coord
-            for y_coord in range(self.height): # Renamed y to y_coord
-                # Handle regular tiles first
-                if self.tiles[x_coord][y_coord].type in ('floor', 'corridor') and self.tiles[x_coord][y_coord].sprite:
-                    surface.blit(self.tiles[x_coord][y_coord].sprite, (x_coord * TILE_SIZE, y_coord * TILE_SIZE))
-                    # Draw grid coordinates on floor tiles for debugging
-                    debug_text = font.render(f"{x_coord},{y_coord}", True, (100, 100, 100))
-                    surface.blit(debug_text, (x_coord * TILE_SIZE + 2, y_coord * TILE_SIZE + 2))
-                elif self.tiles[x_coord][y_coord].type == 'wall':
-                    pygame.draw.rect(surface, BLACK, (x_coord * TILE_SIZE, y_coord * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-
-        # SECOND PASS: Draw doors without special highlighting
-        for x_coord in range(self.width): # Renamed x to x_coord
-            for y_coord in range(self.height): # Renamed y to y_coord
-                # Special handling for doors - draw them in a separate pass
-                if self.tiles[x_coord][y_coord].type in ('door', 'locked_door'):
-                    door_count += 1
-                    current_door_coords = (x_coord, y_coord) # Renamed door_coords to current_door_coords
-
-                    # Just draw the door sprite without any extra highlighting or labels
-                    if current_door_coords in self.doors:
-                        door = self.doors[current_door_coords]
-                        door_sprite = door.sprite
-                        surface.blit(door_sprite, (x_coord * TILE_SIZE, y_coord * TILE_SIZE))
-
-                        # Collect debug info (but don't display it)
-                        door_info.append(f"Door at ({x_coord}, {y_coord}): type={door.door_type}, locked={door.locked}")
-                        if hasattr(door, "destination_map"):
-                            door_info.append(f"  Destination map: {door.destination_map}")
-                            transition_door_count += 1
-                    # Otherwise, use the tile's sprite (fallback)
-                    elif self.tiles[x_coord][y_coord].sprite:
-                        surface.blit(self.tiles[x_coord][y_coord].sprite, (x_coord * TILE_SIZE, y_coord * TILE_SIZE))
-
-        # Print summary of door information (only if we found doors)
-        if door_count > 0:
-            print(f"DEBUG: Found {door_count} doors total, {transition_door_count} are transition doors")
+        return (self.rng.randint(x_coord, x_coord + w - 1), self.rng.randint(y_coord, y_coord + h - 1))
+
+    def add_monster(self, monster):
+        """
+        Add a monster to the dungeon and the spatial index.
+
+        Args:
+            monster: Monster with a pixel position
+        """
+        self.monsters.append(monster)
+        if monster.position is not None:
+            self.spatial_index.add(monster, MONSTER, (monster.position[0] // TILE_SIZE, monster.position[1] // TILE_SIZE))
+
+    def move_monster(self, monster, tile):
+        """
+        Move a monster to the centre of a tile, keeping the spatial index in sync.
+
+        Args:
+            monster: Monster to move
+            tile: (x, y) destination tile
+        """
+        monster.position = [tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2]
+        if not self.spatial_index.move(monster, tile):
+            self.spatial_index.add(monster, MONSTER, tile)
+
+    def add_dropped_item(self, item, position):
+        """
+        Drop an item on the floor.
+
+        Args:
+            item: Item object
+            position: Pixel position [x, y] of the drop
+
+        Returns:
+            dict: The dropped item entry ({'item', 'position'})
+        """
+        drop = {'item': item, 'position': position}
+        self.dropped_items.append(drop)
+        self.spatial_index.add(drop, ITEM, (position[0] // TILE_SIZE, position[1] // TILE_SIZE))
+        return drop
+
+    def remove_dropped_item(self, drop):
+        """Remove a dropped item entry (e.g. after it was picked up)."""
+        self.spatial_index.remove(drop)
+        if drop in self.dropped_items:
+            self.dropped_items.remove(drop)
+
+    def rebuild_spatial_index(self):
+        """Re-index monsters, dropped items and chests after the lists were replaced (load, arenas)."""
+        self.spatial_index.clear()
+        for monster in self.monsters:
+            if monster.position is not None:
+                self.spatial_index.add(monster, MONSTER, (monster.position[0] // TILE_SIZE, monster.position[1] // TILE_SIZE))
+        for drop in self.dropped_items:
+            self.spatial_index.add(drop, ITEM, (drop['position'][0] // TILE_SIZE, drop['position'][1] // TILE_SIZE))
+        for (x, y), chest in self.chests.items():
+            self.spatial_index.add(chest, CHEST, (x, y))
+
+    def is_transition_tile(self, tile):
+        """Return True if stepping onto a tile takes the player to another level or map."""
+        x, y = tile
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        if self.tiles[x][y].type in TRANSITION_TILE_TYPES:
+            return True
+        door = self.doors.get((x, y))
+        return door is not None and door.door_type in TRANSITION_DOOR_TYPES
+
+    def transition_tiles(self):
+        """Return a frozenset of every tile that takes the player to another level or map."""
+        tiles = [(door.x, door.y) for door in self.doors.values() if door.door_type in TRANSITION_DOOR_TYPES]
+        stairs = self.tiles.type_mask(TRANSITION_TILE_TYPES)
+        index = stairs.find(1)
+        while index >= 0:
+            tiles.append(divmod(index, self.height))
+            index = stairs.find(1, index + 1)
+        return frozenset(tiles)
+
+    def monster_at(self, tile):
+        """Return the living monster standing on a tile, or None."""
+        for monster in self.spatial_index.at(tile, MONSTER):
+            if monster.hit_points > 0:
+                return monster
+        return None
+
+    def monsters_within(self, tile, radius):
+        """Return the living monsters within a tile radius of a tile."""
+        return [monster for monster in self.spatial_index.within_radius(tile, radius, MONSTER) if monster.hit_points > 0]
+
+    def nearest_hostile(self, tile, max_distance=None, visible=None):
+        """
+        Find the nearest living monster to a tile.
+
+        Args:
+            tile: (x, y) tile to search from (usually the player's)
+            max_distance: Optional maximum Manhattan distance in tiles
+            visible: Optional set of visible tiles; monsters outside it are ignored
+
+        Returns:
+            Monster or None
+        """
+        def is_candidate(monster):
+            if monster.hit_points <= 0:
+                return False
+            return visible is None or self.spatial_index.tile_of(monster) in visible
+        return self.spatial_index.nearest(tile, MONSTER, max_distance, is_candidate)
+
+    def set_tile_type(self, x, y, tile_type, sprite=None):
+        """
+        Change a tile's type after generation (e.g. a door being opened).
+
+        Bumps map_version, updates the opacity bitmap (bumping opacity_version
+        if sight changed) and marks the tile dirty so the static layer picks up
+        the change.
+
+        Args:
+            x, y: Tile coordinates
+            tile_type: New tile type ('floor', 'wall', 'door', ...)
+            sprite: Optional new sprite for the tile
+        """
+        tile = self.tiles[x][y]
+        tile.type = tile_type
+        if sprite is not None:
+            tile.sprite = sprite
+        self.map_version += 1
+        self.update_opacity(x, y)
+        self.mark_dirty(x, y)
+
+    def update_opacity(self, x, y):
+        """
+        Refresh one tile in the opacity bitmap, e.g. after its door opened or closed.
+
+        Args:
+            x, y: Tile coordinates
+        """
+        value = 1 if is_opaque(self.tiles[x][y].type, self.doors.get((x, y))) else 0
+        index = x * self.height + y
+        if self.opacity[index] != value:
+            self.opacity[index] = value
+            self.opacity_version += 1
+
+    def rebuild_opacity(self):
+        """Rebuild the whole opacity bitmap after tiles were edited in bulk (generation, load, arenas)."""
+        self.opacity = build_opacity_grid(self)
+        self.opacity_version += 1
+        self.map_version += 1
+
+    def mark_dirty(self, x, y):
+        """
+        Flag a tile whose type, door or chest changed so the static layer re-renders it.
+
+        Args:
+            x, y: Tile coordinates
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._dirty_tiles.add((x, y))
+
+    def invalidate_static_layer(self):
+        """Discard the cached static layer and fog after tiles were replaced wholesale (e.g. on load)."""
+        self._static_layer = None
+        self._dirty_tiles.clear()
+        self._fog_of_war = None
+
+    def get_fog_of_war(self):
+        """Return this map's fog-of-war mask, creating it on first use."""
+        if self._fog_of_war is None:
+            self._fog_of_war = FogOfWar(self.width, self.height, TILE_SIZE, self.tiles)
+        return self._fog_of_war
+
+    def _render_static_tile(self, layer, x_coord, y_coord):
+        """Render one tile (background, grid lines, tile, door, chest) into the static layer."""
+        px = (x_coord - self._static_window[0]) * TILE_SIZE
+        py = (y_coord - self._static_window[1]) * TILE_SIZE
+        tile = self.tiles[x_coord][y_coord]
+
+        # Background and the grid lines on this tile's left and top edges
+        pygame.draw.rect(layer, LIGHT_GRAY, (px, py, TILE_SIZE, TILE_SIZE))
+        pygame.draw.line(layer, BLACK, (px, py), (px, py + TILE_SIZE - 1), 1)
+        pygame.draw.line(layer, BLACK, (px, py), (px + TILE_SIZE - 1, py), 1)
+
+        if tile.type in ('floor', 'corridor') and tile.sprite:
+            layer.blit(tile.sprite, (px, py))
+            # Draw grid coordinates on floor tiles for debugging
+            text_cache.blit(layer, font, f"{x_coord},{y_coord}", (100, 100, 100), (px + 2, py + 2))
+        elif tile.type == 'wall':
+            pygame.draw.rect(layer, BLACK, (px, py, TILE_SIZE, TILE_SIZE))
+        elif tile.type in ('door', 'locked_door'):
+            door = self.doors.get((x_coord, y_coord))
+            if door is not None:
+                layer.blit(door.sprite, (px, py))
+            # Otherwise, use the tile's sprite (fallback)
+            elif tile.sprite:
+                layer.blit(tile.sprite, (px, py))
+
+        chest = self.chests.get((x_coord, y_coord))
+        if chest is not None and chest.sprite:
+            layer.blit(chest.sprite, (px, py))
+            # If chest is locked, add a visual indicator
+            if chest.locked and not chest.open:
+                # Draw a gold border around locked chests
+                pygame.draw.rect(layer, (255, 215, 0), (px, py, TILE_SIZE, TILE_SIZE), 2)
+
+    def _build_static_layer(self, window):
+        """
+        Render the tiles in a window into a fresh static layer Surface.
+
+        Args:
+            window: (x0, y0, x1, y1) tile range to cover, x1 and y1 exclusive
+        """
+        first_build = self._static_layer is None
+        x0, y0, x1, y1 = window
+        self._static_window = window
+        layer_width, layer_height = (x1 - x0) * TILE_SIZE, (y1 - y0) * TILE_SIZE
+        layer = pygame.Surface((layer_width + 1, layer_height + 1))
+        layer.fill(BLACK)
+
+        for x_coord in range(x0, x1):
+            for y_coord in range(y0, y1):
+                self._render_static_tile(layer, x_coord, y_coord)
+
+        # Closing grid lines on the right and bottom edges of the window
+        pygame.draw.line(layer, BLACK, (layer_width, 0), (layer_width, layer_height), 1)
+        pygame.draw.line(layer, BLACK, (0, layer_height), (layer_width, layer_height), 1)
+
+        if first_build and self._debug_doors_verbose and self.doors:
+            transition_door_count = sum(1 for door in self.doors.values() if hasattr(door, "destination_map"))
+            print(f"DEBUG: Found {len(self.doors)} doors total, {transition_door_count} are transition doors")
             print("DEBUG: Door details:")
-            for info_line in door_info: # Renamed info to info_line
-                print(f"  {info_line}")
+            for (door_x, door_y), door in self.doors.items():
+                print(f"  Door at ({door_x}, {door_y}): type={door.door_type}, locked={door.locked}")
+                if hasattr(door, "destination_map"):
+                    print(f"    Destination map: {door.destination_map}")
 
-        # Draw treasure chests
-        for (chest_x, chest_y), chest in self.chests.items(): # Renamed x,y to chest_x, chest_y
-            if chest.sprite:
-                surface.blit(chest.sprite, (chest_x * TILE_SIZE, chest_y * TILE_SIZE))
+        self._static_layer = layer
+        self._dirty_tiles.clear()
 
-                # If chest is locked, add a visual indicator
-                if chest.locked and not chest.open:
-                    # Draw a gold border around locked chests
-                    pygame.draw.rect(surface, (255, 215, 0),
-                                    (chest_x * TILE_SIZE, chest_y * TILE_SIZE, TILE_SIZE, TILE_SIZE), 2)
+    def _static_window_for(self, camera):
+        """
+        Tile window the static layer should cover for a camera: the view plus
+        STATIC_LAYER_MARGIN tiles each side, kept at a fixed size and inside the map.
+        """
+        cols = min(self.width, camera.view_width // TILE_SIZE + 2 + 2 * STATIC_LAYER_MARGIN)
+        rows = min(self.height, camera.view_height // TILE_SIZE + 2 + 2 * STATIC_LAYER_MARGIN)
+        x0, y0, _, _ = camera.visible_tiles(self.width, self.height)
+        x0 = max(0, min(x0 - STATIC_LAYER_MARGIN, self.width - cols))
+        y0 = max(0, min(y0 - STATIC_LAYER_MARGIN, self.height - rows))
+        return x0, y0, x0 + cols, y0 + rows
+
+    def _scroll_static_layer(self, window):
+        """
+        Move the static layer to a new window of the same size, shifting the
+        pixels already rendered and rendering only the newly exposed tiles.
+        """
+        old_x0, old_y0, old_x1, old_y1 = self._static_window
+        x0, y0, x1, y1 = window
+        dx, dy = x0 - old_x0, y0 - old_y0
+        if abs(dx) >= x1 - x0 or abs(dy) >= y1 - y0:
+            self._build_static_layer(window)
+            return
+        layer = self._static_layer
+        layer.scroll(-dx * TILE_SIZE, -dy * TILE_SIZE)
+        self._static_window = window
+        for x_coord in range(x0, x1):
+            if old_x0 <= x_coord < old_x1:
+                # Column was already in the layer: only rows that just came into the window
+                for y_coord in range(max(y0, old_y1), y1):
+                    self._render_static_tile(layer, x_coord, y_coord)
+                for y_coord in range(y0, min(y1, old_y0)):
+                    self._render_static_tile(layer, x_coord, y_coord)
+            else:
+                for y_coord in range(y0, y1):
+                    self._render_static_tile(layer, x_coord, y_coord)
+        layer_width, layer_height = (x1 - x0) * TILE_SIZE, (y1 - y0) * TILE_SIZE
+        pygame.draw.line(layer, BLACK, (layer_width, 0), (layer_width, layer_height), 1)
+        pygame.draw.line(layer, BLACK, (0, layer_height), (layer_width, layer_height), 1)
+
+    def draw(self, surface, camera=None):
+        """
+        Draw the static tiles and dropped items in view.
+
+        The static layer covers the view plus STATIC_LAYER_MARGIN tiles (the
+        whole map when it fits). As the camera scrolls, the layer is shifted
+        and only the tiles coming into view are rendered, so the cost follows
+        the view size rather than the map size.
 
-        # Now draw dropped items
+        Args:
+            surface: Playable area surface
+            camera: Camera giving the view; without one the map is drawn from its top-left corner
+        """
+        if camera is None:
+            camera = Camera(surface.get_width(), surface.get_height(), TILE_SIZE)
+        window = self._static_window_for(camera)
+        if self._static_layer is None or \
+                (window[2] - window[0], window[3] - window[1]) != (self._static_window[2] - self._static_window[0],
+                                                                  self._static_window[3] - self._static_window[1]):
+            self._build_static_layer(window)
+        elif window != self._static_window:
+            self._scroll_static_layer(window)
+        if self._dirty_tiles:
+            # Static tiles come from the cached layer; only dirty tiles are re-rendered
+            x0, y0, x1, y1 = self._static_window
+            for x_coord, y_coord in self._dirty_tiles:
+                if x0 <= x_coord < x1 and y0 <= y_coord < y1:
+                    self._render_static_tile(self._static_layer, x_coord, y_coord)
+            self._dirty_tiles.clear()
+        surface.blit(self._static_layer, camera.world_to_view((self._static_window[0] * TILE_SIZE,
+                                                                self._static_window[1] * TILE_SIZE)))
+
+        x0, y0, x1, y1 = camera.visible_tiles(self.width, self.height)
+        # Now draw dropped items that are in view
         for drop in self.dropped_items:
             item_sprite = getattr(drop['item'], 'sprite', loot_drop_sprite)
             item_x, item_y = drop['position'] # Renamed x,y to item_x, item_y
+            if not (x0 <= item_x // TILE_SIZE < x1 and y0 <= item_y // TILE_SIZE < y1):
+                continue
+            item_x, item_y = camera.world_to_view((item_x, item_y))
 
             if item_sprite:
                 # Draw the item sprite centered on its tile
@@ -2954,11 +3423,11 @@ class Dungeon:
         print(f"DEBUG: Total weight: {total_weight}")
 
         if total_weight == 0:
-            chosen_wall = random.choice(['north', 'south', 'east', 'west'])
+            chosen_wall = self.rng.choice(['north', 'south', 'east', 'west'])
             print(f"DEBUG: No valid walls, randomly chose: {chosen_wall}")
         else:
             # Random weighted choice
-            r_val = random.uniform(0, total_weight) # Renamed r to r_val
+            r_val = self.rng.uniform(0, total_weight) # Renamed r to r_val
             upto = 0
             for option, weight in wall_options:
                 if upto + weight >= r_val:
@@ -3037,64 +3506,35 @@ class Dungeon:
         2. Doors must connect a floor (room) to a corridor.
         3. No adjacent doors.
         """
-        # Candidate locations for doors
-        potential_doors = []
-
-        # Check each corridor tile
-        for x in range(1, self.width - 1):
-            for y in range(1, self.height - 1):
-                if self.tiles[x][y].type == 'corridor':
-                    # Check neighbors
-                    neighbors = [
-                        (x, y-1), (x, y+1), (x+1, y), (x-1, y)
-                    ]
-
-                    room_neighbors = 0
-                    corridor_neighbors = 0
-
-                    for nx, ny in neighbors:
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            if self.tiles[nx][ny].type == 'floor':
-                                room_neighbors += 1
-                            elif self.tiles[nx][ny].type == 'corridor':
-                                corridor_neighbors += 1
-
-                    # A valid door spot connects at least one room and one corridor
-                    # And isn't surrounded by floors (which would mean it's inside a room)
-                    if room_neighbors >= 1 and corridor_neighbors >= 1:
-                        potential_doors.append((x, y))
-
-        # Sort candidates to ensure deterministic processing order (optional but good for debugging)
-        potential_doors.sort()
-        random.shuffle(potential_doors) # Shuffle for randomness
-
-        # Place doors, ensuring no adjacency
+        # Candidate locations for doors: corridor tiles with both a floor and a corridor neighbour
+        potential_doors = find_door_candidates(self.tiles)
+
+        # Candidates come back sorted; shuffle for randomness
+        self.rng.shuffle(potential_doors)
+
+        # Place doors, ensuring no adjacency (checked against a flat mask of placed doors)
         placed_doors = set()
+        placed_mask = bytearray(self.width * self.height)
+        height = self.height
 
         for x, y in potential_doors:
-            # Check if placing a door here would be adjacent to an existing door
-            is_adjacent = False
-            neighbors = [
-                (x, y-1), (x, y+1), (x+1, y), (x-1, y)
-            ]
-            for nx, ny in neighbors:
-                if (nx, ny) in placed_doors:
-                    is_adjacent = True
-                    break
+            index = x * height + y
+            if placed_mask[index - 1] or placed_mask[index + 1] or placed_mask[index - height] or placed_mask[index + height]:
+                continue
 
-            if not is_adjacent:
-                # Place the door
-                # Determine if it should be locked (random chance)
-                is_locked = random.random() < LOCKED_DOOR_CHANCE
+            # Place the door
+            # Determine if it should be locked (random chance)
+            is_locked = self.rng.random() < LOCKED_DOOR_CHANCE
 
-                new_door = Door(x, y, locked=is_locked)
-                self.doors[(x, y)] = new_door
+            new_door = Door(x, y, locked=is_locked)
+            self.doors[(x, y)] = new_door
 
-                # Update tile type
-                self.tiles[x][y].type = 'locked_door' if is_locked else 'door'
-                self.tiles[x][y].sprite = new_door.sprite
+            # Update tile type
+            self.tiles[x][y].type = 'locked_door' if is_locked else 'door'
+            self.tiles[x][y].sprite = new_door.sprite
 
-                placed_doors.add((x, y))
+            placed_doors.add((x, y))
+            placed_mask[index] = 1
 
         print(f"Carved {len(placed_doors)} doors.")
 
@@ -3227,7 +3667,7 @@ def display_help_screen(screen, clock):
         pygame.draw.rect(screen, panel_border_color, panel_rect, 3)
         
         # Draw the title
-        title_surface = title_font.render("BLADE & SIGIL HELP", True, title_color)
+        title_surface = text_cache.render(title_font, "BLADE & SIGIL HELP", title_color)
         screen.blit(title_surface, (panel_rect.x + (panel_width - title_surface.get_width()) // 2, panel_rect.y + 20))
         
         # Draw the help content
@@ -3240,8 +3680,7 @@ def display_help_screen(screen, clock):
                 color = text_color
                 
             # Render the line
-            text_surface = help_font.render(line, True, color)
-            screen.blit(text_surface, (panel_rect.x + 30, y))
+            text_cache.blit(screen, help_font, line, color, (panel_rect.x + 30, y))
             y += line_height
         
         # Draw scroll indicators if needed
@@ -3260,7 +3699,7 @@ def display_help_screen(screen, clock):
             ])
         
         # Draw instructions at the bottom
-        instructions = help_font.render("Press ESC to close, PageUp/PageDown to scroll", True, text_color)
+        instructions = text_cache.render(help_font, "Press ESC to close, PageUp/PageDown to scroll", text_color)
         screen.blit(instructions, (panel_rect.x + (panel_width - instructions.get_width()) // 2, 
                                   panel_rect.y + panel_height - 25))
         
@@ -3301,7 +3740,7 @@ def process_monster_death(monster, player, dungeon_instance):
             dropped_item = random.choice(items_list)
             if hasattr(dropped_item, "name"):
                 drop_position = monster.position[:]  # Use the monster's current position
-                dungeon_instance.dropped_items.append({'item': dropped_item, 'position': drop_position})
+                dungeon_instance.add_dropped_item(dropped_item, drop_position)
                 messages.append(f"The {monster.name} dropped a {dropped_item.name}!")
 
     # Calculate and award XP based on monster CR but don't trigger level up
@@ -3323,7 +3762,13 @@ def get_monster_info(monster_name, monsters_data):
             return m
     return None
 
-def handle_monster_turn(monster, player, dungeon):
+def handle_monster_turn(monster, player, dungeon, has_los=None):
+    """
+    Run one monster's turn.
+    
+    has_los may carry a line-of-sight result precomputed by process_monster_turns;
+    when None it is checked here.
+    """
     # Check if the monster was incapacitated at the start of its turn processing
     if getattr(monster, '_was_incapacitated_this_turn', False):
         logging.debug(f"Monster {monster.name} was incapacitated at the start of this turn. Skipping action.")
@@ -3394,9 +3839,15 @@ def handle_monster_turn(monster, player, dungeon):
                 return  # Skip turn due to frost effect
     
     # Check if the monster has a clear line of sight to the player
-    if not has_line_of_sight(monster, player, dungeon):
-        # Optionally, you might implement wandering behavior here
+    if has_los is None:
+        has_los = has_line_of_sight(monster, player, dungeon)
+    if not has_los:
+        # Out of sight: follow an A* path to where the player was last seen, if anywhere
+        last_seen = getattr(monster, 'last_seen_player_tile', None)
+        if last_seen is not None and hasattr(monster, 'pursue'):
+            monster.pursue(last_seen, dungeon)
         return
+    monster.last_seen_player_tile = (player.position[0] // TILE_SIZE, player.position[1] // TILE_SIZE)
 
     monster_tile_x = monster.position[0] // TILE_SIZE
     monster_tile_y = monster.position[1] // TILE_SIZE
@@ -3422,6 +3873,30 @@ def handle_monster_turn(monster, player, dungeon):
         monster.move_towards(player, dungeon)
     logging.debug(f"--- Finished turn for monster: {monster.name} ---")
 
+
+def process_monster_turns(player, dungeon):
+    """
+    Run a turn for every monster that can act (or is pending death from damage over time).
+    
+    Line of sight to the player is answered for all monsters in one batched query;
+    LOS is symmetric, so it is computed once from the player's tile.
+    """
+    active_monsters = [monster for monster in dungeon.monsters
+                       if monster.hit_points > 0 or getattr(monster, 'pending_death_from_dot', False)]
+    if USING_NEW_SPELL_SYSTEM:
+        targeting_system.set_dungeon(dungeon)
+        los_results = targeting_system.line_of_sight_many(player, active_monsters)
+    else:
+        los_results = [None] * len(active_monsters)
+    
+    for monster, has_los in zip(active_monsters, los_results):
+        handle_monster_turn(monster, player, dungeon, has_los)
+        if getattr(monster, 'pending_death_from_dot', False) and monster.hit_points <= 0:
+            death_messages = process_monster_death(monster, player, dungeon)
+            if death_messages:
+                for msg in death_messages: add_message(msg)
+            if hasattr(monster, 'pending_death_from_dot'): delattr(monster, 'pending_death_from_dot')
+
         
 # ability rolls
 def roll_ability_helper():
@@ -3430,10 +3905,11 @@ def roll_ability_helper():
         roll = sum(random.randint(1, 6) for _ in range(3))
     return roll
 
-def roll_dice_expression(dice_str, caster=None):
+def roll_dice_expression(dice_str, caster=None, rng=None):
     """
     Parses a dice string (e.g., "1d6+2" or "1d4+int_modifier") and returns the total.
     If the modifier is not a number, it is assumed to refer to an ability modifier on the caster.
+    Dice are rolled with rng (a random.Random) if given, otherwise the random module.
     """
     # Split the string at 'd'
     parts = dice_str.split("d")
@@ -3462,7 +3938,8 @@ def roll_dice_expression(dice_str, caster=None):
         sides = int(parts[1])
         mod_value = 0
 
-    total = sum(random.randint(1, sides) for _ in range(num_dice)) + mod_value
+    rng = rng or random
+    total = sum(rng.randint(1, sides) for _ in range(num_dice)) + mod_value
     return total
 
 # Equipment rules by class - data-driven system
@@ -3645,51 +4122,12 @@ def compute_fov(dungeon, player, radius):
     """
     Compute the player's field of vision (visible cells).
     
-    This function now uses the targeting system's area of effect function
-    if available, or falls back to the original implementation.
+    Uses symmetric shadowcasting over the dungeon's opacity grid (see Data/fov.py):
+    walls and closed doors block sight, and each tile in the radius is visited once.
+    Results are cached per (player tile, radius, dungeon.opacity_version).
     """
-    if USING_NEW_SPELL_SYSTEM:
-        # Use the new targeting system
-        targeting_system.set_dungeon(dungeon)
-        
-        # Get all tiles in a circle around the player
-        center = player.position
-        area_tiles = targeting_system.get_area_of_effect(center, radius, "circle")
-        
-        # Filter to visible tiles (with line of sight)
-        visible_cells = set()
-        for x, y in area_tiles:
-            # Ensure the player's own tile is always visible
-            player_tile = targeting_system.pixel_to_tile(player.position)
-            if (x, y) == player_tile:
-                visible_cells.add((x, y))
-                continue
-                
-            # Create a position for this tile
-            tile_position = (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
-            
-            # Check line of sight
-            if targeting_system.has_line_of_sight(player, tile_position):
-                visible_cells.add((x, y))
-                
-        return visible_cells
-    
-    # Fall back to the original implementation
-    visible_cells = set()
-    player_tile_x = player.position[0] // TILE_SIZE
-    player_tile_y = player.position[1] // TILE_SIZE
-    for x in range(max(0, player_tile_x - radius), min(dungeon.width, player_tile_x + radius + 1)):
-        for y in range(max(0, player_tile_y - radius), min(dungeon.height, player_tile_y + radius + 1)):
-            if (x - player_tile_x) ** 2 + (y - player_tile_y) ** 2 <= radius ** 2:
-                # Ensure the player's own tile is always visible.
-                if (x, y) == (player_tile_x, player_tile_y):
-                    visible_cells.add((x, y))
-                else:
-                    target_dummy = type('Dummy', (), {})()
-                    target_dummy.position = [x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2]
-                    if has_line_of_sight(player, target_dummy, dungeon, required_clear=1):
-                        visible_cells.add((x, y))
-    return visible_cells
+    player_tile = (player.position[0] // TILE_SIZE, player.position[1] // TILE_SIZE)
+    return fov_cache.get_visible(dungeon, player_tile, radius)
 
             
     # If it's already in standard format or we can't standardize, return as is
@@ -4206,9 +4644,10 @@ class Tile:
             self.sprite = None
         else:
             self.sprite = None
+        self.discovered = False  # Set once the player has seen this tile (persisted in saves)
 
 class Chest:
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None):
         self.x = x
         self.y = y
         self.locked = True
@@ -4218,23 +4657,24 @@ class Chest:
         self.gold = 0
         
         # Generate random loot
-        self.generate_contents()
+        self.generate_contents(rng)
         
         # Load appropriate sprites based on state
         self.load_sprites()
     
-    def generate_contents(self):
-        """Generate random items and gold for the chest."""
+    def generate_contents(self, rng=None):
+        """Generate random items and gold for the chest, drawing from rng (default: the random module)."""
+        rng = rng or random
         # Add random items
         global items_list
         if items_list:
             # Get 3 random items from the items list
             for _ in range(CHEST_ITEMS_COUNT):
-                random_item = random.choice(items_list)
+                random_item = rng.choice(items_list)
                 self.contents.append(deepcopy(random_item))  # Use deepcopy to avoid modifying the original
         
         # Add gold
-        self.gold = roll_dice_expression(CHEST_GOLD_DICE)
+        self.gold = roll_dice_expression(CHEST_GOLD_DICE, rng=rng)
     
     def load_sprites(self):
         """Load chest sprites based on current state (closed/open)."""
@@ -4242,13 +4682,8 @@ class Chest:
         open_sprite_path = "./Fantasy_Game_Art_Assets/Misc/loot_drop_open.jpg"
         
         try:
-            if self.open:
-                self.sprite = pygame.image.load(open_sprite_path).convert_alpha()
-            else:
-                self.sprite = pygame.image.load(closed_sprite_path).convert_alpha()
-                
-            # Scale sprite to tile size
-            self.sprite = pygame.transform.smoothscale(self.sprite, (TILE_SIZE, TILE_SIZE))
+            # Closed and open chest sprites are shared through the asset cache
+            self.sprite = load_sprite(open_sprite_path if self.open else closed_sprite_path)
             
         except (pygame.error, FileNotFoundError) as e:
             print(f"Warning: Could not load chest sprite. Error: {e}")
@@ -4339,6 +4774,17 @@ class Door:
     
     def load_sprites(self):
         """Load door sprites based on current state (closed, open, locked) and type"""
+        if self.open:
+            # Open door uses the floor sprite
+            self.sprite = load_sprite(assets_data["sprites"]["tiles"]["floor"])
+        else:
+            # Closed door sprites only depend on type and lock state, so all doors share one
+            self.sprite = asset_cache.get_or_build(
+                ("door", self.door_type, self.locked, TILE_SIZE), self._build_closed_sprite
+            )
+
+    def _build_closed_sprite(self):
+        """Compose the closed door sprite, tinted and decorated by door type and lock state"""
         # Default door sprite path
         door_sprite_path = "./Fantasy_Game_Art_Assets/Misc/door_1.png"
         
@@ -4346,125 +4792,120 @@ class Door:
         if self.door_type == "level_transition":
             door_sprite_path = "./Fantasy_Game_Art_Assets/Misc/dungeon_level_door.jpg"
         
-        if self.open:
-            # Open door uses the floor sprite
-            self.sprite = load_sprite(assets_data["sprites"]["tiles"]["floor"])
-        elif self.locked:
+        if self.locked:
             # Locked door - use the door sprite with a red tint to indicate it's locked
             try:
                 # Load the custom door sprite
-                self.sprite = pygame.image.load(door_sprite_path).convert_alpha()
-                self.sprite = pygame.transform.smoothscale(self.sprite, (TILE_SIZE, TILE_SIZE))
+                sprite = load_sprite(door_sprite_path).copy()
                 
                 # Make locked doors have a bright red tint for high visibility
-                red_overlay = pygame.Surface(self.sprite.get_size(), pygame.SRCALPHA)
+                red_overlay = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
                 red_overlay.fill((255, 0, 0, 150))  # More opaque red for better visibility
-                temp_sprite = self.sprite.copy()
-                temp_sprite.blit(red_overlay, (0, 0))
-                self.sprite = temp_sprite
+                sprite.blit(red_overlay, (0, 0))
                 
                 # Add a prominent gold lock icon
                 lock_size = TILE_SIZE//3  # Larger lock
                 lock_icon = pygame.Surface((lock_size, lock_size), pygame.SRCALPHA)
                 lock_icon.fill((255, 215, 0, 230))  # Brighter gold color
                 # Position the lock in the center
-                self.sprite.blit(lock_icon, (TILE_SIZE//2 - lock_size//2, TILE_SIZE//2 - lock_size//2))
+                sprite.blit(lock_icon, (TILE_SIZE//2 - lock_size//2, TILE_SIZE//2 - lock_size//2))
                 
             except (pygame.error, FileNotFoundError):
                 # Fallback if the sprite can't be loaded
                 print(f"Warning: Could not load door sprite {door_sprite_path}, using fallback")
-                self.sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
+                sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
                 
                 # Different colors based on door type
                 if self.door_type == "level_transition":
-                    self.sprite.fill((0, 0, 139))  # Dark blue for level transition
+                    sprite.fill((0, 0, 139))  # Dark blue for level transition
                     
                     # Add a staircase-like symbol beneath the lock
                     symbol_size = TILE_SIZE // 3
                     symbol_pos = (TILE_SIZE // 3, TILE_SIZE // 1.8)
-                    pygame.draw.rect(self.sprite, (100, 100, 255), 
+                    pygame.draw.rect(sprite, (100, 100, 255), 
                                    (symbol_pos[0], symbol_pos[1], symbol_size, symbol_size // 3))
-                    pygame.draw.rect(self.sprite, (100, 100, 255), 
+                    pygame.draw.rect(sprite, (100, 100, 255), 
                                    (symbol_pos[0] + symbol_size // 3, symbol_pos[1] + symbol_size // 3,
                                    symbol_size - symbol_size // 3, symbol_size // 3))
                     
                 elif self.door_type == "map_transition":
-                    self.sprite.fill((148, 0, 211))  # Purple for map transition
+                    sprite.fill((148, 0, 211))  # Purple for map transition
                     
                     # Add a portal-like symbol beneath the lock
                     center = (TILE_SIZE // 2, TILE_SIZE // 1.5)
                     radius = TILE_SIZE // 4
-                    pygame.draw.circle(self.sprite, (200, 100, 200), center, radius, 2)
-                    pygame.draw.circle(self.sprite, (200, 100, 200), center, radius // 2, 1)
+                    pygame.draw.circle(sprite, (200, 100, 200), center, radius, 2)
+                    pygame.draw.circle(sprite, (200, 100, 200), center, radius // 2, 1)
                     
                 else:
-                    self.sprite.fill((139, 69, 19))  # Brown color for regular door
+                    sprite.fill((139, 69, 19))  # Brown color for regular door
                 
                 # Draw the lock in all cases
                 lock_rect = pygame.Rect(TILE_SIZE//3, TILE_SIZE//3, TILE_SIZE//3, TILE_SIZE//3)
-                pygame.draw.rect(self.sprite, (255, 215, 0), lock_rect)  # Gold lock
+                pygame.draw.rect(sprite, (255, 215, 0), lock_rect)  # Gold lock
         else:
             # Regular closed door
             try:
-                self.sprite = pygame.image.load(door_sprite_path).convert_alpha()
-                self.sprite = pygame.transform.smoothscale(self.sprite, (TILE_SIZE, TILE_SIZE))
+                sprite = load_sprite(door_sprite_path).copy()
                 
                 # Add a visual indicator for special doors
                 if self.door_type == "level_transition":
                     # Add a blue glow and symbol for level transition
-                    blue_overlay = pygame.Surface(self.sprite.get_size(), pygame.SRCALPHA)
+                    blue_overlay = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
                     blue_overlay.fill((0, 0, 255, 100))  # Semi-transparent blue
-                    self.sprite.blit(blue_overlay, (0, 0))
+                    sprite.blit(blue_overlay, (0, 0))
                     
                     # Add a staircase-like symbol
                     symbol_size = TILE_SIZE // 2
                     symbol_pos = (TILE_SIZE // 4, TILE_SIZE // 4)
-                    pygame.draw.rect(self.sprite, (0, 0, 200), 
+                    pygame.draw.rect(sprite, (0, 0, 200), 
                                     (symbol_pos[0], symbol_pos[1], symbol_size, symbol_size // 3))
-                    pygame.draw.rect(self.sprite, (0, 0, 200), 
+                    pygame.draw.rect(sprite, (0, 0, 200), 
                                     (symbol_pos[0] + symbol_size // 3, symbol_pos[1] + symbol_size // 3,
                                     symbol_size - symbol_size // 3, symbol_size // 3))
                     
                 elif self.door_type == "map_transition":
                     # Add a purple glow and symbol for map transition
-                    purple_overlay = pygame.Surface(self.sprite.get_size(), pygame.SRCALPHA)
+                    purple_overlay = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
                     purple_overlay.fill((128, 0, 128, 100))  # Semi-transparent purple
-                    self.sprite.blit(purple_overlay, (0, 0))
+                    sprite.blit(purple_overlay, (0, 0))
                     
                     # Add a portal-like symbol
                     center = (TILE_SIZE // 2, TILE_SIZE // 2)
                     radius = TILE_SIZE // 3
-                    pygame.draw.circle(self.sprite, (200, 0, 200), center, radius, 3)
-                    pygame.draw.circle(self.sprite, (200, 0, 200), center, radius // 2, 2)
+                    pygame.draw.circle(sprite, (200, 0, 200), center, radius, 3)
+                    pygame.draw.circle(sprite, (200, 0, 200), center, radius // 2, 2)
                     
             except (pygame.error, FileNotFoundError):
                 # Fallback if the sprite can't be loaded
                 print(f"Warning: Could not load door sprite {door_sprite_path}, using fallback")
-                self.sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
+                sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
                 
                 if self.door_type == "level_transition":
-                    self.sprite.fill((0, 0, 139))  # Dark blue for level transition
+                    sprite.fill((0, 0, 139))  # Dark blue for level transition
                     
                     # Add a staircase-like symbol
                     symbol_size = TILE_SIZE // 2
                     symbol_pos = (TILE_SIZE // 4, TILE_SIZE // 4)
-                    pygame.draw.rect(self.sprite, (100, 100, 255), 
+                    pygame.draw.rect(sprite, (100, 100, 255), 
                                    (symbol_pos[0], symbol_pos[1], symbol_size, symbol_size // 3))
-                    pygame.draw.rect(self.sprite, (100, 100, 255), 
+                    pygame.draw.rect(sprite, (100, 100, 255), 
                                    (symbol_pos[0] + symbol_size // 3, symbol_pos[1] + symbol_size // 3,
                                    symbol_size - symbol_size // 3, symbol_size // 3))
                     
                 elif self.door_type == "map_transition":
-                    self.sprite.fill((128, 0, 128))  # Purple for map transition
+                    sprite.fill((128, 0, 128))  # Purple for map transition
                     
                     # Add a portal-like symbol
                     center = (TILE_SIZE // 2, TILE_SIZE // 2)
                     radius = TILE_SIZE // 3
-                    pygame.draw.circle(self.sprite, (200, 100, 200), center, radius, 3)
-                    pygame.draw.circle(self.sprite, (200, 100, 200), center, radius // 2, 2)
+                    pygame.draw.circle(sprite, (200, 100, 200), center, radius, 3)
+                    pygame.draw.circle(sprite, (200, 100, 200), center, radius // 2, 2)
                     
                 else:
-                    self.sprite.fill((160, 82, 45))  # Brown color for regular door
+                    sprite.fill((160, 82, 45))  # Brown color for regular door
+
+        return sprite
     
     def try_force_open(self, character):
         """Warriors and Priests can try to force a door open with Strength"""
@@ -4671,7 +5112,7 @@ def has_line_of_sight(caster, target, dungeon, required_clear=1):
     if not cells_between:
         return True
     for (x, y) in cells_between:
-        if dungeon.tiles[x][y].type in ('wall', 'door'):
+        if dungeon.opacity[x * dungeon.height + y]:
             return False
     return True
 
@@ -4724,15 +5165,14 @@ def spells_dialogue(screen, player, clock):
         pygame.draw.rect(screen, border_color, dialogue_rect, 2)
         
         # Header text.
-        header = font.render("Select a Spell:", True, (255, 255, 255))
+        header = text_cache.render(font, "Select a Spell:", (255, 255, 255))
         screen.blit(header, (dialogue_rect.x + 10, dialogue_rect.y + 10))
         
         # List each spell with its number.
         y_offset = dialogue_rect.y + 40
         for i, spell in enumerate(available_spells):
             spell_text = f"{i+1}. {spell['name']} (Cost: {spell.get('sp_cost', '?')})"
-            text_surface = font.render(spell_text, True, (255, 255, 255))
-            screen.blit(text_surface, (dialogue_rect.x + 10, y_offset))
+            text_cache.blit(screen, font, spell_text, (255, 255, 255), (dialogue_rect.x + 10, y_offset))
             y_offset += 30
         
         pygame.display.flip()
@@ -4838,27 +5278,13 @@ def cast_spell(caster, target, spell_name, dungeon):
         visual_effect_path = spell.get("visual_effect")
         visual_duration = spell.get("visual_duration", 0)
         
-        # Display the visual effect if it exists
+        # Queue the visual effect if it exists; it plays over the map while the game carries on
         try:
             if visual_effect_path:
-                explosion_img = pygame.image.load(visual_effect_path).convert_alpha()
                 # Get size based on area_size (3 squares = 3 * TILE_SIZE)
                 effect_size = spell.get("area_size", 1) * TILE_SIZE * 2
-                explosion_img = pygame.transform.scale(explosion_img, (effect_size, effect_size))
-                
-                # Calculate center position
-                target_x, target_y = target.position
-                effect_x = target_x - (effect_size // 2)
-                effect_y = target_y - (effect_size // 2)
-                
-                # Display the effect
-                for _ in range(int(visual_duration * 10) if visual_duration else 1):  # 10 frames per second
-                    # Draw a partial game state
-                    screen = pygame.display.get_surface()
-                    draw_playable_area(screen, dungeon, caster)
-                    screen.blit(explosion_img, (effect_x, effect_y))
-                    pygame.display.flip()
-                    pygame.time.delay(100)  # 1/10th of a second delay
+                explosion_img = asset_cache.load(visual_effect_path, (effect_size, effect_size), smooth=False)
+                animation_scheduler.play_frames(explosion_img, target.position, visual_duration or 0.1)
         except Exception as e:
             messages.append(f"Visual effect error: {str(e)}")
         
@@ -4951,29 +5377,16 @@ def cast_spell(caster, target, spell_name, dungeon):
         
         # Create a fallback visual effect that doesn't rely on the image file
         try:
-            screen = pygame.display.get_surface()
-            
-            # Fallback effect - draw expanding circles
+            # Fallback effect - expanding circles
             area_size = spell.get("area_size", 3)
             max_radius = area_size * TILE_SIZE
             
-            # Calculate position (centered on caster)
-            caster_x, caster_y = caster.position
-            
-            # Draw expanding frost circles
-            for radius in range(10, max_radius + 1, 10):
-                # Draw base game state
-                draw_playable_area(screen, dungeon, caster)
-                
-                # Draw a frost circle
-                frost_color = (150, 200, 255, 150)  # Light blue with transparency
-                frost_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(frost_surf, frost_color, (radius, radius), radius)
-                
-                # Draw circle centered on caster
-                screen.blit(frost_surf, (caster_x - radius, caster_y - radius))
-                pygame.display.flip()
-                pygame.time.delay(50)
+            # One frost circle per frame, growing 10 pixels every 50 ms (baked once per size)
+            frame_count = max_radius // 10
+            if frame_count > 0:
+                frost_frames = effect_frames.frames("frost_ring", frame_count * 20, frame_count, _draw_frost_ring_frame)
+                # Play the circles centered on the caster
+                animation_scheduler.play_frames(frost_frames, caster.position, frame_count * 0.05)
         except Exception as e:
             error_message = f"Visual effect error: {str(e)}"
             messages.append(error_message)
@@ -5097,64 +5510,43 @@ def cast_spell(caster, target, spell_name, dungeon):
 def display_visual_effect(effect_path, target_position, duration=1.0, size_multiplier=1.0, frames=10, 
                           screen=None, dungeon=None, caster=None):
     """
-    Displays a visual effect at the target position.
+    Plays a visual effect at the target position.
+    
+    The effect is queued on the animation scheduler and drawn over the map by
+    the main loop, so this returns immediately instead of blocking for the duration.
     
     Args:
         effect_path (str): Path to the effect image file
         target_position (tuple): (x, y) position where the effect should be centered
         duration (float): Duration in seconds to display the effect
         size_multiplier (float): Size multiplier for the effect (1.0 = normal size)
-        frames (int): Number of frames to display during the effect duration
-        screen (Surface): Pygame screen to draw on, if None, gets current screen
-        dungeon (Dungeon): Dungeon object for redrawing the game state
-        caster (Character): Character who cast the spell, needed for redrawing
+        frames (int): Unused; the image is held for the whole duration
+        screen (Surface): Unused; kept for callers that still pass it
+        dungeon (Dungeon): Unused; kept for callers that still pass it
+        caster (Character): Unused; kept for callers that still pass it
     
     Returns:
-        bool: True if display was successful, False otherwise with error message
+        bool: True if the effect was queued, False otherwise with error message
     """
     try:
-        # Get the screen if not provided
-        if screen is None:
-            screen = pygame.display.get_surface()
-            
-        # Load and prepare the effect image
-        effect_img = pygame.image.load(effect_path).convert_alpha()
-        
         # Calculate the effect size (scaled according to tile size and multiplier)
         effect_size = int(TILE_SIZE * 2 * size_multiplier)
-        effect_img = pygame.transform.scale(effect_img, (effect_size, effect_size))
-        
-        # Calculate center position
-        target_x, target_y = target_position
-        effect_x = target_x - (effect_size // 2)
-        effect_y = target_y - (effect_size // 2)
+        effect_img = asset_cache.load(effect_path, (effect_size, effect_size), smooth=False)
         
-        # Calculate frame delay based on duration and frames
-        frame_delay = int(duration * 1000 / frames)
-        
-        # Display the effect for the specified duration
-        for _ in range(frames):
-            # Redraw the game state if dungeon and caster are provided
-            if dungeon is not None and caster is not None:
-                draw_playable_area(screen, dungeon, caster)
-            
-            # Draw the effect
-            screen.blit(effect_img, (effect_x, effect_y))
-            pygame.display.flip()
-            pygame.time.delay(frame_delay)
-            
+        animation_scheduler.play_frames(effect_img, target_position, duration)
         return True, None
     except Exception as e:
         return False, str(e)
 
 # Create spell effect images for UI and icons
-def create_frost_nova_image(size=256, save_path=None):
+def create_frost_nova_image(size=256, save_path=None, overwrite=False):
     """
     Creates an icy frost nova explosion image and saves it to the disk.
     
     Args:
         size (int): Size of the image in pixels
         save_path (str, optional): Path to save the image to
+        overwrite (bool): Regenerate the image even if the file already exists
         
     Returns:
         str: Path to the created image file or default path if none provided
@@ -5162,6 +5554,16 @@ def create_frost_nova_image(size=256, save_path=None):
     import math
     import os
     
+    # If no save path provided, use a default path
+    if not save_path:
+        # Get the base directory for the game
+        base_dir = "."
+        save_path = os.path.join(base_dir, "Fantasy_Game_Art_Assets", "Misc", "spell_assets", "frost_nova.png")
+    
+    # The image only needs generating once
+    if not overwrite and os.path.exists(save_path):
+        return save_path
+    
     # Create a new surface with transparency
     img = pygame.Surface((size, size), pygame.SRCALPHA)
     
@@ -5243,12 +5645,6 @@ def create_frost_nova_image(size=256, save_path=None):
     pygame.draw.circle(center_flash, (255, 255, 255, 220), (size//6, size//6), size//6)
     img.blit(center_flash, (center_x - size//6, center_y - size//6))
     
-    # If no save path provided, use a default path
-    if not save_path:
-        # Get the base directory for the game
-        base_dir = "."
-        save_path = os.path.join(base_dir, "Fantasy_Game_Art_Assets", "Misc", "spell_assets", "frost_nova.png")
-    
     # Ensure the directory exists
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
@@ -5257,7 +5653,7 @@ def create_frost_nova_image(size=256, save_path=None):
     print(f"Created frost nova image at {save_path}")
     return save_path
 
-def create_fireball_image(size=32, save_path=None):
+def create_fireball_image(size=32, save_path=None, overwrite=False):
     """
     Creates a simple fireball image surface to be used as an icon or UI element.
     Optionally saves the image to a file.
@@ -5265,6 +5661,7 @@ def create_fireball_image(size=32, save_path=None):
     Args:
         size (int): Size of the image in pixels
         save_path (str, optional): Path to save the image to
+        overwrite (bool): Regenerate the image even if the file already exists
         
     Returns:
         str: Path to the created image file or default path if none provided
@@ -5272,6 +5669,18 @@ def create_fireball_image(size=32, save_path=None):
     import math
     import os
     
+    # If no save path provided, use a default path
+    if not save_path:
+        # Get the base directory for the game
+        base_dir = "."
+        save_path = os.path.join(base_dir, "Fantasy_Game_Art_Assets", "Misc", "spell_assets", "generated_fireball.png")
+        # Ensure directory exists (create it if it doesn't)
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    
+    # The image only needs generating once
+    if not overwrite and os.path.exists(save_path):
+        return save_path
+    
     # Create a surface with alpha channel for transparency
     surface = pygame.Surface((size, size), pygame.SRCALPHA)
     
@@ -5307,14 +5716,6 @@ def create_fireball_image(size=32, save_path=None):
         # Draw the spark
         pygame.draw.circle(surface, (255, 255, 255, 255), (spark_x, spark_y), spark_size)
     
-    # If no save path provided, use a default path
-    if not save_path:
-        # Get the base directory for the game
-        base_dir = "."
-        save_path = os.path.join(base_dir, "Fantasy_Game_Art_Assets", "Misc", "spell_assets", "generated_fireball.png")
-        # Ensure directory exists (create it if it doesn't)
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     # Save the surface to a file
     try:
         pygame.image.save(surface, save_path)
@@ -5326,103 +5727,72 @@ def create_fireball_image(size=32, save_path=None):
     
     return save_path
 
+def _draw_fireball_explosion_frame(explosion_surf, frame, frames):
+    """Draw one frame of the fireball explosion's growing circles onto an empty square surface."""
+    explosion_radius = explosion_surf.get_width() // 2
+    
+    # Calculate current expansion (start small, grow, then shrink)
+    progress = frame / frames
+    if progress < 0.3:
+        # Growing phase
+        current_radius = explosion_radius * (progress / 0.3)
+    else:
+        # Stable/shrinking phase
+        current_radius = explosion_radius * (1 - ((progress - 0.3) / 0.7) * 0.5)
+    
+    # Draw concentric circles for the explosion
+    colors = [
+        (255, 255, 200, 200),  # Yellow-white center
+        (255, 200, 50, 180),   # Orange middle
+        (255, 100, 20, 160),   # Red-orange outer
+        (200, 40, 10, 140)     # Dark red edge
+    ]
+    
+    # Divide the current radius among the circles
+    for i, color in enumerate(colors):
+        circle_radius = int(current_radius * (1 - i * 0.25))
+        if circle_radius > 0:
+            pygame.draw.circle(
+                explosion_surf, 
+                color, 
+                (explosion_radius, explosion_radius), 
+                circle_radius
+            )
+
+def _draw_frost_ring_frame(frost_surf, frame, frames):
+    """Draw one frame of the Frost Nova ring, 10 pixels wider in radius each frame, centered on an empty square surface."""
+    frost_color = (150, 200, 255, 150)  # Light blue with transparency
+    center = frost_surf.get_width() // 2
+    pygame.draw.circle(frost_surf, frost_color, (center, center), (frame + 1) * 10)
+
 # Create a dynamic fireball explosion effect
 def create_fireball_explosion(target_position, size=3, duration=2.0, frames=20, screen=None, dungeon=None, caster=None):
     """
     Creates a dynamic fireball explosion with animated concentric circles and random sparks.
     
+    The circles are baked once per size and frame count by the effect frame cache
+    and queued on the animation scheduler, and the sparks are emitted into the
+    particle system; both play over the map from the main loop, so this returns immediately.
+    
     Args:
         target_position (tuple): (x, y) position where the explosion should be centered
         size (int): Size of the explosion in tiles
         duration (float): Duration in seconds for the explosion animation
         frames (int): Number of frames to display during the animation
-        screen (Surface): Pygame screen to draw on, if None, gets current screen
-        dungeon (Dungeon): Dungeon object for redrawing the game state
-        caster (Character): Character who cast the spell, needed for redrawing
+        screen (Surface): Unused; kept for callers that still pass it
+        dungeon (Dungeon): Unused; kept for callers that still pass it
+        caster (Character): Unused; kept for callers that still pass it
     """
-    import math  # Add import for math functions
-    
     try:
-        # Get the screen if not provided
-        if screen is None:
-            screen = pygame.display.get_surface()
-            
-        # Calculate explosion parameters
         explosion_radius = TILE_SIZE * size
-        frame_delay = int(duration * 1000 / frames)
-        
-        # Extract target position
-        target_x, target_y = target_position
+        explosion_frames = effect_frames.frames(
+            "fireball_explosion", explosion_radius * 2, max(1, frames), _draw_fireball_explosion_frame
+        )
         
-        # Create surfaces for the explosion
-        for frame in range(frames):
-            # Redraw the game state if dungeon and caster are provided
-            if dungeon is not None and caster is not None:
-                draw_playable_area(screen, dungeon, caster)
-            
-            # Create a transparent surface for the explosion
-            explosion_surf = pygame.Surface((explosion_radius * 2, explosion_radius * 2), pygame.SRCALPHA)
-            
-            # Calculate current expansion (start small, grow, then shrink)
-            progress = frame / frames
-            if progress < 0.3:
-                # Growing phase
-                current_radius = explosion_radius * (progress / 0.3)
-            else:
-                # Stable/shrinking phase
-                current_radius = explosion_radius * (1 - ((progress - 0.3) / 0.7) * 0.5)
-            
-            # Draw concentric circles for the explosion
-            colors = [
-                (255, 255, 200, 200),  # Yellow-white center
-                (255, 200, 50, 180),   # Orange middle
-                (255, 100, 20, 160),   # Red-orange outer
-                (200, 40, 10, 140)     # Dark red edge
-            ]
-            
-            # Divide the current radius among the circles
-            for i, color in enumerate(colors):
-                circle_radius = int(current_radius * (1 - i * 0.25))
-                if circle_radius > 0:
-                    pygame.draw.circle(
-                        explosion_surf, 
-                        color, 
-                        (explosion_radius, explosion_radius), 
-                        circle_radius
-                    )
-            
-            # Add random sparks
-            num_sparks = int(20 * (1 - progress))  # More sparks at the beginning
-            for _ in range(num_sparks):
-                # Random angle and distance from center
-                angle = random.uniform(0, 6.28)  # 0 to 2π
-                distance = random.uniform(0.1, 1.0) * current_radius
-                
-                # Calculate spark position
-                spark_x = int(explosion_radius + distance * math.cos(angle))
-                spark_y = int(explosion_radius + distance * math.sin(angle))
-                
-                # Random spark size and color
-                spark_size = random.randint(2, 5)
-                spark_color = random.choice([
-                    (255, 255, 255, 255),  # White
-                    (255, 255, 200, 255),  # Yellow-white
-                    (255, 200, 100, 255)   # Orange-yellow
-                ])
-                
-                # Draw the spark
-                pygame.draw.circle(explosion_surf, spark_color, (spark_x, spark_y), spark_size)
-            
-            # Draw the explosion surface to the screen
-            screen.blit(
-                explosion_surf, 
-                (target_x - explosion_radius, target_y - explosion_radius)
-            )
-            
-            # Update display and delay
-            pygame.display.flip()
-            pygame.time.delay(frame_delay)
-            
+        # Play the explosion centered on the target, throwing sparks out past its edge
+        animation_scheduler.play_frames(explosion_frames, target_position, duration)
+        particle_system.emit(target_position, 30 * size,
+                             **dict(FIREBALL_SPARKS, speed=(explosion_radius * 0.5, explosion_radius * 1.5)))
         return True, None
     except Exception as e:
         return False, str(e)
@@ -5448,6 +5818,9 @@ def process_game_turn(player, dungeon):
     # Process all active conditions on player and monsters
     condition_messages = condition_manager.process_turn([player] + dungeon.monsters)
 
+    # Build (or reuse) this turn's flow field toward the player, shared by every monster
+    flow_field_cache.get(dungeon, (player.position[0] // TILE_SIZE, player.position[1] // TILE_SIZE))
+
     # Add messages to the game message queue
     for msg in condition_messages:
         add_message(msg)
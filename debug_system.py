@@ -34,6 +34,8 @@ def draw_debug_info(screen, player, dungeon, font): # DEBUG_MODE removed from pa
     """Draw debug information on screen, including player and dungeon state."""
     if not DEBUG_MODE: # Uses module-level DEBUG_MODE
         return
+    # Imported here: Data pulls in common_b_s, which imports this module
+    from Data.text_cache import text_cache
 
     # Create a semi-transparent overlay for debug info
     debug_surface = pygame.Surface((400, 300), pygame.SRCALPHA)
@@ -41,8 +43,7 @@ def draw_debug_info(screen, player, dungeon, font): # DEBUG_MODE removed from pa
 
     # Title
     title_text = "DEBUG INFO"
-    title_surface = font.render(title_text, True, (255, 255, 0))
-    debug_surface.blit(title_surface, (10, 10))
+    text_cache.blit(debug_surface, font, title_text, (255, 255, 0), (10, 10))
 
     # Player info
     y_pos = 40
@@ -54,8 +55,7 @@ def draw_debug_info(screen, player, dungeon, font): # DEBUG_MODE removed from pa
     ]
 
     for info in player_info:
-        text_surface = font.render(info, True, (200, 200, 255))
-        debug_surface.blit(text_surface, (10, y_pos))
+        text_cache.blit(debug_surface, font, info, (200, 200, 255), (10, y_pos))
         y_pos += 20
 
     # Dungeon info
@@ -69,14 +69,12 @@ def draw_debug_info(screen, player, dungeon, font): # DEBUG_MODE removed from pa
         ]
 
         for info in dungeon_info:
-            text_surface = font.render(info, True, (200, 255, 200))
-            debug_surface.blit(text_surface, (10, y_pos))
+            text_cache.blit(debug_surface, font, info, (200, 255, 200), (10, y_pos))
             y_pos += 20
     except:
         # If any attribute access fails, just show a simple message
         error_text = "Dungeon data unavailable"
-        text_surface = font.render(error_text, True, (255, 100, 100))
-        debug_surface.blit(text_surface, (10, y_pos))
+        text_cache.blit(debug_surface, font, error_text, (255, 100, 100), (10, y_pos))
 
     # Position the debug overlay at the top-left corner
     screen.blit(debug_surface, (10, 10))
@@ -84,6 +82,7 @@ def draw_debug_info(screen, player, dungeon, font): # DEBUG_MODE removed from pa
 def draw_key_diagnostics(screen, font, small_font, DUNGEON_SCREEN_WIDTH): # KEY_DIAGNOSTIC_ENABLED, keys_pressed, key_state removed
     if not KEY_DIAGNOSTIC_ENABLED: # Uses module-level KEY_DIAGNOSTIC_ENABLED
         return
+    from Data.text_cache import text_cache
 
     # Create a more visible overlay
     overlay_width = 350
@@ -101,37 +100,32 @@ def draw_key_diagnostics(screen, font, small_font, DUNGEON_SCREEN_WIDTH): # KEY_
     pygame.draw.rect(overlay, border_color, (0, 0, overlay_width, overlay_height), 3)
 
     # Title with shadow
-    title = font.render("KEY DIAGNOSTICS", True, (255, 255, 0))
     # Shadow effect
-    title_shadow = font.render("KEY DIAGNOSTICS", True, (0, 0, 0))
-    overlay.blit(title_shadow, (12, 12))
-    overlay.blit(title, (10, 10))
+    text_cache.blit(overlay, font, "KEY DIAGNOSTICS", (0, 0, 0), (12, 12))
+    text_cache.blit(overlay, font, "KEY DIAGNOSTICS", (255, 255, 0), (10, 10))
 
     # Last keys pressed
     y_pos = 40
     if keys_pressed: # Uses module-level keys_pressed
-        header = font.render("Recent Keys:", True, (255, 200, 200))
-        overlay.blit(header, (10, y_pos))
+        text_cache.blit(overlay, font, "Recent Keys:", (255, 200, 200), (10, y_pos))
         y_pos += 25
 
         # Show last keys with timestamp
         for i, key in enumerate(keys_pressed[-5:]): # Uses module-level keys_pressed
             text_color = (200, 255, 255)  # Bright cyan
-            overlay.blit(small_font.render(f"> {key}", True, text_color), (20, y_pos + i*20))
+            text_cache.blit(overlay, small_font, f"> {key}", text_color, (20, y_pos + i*20))
         y_pos += len(keys_pressed[-5:]) * 20 + 15
     else:
-        msg = small_font.render("No keys detected yet - press any key", True, (255, 100, 100))
-        overlay.blit(msg, (10, y_pos))
+        text_cache.blit(overlay, small_font, "No keys detected yet - press any key", (255, 100, 100), (10, y_pos))
         y_pos += 30
 
     # Draw test arena activation instructions
     pygame.draw.rect(overlay, (50, 100, 50), (10, y_pos, overlay_width - 20, 30))
-    activation_text = small_font.render("TEST ARENA: F1 or SHIFT+T", True, (255, 255, 0))
-    overlay.blit(activation_text, (20, y_pos + 8))
+    text_cache.blit(overlay, small_font, "TEST ARENA: F1 or SHIFT+T", (255, 255, 0), (20, y_pos + 8))
     y_pos += 40
 
     # Current key states with visual indicators
-    overlay.blit(font.render("Active Keys:", True, (255, 200, 200)), (10, y_pos))
+    text_cache.blit(overlay, font, "Active Keys:", (255, 200, 200), (10, y_pos))
     y_pos += 25
 
     # Define important keys to show
@@ -155,7 +149,7 @@ def draw_key_diagnostics(screen, font, small_font, DUNGEON_SCREEN_WIDTH): # KEY_
 
         # Draw key label with bright color when active
         text_color = (255, 255, 255) if state else (180, 180, 180)
-        overlay.blit(small_font.render(f"{key}", True, text_color), (x_pos + 20, y_offset))
+        text_cache.blit(overlay, small_font, f"{key}", text_color, (x_pos + 20, y_offset))
 
         # Update column/row position
         col += 1
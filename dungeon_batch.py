@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Batch Dungeon Generation for Blade & Sigil
+Generates many dungeons headlessly across a process pool and reports
+generation time percentiles and layout statistics (rooms, corridor lengths,
+corridor tiles, doors, connectivity repairs) plus connectivity failures, for tuning room
+scaling and catching generation regressions.
+
+Every dungeon is built from its own seed (base seed + index), so any
+failing map can be reproduced with Dungeon(width, height, level=level, seed=seed).
+
+Usage:
+    python dungeon_batch.py [--count N] [--sizes 20x15 40x40] [--levels 1 2 3]
+                            [--seed N] [--workers N] [--max-rooms N] [--max-room-size N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Run headless; the game modules create a display on import
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Tile types a player can cross once doors are unlocked
+PASSABLE_TILE_TYPES = ('floor', 'corridor', 'door', 'locked_door', 'stair_down', 'stair_up')
+
+_Dungeon = None
+_tile_size = None
+
+
+def _init_worker():
+    """Import the game modules once per worker process, discarding their console output."""
+    global _Dungeon, _tile_size
+    with contextlib.redirect_stdout(io.StringIO()):
+        from common_b_s import Dungeon, TILE_SIZE
+        # Warm the sprite cache so the first timed dungeon doesn't pay for image loading
+        Dungeon(20, 15, seed=0)
+    _Dungeon = Dungeon
+    _tile_size = TILE_SIZE
+
+
+def reachable_tiles(dungeon, start):
+    """Return the set of passable tiles reachable from start (doors count as passable)."""
+    width, height = dungeon.width, dungeon.height
+    passable = dungeon.tiles.type_mask(PASSABLE_TILE_TYPES)
+    seen = {start}
+    frontier = deque([start])
+    while frontier:
+        x, y = frontier.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in seen and passable[nx * height + ny]:
+                seen.add((nx, ny))
+                frontier.append((nx, ny))
+    return seen
+
+
+def generate_one(job):
+    """
+    Generate one dungeon and measure it.
+
+    Args:
+        job: (width, height, level, max_maps, seed, max_rooms, max_room_size)
+
+    Returns:
+        dict: Generation time and layout statistics for the dungeon
+    """
+    width, height, level, max_maps, seed, max_rooms, max_room_size = job
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        dungeon = _Dungeon(width, height, level=level, max_maps=max_maps, seed=seed,
+                           max_rooms=max_rooms, max_room_size=max_room_size)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+    tiles = dungeon.tiles
+    start_tile = (dungeon.start_position[0] // _tile_size, dungeon.start_position[1] // _tile_size)
+    reachable = reachable_tiles(dungeon, start_tile)
+    unreachable_rooms = sum(1 for x, y, w, h in dungeon.rooms if (x + w // 2, y + h // 2) not in reachable)
+    exits = [(index // height, index % height) for index, value in enumerate(tiles.type_mask(('stair_down',))) if value]
+    exits.extend(dungeon.map_transition_doors)
+
+    return {
+        "key": (width, height, level),
+        "seed": seed,
+        "ms": elapsed_ms,
+        "rooms": len(dungeon.rooms),
+        "corridor_lengths": dungeon.corridor_lengths,
+        "corridor_tiles": sum(tiles.type_mask(('corridor', 'door', 'locked_door'))),
+        "doors": len(dungeon.doors),
+        "unreachable_rooms": unreachable_rooms,
+        "exit_reachable": any(tile in reachable for tile in exits),
+        "repairs": dungeon.connectivity_repairs or {"unlocked": 0, "carved": 0, "ok": True},
+    }
+
+
+def percentile(values, fraction):
+    """Return the value at a fraction (0-1) of a sorted list, nearest-rank."""
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+def parse_size(text):
+    """Parse a WIDTHxHEIGHT size argument."""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"size must look like 40x40, got {text!r}")
+    return width, height
+
+
+def report(results):
+    """Print one block of statistics per (size, level) group."""
+    groups = {}
+    for result in results:
+        groups.setdefault(result["key"], []).append(result)
+
+    for (width, height, level), group in sorted(groups.items()):
+        times = sorted(result["ms"] for result in group)
+        rooms = [result["rooms"] for result in group]
+        lengths = [length for result in group for length in result["corridor_lengths"]]
+        corridors = [result["corridor_tiles"] for result in group]
+        doors = [result["doors"] for result in group]
+        failures = [result for result in group if result["unreachable_rooms"] or not result["exit_reachable"]]
+        repaired = [result for result in group if result["repairs"]["unlocked"] or result["repairs"]["carved"]]
+        unlocked = [result["repairs"]["unlocked"] for result in group]
+        carved = [result["repairs"]["carved"] for result in group]
+
+        print(f"\n{width}x{height} level {level}: {len(group)} dungeons")
+        print(f"  generation ms  p50 {percentile(times, 0.5):7.2f}  p90 {percentile(times, 0.9):7.2f}  "
+              f"p99 {percentile(times, 0.99):7.2f}  max {times[-1]:7.2f}")
+        print(f"  rooms          mean {statistics.mean(rooms):6.1f}  min {min(rooms):4d}  max {max(rooms):4d}")
+        if lengths:
+            lengths.sort()
+            print(f"  corridor length mean {statistics.mean(lengths):5.1f}  p50 {percentile(lengths, 0.5):4d}  "
+                  f"p90 {percentile(lengths, 0.9):4d}  max {lengths[-1]:4d}  (tiles per corridor)")
+        print(f"  corridor tiles mean {statistics.mean(corridors):6.1f}  min {min(corridors):4d}  max {max(corridors):4d}")
+        print(f"  doors          mean {statistics.mean(doors):6.1f}  min {min(doors):4d}  max {max(doors):4d}")
+        print(f"  repaired maps  {len(repaired)} ({len(repaired) / len(group):.1%}): doors unlocked mean "
+              f"{statistics.mean(unlocked):.1f}, tiles carved mean {statistics.mean(carved):.1f}")
+        print(f"  connectivity failures: {len(failures)} ({len(failures) / len(group):.1%})")
+        if failures:
+            examples = ", ".join(str(result["seed"]) for result in failures[:5])
+            print(f"    e.g. seeds {examples}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate dungeons in bulk and report layout statistics")
+    parser.add_argument("--count", type=int, default=200, help="Dungeons per size and level")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[(20, 15), (40, 40)],
+                        help="Map sizes as WIDTHxHEIGHT")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1], help="Dungeon levels to generate")
+    parser.add_argument("--max-maps", type=int, default=1,
+                        help="Maps per level (above 1, maps get a transition door instead of stairs)")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed; dungeon i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-rooms", type=int, default=None, help="Cap the rooms per map (default: uncapped)")
+    parser.add_argument("--max-room-size", type=int, default=None,
+                        help="Cap room width and height in tiles (default: uncapped)")
+    args = parser.parse_args()
+
+    jobs = []
+    for width, height in args.sizes:
+        for level in args.levels:
+            for i in range(args.count):
+                jobs.append((width, height, level, args.max_maps, args.seed + i, args.max_rooms, args.max_room_size))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+        results = list(executor.map(generate_one, jobs, chunksize=max(1, len(jobs) // 64)))
+    wall = time.perf_counter() - start
+
+    print(f"Generated {len(results)} dungeons in {wall:.1f} s ({len(results) / wall:.1f} per second)")
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,7 @@ from copy import deepcopy
 
 from common_b_s import (
     DUNGEON_SCREEN_WIDTH, DUNGEON_SCREEN_HEIGHT, WHITE, font, # for show_title_screen
-    Character, Dungeon, Tile, Door, Chest, Monster, Item, # Basic game object classes
+    Character, Dungeon, Tile, TileGrid, Door, Chest, Monster, Item, # Basic game object classes
     Weapon, Armor, Shield, Jewelry, Consumable, # Item subclasses
     create_item, load_sprite, assets_data, condition_manager, # Utilities and data
     roll_dice_expression, # for Player gold initialization within load_game if new player created
@@ -21,6 +21,10 @@ from common_b_s import (
     add_message, GREEN, RED, YELLOW, levelup_sound # Player removed
 )
 from player import Player # Player imported from player.py
+from Data.dungeon_prefetch import dungeon_prefetcher
+from Data.animation import animation_scheduler
+from Data.particles import particle_system
+from Data.text_cache import text_cache
 # Player class from blade_sigil_v5_5.py is needed for save/load
 # Player class is now imported from common_b_s to resolve circular dependency.
 # from common_b_s import Player # Already added to the block above
@@ -154,6 +158,11 @@ def save_game(player, dungeon, game_state="dungeon"):
         dungeon_data = {
             "width": dungeon.width,
             "height": dungeon.height,
+            # Generation inputs: Dungeon(width, height, level, map_number, max_maps, seed=seed) rebuilds the original map
+            "seed": getattr(dungeon, "seed", None),
+            "level": getattr(dungeon, "level", 1),
+            "map_number": getattr(dungeon, "map_number", 1),
+            "max_maps": getattr(dungeon, "max_maps", 1),
             "tiles": [],
             "doors": [],
             "chests": [],
@@ -161,12 +170,17 @@ def save_game(player, dungeon, game_state="dungeon"):
             "dropped_items": []
         }
 
+        # Read the tile grid's flat layers directly instead of building a view per tile
+        tile_grid = dungeon.tiles
+        type_names = tile_grid.type_names
         for x in range(dungeon.width):
-            row = []
-            for y in range(dungeon.height):
-                tile = dungeon.tiles[x][y]
-                row.append({"x": x, "y": y, "type": tile.type, "discovered": getattr(tile, 'discovered', False)}) # Added discovered
-            dungeon_data["tiles"].append(row)
+            base = x * dungeon.height
+            types = tile_grid.types[base:base + dungeon.height]
+            discovered = tile_grid.discovered[base:base + dungeon.height]
+            dungeon_data["tiles"].append([
+                {"x": x, "y": y, "type": type_names[types[y]], "discovered": bool(discovered[y])}
+                for y in range(dungeon.height)
+            ])
 
         for coords, door_obj in dungeon.doors.items():
             door_data = {"x": door_obj.x, "y": door_obj.y, "locked": door_obj.locked, "open": door_obj.open, "door_type": door_obj.door_type}
@@ -284,30 +298,49 @@ def load_game():
                     if item_obj: player.equipment[slot] = item_obj
 
         # Dungeon reconstruction:
-        # game_dungeon will be a common_b_s.Dungeon instance
-        game_dungeon = Dungeon(dungeon_data_dict.get("width", 20), dungeon_data_dict.get("height", 15))
-        game_dungeon.tiles = [[Tile(x, y, 'wall') for y in range(game_dungeon.height)] for x in range(game_dungeon.width)] # Re-init tiles
+        # game_dungeon will be a common_b_s.Dungeon instance. With a saved seed the map, its
+        # sprites and its transition doors are regenerated exactly, and only what changed
+        # since (discovered tiles, opened doors, chests, monsters, drops) is applied on top.
+        seed = dungeon_data_dict.get("seed")
+        game_dungeon = Dungeon(
+            dungeon_data_dict.get("width", 20), dungeon_data_dict.get("height", 15),
+            level=dungeon_data_dict.get("level", 1), map_number=dungeon_data_dict.get("map_number", 1),
+            max_maps=dungeon_data_dict.get("max_maps", 1), seed=seed
+        )
+        if seed is None:
+            # Saves from before seeds were recorded: rebuild every tile from the save
+            game_dungeon.tiles = TileGrid(game_dungeon.width, game_dungeon.height) # Re-init tiles
 
         for x, row_data in enumerate(dungeon_data_dict.get("tiles", [])):
             if x < game_dungeon.width:
                 for y, tile_data in enumerate(row_data):
                     if y < game_dungeon.height:
+                        tile = game_dungeon.tiles[x][y]
+                        tile.discovered = tile_data.get("discovered", False)
                         tile_type = tile_data.get("type", "wall")
-                        game_dungeon.tiles[x][y].type = tile_type
-                        game_dungeon.tiles[x][y].discovered = tile_data.get("discovered", False)
+                        if seed is not None and tile.type == tile_type:
+                            continue  # Regenerated as saved
+                        tile.type = tile_type
                         # Sprites for tiles are typically set by Tile constructor or Dungeon methods
                         if tile_type in ('floor', 'corridor'):
-                            game_dungeon.tiles[x][y].sprite = load_sprite(assets_data["sprites"]["tiles"]["floor"])
+                            tile.sprite = load_sprite(assets_data["sprites"]["tiles"]["floor"])
                         elif tile_type == 'stair_up':
-                            game_dungeon.tiles[x][y].sprite = load_sprite(assets_data["sprites"]["tiles"]["stair_up"])
+                            tile.sprite = load_sprite(assets_data["sprites"]["tiles"]["stair_up"])
                         elif tile_type == 'stair_down':
-                            game_dungeon.tiles[x][y].sprite = load_sprite(assets_data["sprites"]["tiles"]["stair_down"])
+                            tile.sprite = load_sprite(assets_data["sprites"]["tiles"]["stair_down"])
                         # Door sprites are handled by Door class or when placing doors
 
+        # Doors: update the regenerated door objects (the transition door references point at them)
+        generated_doors = game_dungeon.doors
         game_dungeon.doors = {}
         for door_data in dungeon_data_dict.get("doors", []):
-            door_obj = Door(door_data.get("x"), door_data.get("y"), door_data.get("locked", False), door_data.get("door_type", "normal"))
+            coords = (door_data.get("x"), door_data.get("y"))
+            door_obj = generated_doors.get(coords)
+            if door_obj is None or door_obj.door_type != door_data.get("door_type", "normal"):
+                door_obj = Door(coords[0], coords[1], door_data.get("locked", False), door_data.get("door_type", "normal"))
+            door_obj.locked = door_data.get("locked", False)
             door_obj.open = door_data.get("open", False)
+            door_obj.load_sprites()
             if 'destination_map' in door_data: door_obj.destination_map = door_data['destination_map']
             game_dungeon.doors[(door_obj.x, door_obj.y)] = door_obj
             # Also update the tile where the door is
@@ -352,6 +385,13 @@ def load_game():
             if item_obj:
                 game_dungeon.dropped_items.append({"item": item_obj, "position": item_drop_data.get("position")})
 
+        # Tiles, doors, chests, monsters and drops were replaced above, so the opacity bitmap,
+        # static layer and spatial index are stale
+        game_dungeon.rebuild_opacity()
+        game_dungeon.invalidate_static_layer()
+        game_dungeon.rebuild_spatial_index()
+        prefetch_reachable_dungeons(game_dungeon)
+
         # It's crucial that load_game returns the *reconstructed Dungeon object*, not the dict
         print(f"Game loaded successfully from {save_file}")
         return (player, game_dungeon, game_state, saved_cm_turn)
@@ -438,7 +478,11 @@ def initialize_game_after_title(title_choice, screen, clock):
             if isinstance(game_dungeon_data, dict):
                 # This is a simplified reconstruction. The main game file has more detailed logic.
                 # For a full load, that logic should be centralized here or in load_game.
-                game_dungeon = Dungeon(game_dungeon_data.get("width", 20), game_dungeon_data.get("height", 15))
+                game_dungeon = Dungeon(
+                    game_dungeon_data.get("width", 20), game_dungeon_data.get("height", 15),
+                    level=game_dungeon_data.get("level", 1), map_number=game_dungeon_data.get("map_number", 1),
+                    max_maps=game_dungeon_data.get("max_maps", 1), seed=game_dungeon_data.get("seed")
+                )
                 # TODO: Add full tile, door, chest, monster reconstruction from game_dungeon_data
                 # This is a significant piece of logic from blade_sigil_v5_5.py
                 print("Warning: Simplified dungeon reconstruction in initialize_game_after_title.")
@@ -491,9 +535,42 @@ def initialize_game_after_title(title_choice, screen, clock):
     return None, None, "title_screen"
 
 
+# Size of the level 1 dungeon entered from the hub
+HUB_DUNGEON_SIZE = (20, 15)
+
+
+def prefetch_reachable_dungeons(current_dungeon_obj=None):
+    """
+    Start generating, in the background, every dungeon the player can reach next:
+    the next level and each map behind a transition door, or the first dungeon
+    level when current_dungeon_obj is None (player is in the hub).
+    """
+    make_key = dungeon_prefetcher.make_key
+    if current_dungeon_obj is None:
+        keys = [make_key(*HUB_DUNGEON_SIZE, level=1)]
+    else:
+        width, height = current_dungeon_obj.width, current_dungeon_obj.height
+        level = current_dungeon_obj.level
+        keys = [make_key(width, height, level=level + 1)]
+        for door_obj in current_dungeon_obj.map_transition_doors.values():
+            destination_map = getattr(door_obj, "destination_map", None)
+            if destination_map:
+                keys.append(make_key(width, height, level=level, map_number=destination_map,
+                                     max_maps=current_dungeon_obj.max_maps))
+    dungeon_prefetcher.prefetch(Dungeon, keys)
+
+
+def clear_effects():
+    """Drop animations and particles still playing, so they are not drawn over the next map."""
+    animation_scheduler.clear()
+    particle_system.clear()
+
+
 def transition_to_hub(player_obj):
     """Transitions the game state to the hub."""
+    clear_effects()
     # common_b_s.add_message(f"{player_obj.name} arrives at Novamagus.", common_b_s.WHITE)
+    prefetch_reachable_dungeons(None)
     return set_game_state("hub")
 
 def transition_from_hub_to_dungeon(player_obj, screen_ref, clock_ref):
@@ -503,8 +580,10 @@ def transition_from_hub_to_dungeon(player_obj, screen_ref, clock_ref):
     Returns the new game_dungeon instance.
     """
     print("DEBUG: GSM: Transitioning from hub to dungeon...")
-    # Create a new dungeon for level 1
-    new_dungeon = Dungeon(20, 15, level=1) # Dungeon class from common_b_s
+    # Take the level 1 dungeon (normally already generated in the background while in the hub)
+    new_dungeon = dungeon_prefetcher.take(Dungeon, dungeon_prefetcher.make_key(*HUB_DUNGEON_SIZE, level=1))
+    prefetch_reachable_dungeons(new_dungeon)
+    clear_effects()
     player_obj.position = deepcopy(new_dungeon.start_position) # Ensure player starts at the new dungeon's start
 
     # TEST ONLY: Give player 1000 HP for testing purposes (from original code)
@@ -529,8 +608,12 @@ def handle_dungeon_level_transition(player_obj, current_dungeon_obj):
     # Ideally, the detailed logic from blade_sigil_v5_5 for level transitions
     # (difficulty_roll, maps_on_next_level, player level up) should be moved here or called.
 
-    # For now, basic transition:
-    new_dungeon = Dungeon(current_dungeon_obj.width, current_dungeon_obj.height, level=new_level_num)
+    # For now, basic transition (the level is normally prefetched while the previous one is played):
+    new_dungeon = dungeon_prefetcher.take(
+        Dungeon, dungeon_prefetcher.make_key(current_dungeon_obj.width, current_dungeon_obj.height, level=new_level_num)
+    )
+    prefetch_reachable_dungeons(new_dungeon)
+    clear_effects()
     player_obj.position = deepcopy(new_dungeon.start_position)
 
     # Player level up logic (simplified from blade_sigil_v5_5.py)
@@ -549,13 +632,15 @@ def handle_dungeon_map_transition(player_obj, current_dungeon_obj, destination_m
     Returns the new_dungeon instance.
     """
     maps_on_level = getattr(current_dungeon_obj, 'max_maps', random.randint(1,5)) # Get max_maps or default
-    new_dungeon = Dungeon(
+    new_dungeon = dungeon_prefetcher.take(Dungeon, dungeon_prefetcher.make_key(
         current_dungeon_obj.width,
         current_dungeon_obj.height,
         level=current_dungeon_obj.level,
         map_number=destination_map_number,
         max_maps=maps_on_level
-    )
+    ))
+    prefetch_reachable_dungeons(new_dungeon)
+    clear_effects()
     player_obj.position = deepcopy(new_dungeon.start_position)
     add_message(f"You enter a new area: Map {destination_map_number} of Level {new_dungeon.level}.", WHITE)
     set_game_state("dungeon") # Ensures in_dungeon is True
@@ -567,6 +652,7 @@ def handle_test_arena_teleport(player_obj, screen_ref, new_arena_dungeon_obj, ne
     Updates player position to the start of the new arena.
     Returns (new_arena_dungeon_obj, new_game_state_str)
     """
+    clear_effects()
     player_obj.position = deepcopy(new_arena_dungeon_obj.start_position)
     final_state_str = set_game_state(new_state_str) # This also sets common_b_s.in_dungeon
     # in_dungeon = new_in_dungeon_val # Explicitly set if set_game_state doesn't cover it
@@ -655,14 +741,14 @@ def show_title_screen():
         # Draw new game button
         new_game_color = hover_color if new_game_rect.collidepoint(mouse_pos) else button_color
         pygame.draw.rect(title_screen, new_game_color, new_game_rect)
-        new_game_text = font.render("New Game", True, text_color)
+        new_game_text = text_cache.render(font, "New Game", text_color)
         new_game_text_rect = new_game_text.get_rect(center=new_game_rect.center)
         title_screen.blit(new_game_text, new_game_text_rect)
 
         # Draw load game button (grayed out if no save exists)
         load_game_color = (50, 50, 50) if not has_save else (hover_color if load_game_rect.collidepoint(mouse_pos) else button_color)
         pygame.draw.rect(title_screen, load_game_color, load_game_rect)
-        load_game_text = font.render("Load Game", True, (100, 100, 100) if not has_save else text_color)
+        load_game_text = text_cache.render(font, "Load Game", (100, 100, 100) if not has_save else text_color)
         load_game_text_rect = load_game_text.get_rect(center=load_game_rect.center)
         title_screen.blit(load_game_text, load_game_text_rect)
 
@@ -686,10 +772,10 @@ def show_title_screen():
                     sys.exit()
 
         # Display version and instructions
-        version_text = font.render("v0.5.5", True, WHITE) # Assuming version is static for now
+        version_text = text_cache.render(font, "v0.5.5", WHITE) # Assuming version is static for now
         title_screen.blit(version_text, (20, DUNGEON_SCREEN_HEIGHT - 30))
 
-        help_text = font.render("Press N for New Game, L to Load Game, ESC to Quit", True, WHITE)
+        help_text = text_cache.render(font, "Press N for New Game, L to Load Game, ESC to Quit", WHITE)
         help_rect = help_text.get_rect(center=(DUNGEON_SCREEN_WIDTH//2, DUNGEON_SCREEN_HEIGHT - 30))
         title_screen.blit(help_text, help_rect)
 
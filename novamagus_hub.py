@@ -30,6 +30,7 @@ from common_b_s import (
     Character, Tile, # Player removed
 )
 from player import Player # Player imported from player.py
+from Data.asset_cache import asset_cache
 import common_b_s  # Import full module if needed
 in_dungeon = False
 
@@ -71,44 +72,74 @@ def create_grid():
     ]
     return grid
 
-def draw_hub(screen, grid, assets, hub_scale):
-    """Draw the hub grid, scaling each tile to fit within the playable area."""
-    rows = len(grid)
-    cols = len(grid[0])
-    
+def hub_tile_size(rows, cols, hub_scale):
+    """Return the hub tile size in pixels, shrunk if needed so the grid fits the playable area."""
     # Use the hub scale to determine tile size
     tile_size = HUB_TILE_SIZE * hub_scale
-    
+
     # Make sure tiles will fit within the playable area
     if tile_size * cols > HUB_PLAYABLE_AREA_WIDTH or tile_size * rows > HUB_PLAYABLE_AREA_HEIGHT:
         # If not, calculate a suitable size that fits
         max_tile_width = HUB_PLAYABLE_AREA_WIDTH / cols
         max_tile_height = HUB_PLAYABLE_AREA_HEIGHT / rows
         tile_size = min(max_tile_width, max_tile_height)
-    
+    return tile_size
+
+def scaled_hub_sprite(sprite, tile_size):
+    """Return sprite smoothscaled to the hub tile size, scaling it only once per size."""
+    size = int(tile_size)
+    # The source surface is part of the key, so a changed sprite gets scaled afresh
+    return asset_cache.get_or_build(
+        ("hub_sprite", sprite, size),
+        lambda: pygame.transform.smoothscale(sprite, (size, size))
+    )
+
+def build_hub_tile_atlas(assets, tile_size):
+    """Return a dict of tile type -> asset scaled to tile_size, built once per size and kept across visits."""
+    return {tile_type: scaled_hub_sprite(asset, tile_size) for tile_type, asset in assets.items()}
+
+def _build_hub_background(grid, atlas, tile_size):
+    """Render the whole town grid onto one playable area sized surface."""
+    rows = len(grid)
+    cols = len(grid[0])
+
     # Create a surface for the hub area
     hub_surface = pygame.Surface((HUB_PLAYABLE_AREA_WIDTH, HUB_PLAYABLE_AREA_HEIGHT))
     hub_surface.fill(BLACK)
-    
-    # Draw a border around the playable area
-    pygame.draw.rect(screen, WHITE, (0, 0, HUB_PLAYABLE_AREA_WIDTH, HUB_PLAYABLE_AREA_HEIGHT), 1)
-    
+
     # Calculate offsets to center the grid in the playable area
     offset_x = (HUB_PLAYABLE_AREA_WIDTH - (cols * tile_size)) / 2
     offset_y = (HUB_PLAYABLE_AREA_HEIGHT - (rows * tile_size)) / 2
-    
+
     # Draw each tile
     for row_index in range(rows):
         for col_index in range(cols):
             tile_type = grid[row_index][col_index]
-            asset = assets.get(tile_type, assets['cobble'])
-            scaled_asset = pygame.transform.smoothscale(
-                asset, (int(tile_size), int(tile_size))
-            )
+            scaled_asset = atlas.get(tile_type, atlas['cobble'])
             x = offset_x + col_index * tile_size
             y = offset_y + row_index * tile_size
             hub_surface.blit(scaled_asset, (x, y))
-    
+    return hub_surface
+
+def draw_hub(screen, grid, assets, hub_scale):
+    """Draw the hub grid, scaling each tile to fit within the playable area.
+
+    The town never changes while it is shown, so the scaled tiles and the
+    rendered grid are cached and each frame is a single blit.
+    """
+    tile_size = hub_tile_size(len(grid), len(grid[0]), hub_scale)
+    atlas = build_hub_tile_atlas(assets, tile_size)
+
+    # Rebuilt only if the layout, the tile art or the tile size changes
+    layout = tuple(tuple(atlas.get(tile_type, atlas['cobble']) for tile_type in row) for row in grid)
+    hub_surface = asset_cache.get_or_build(
+        ("hub_background", layout, tile_size),
+        lambda: _build_hub_background(grid, atlas, tile_size)
+    )
+
+    # Draw a border around the playable area
+    pygame.draw.rect(screen, WHITE, (0, 0, HUB_PLAYABLE_AREA_WIDTH, HUB_PLAYABLE_AREA_HEIGHT), 1)
+
     # Blit the hub surface to the screen
     screen.blit(hub_surface, (0, 0))
 
@@ -215,20 +246,10 @@ def run_hub(screen, clock, player):
         # --- Draw the Player Sprite ---
         # Make sure player sprite exists before trying to scale it
         if player.sprite:
-            # Use the hub scale to determine tile size
-            tile_size = HUB_TILE_SIZE * hub_scale
-            
-            # Make sure tiles will fit within the playable area
-            if tile_size * cols > HUB_PLAYABLE_AREA_WIDTH or tile_size * rows > HUB_PLAYABLE_AREA_HEIGHT:
-                # If not, calculate a suitable size that fits
-                max_tile_width = HUB_PLAYABLE_AREA_WIDTH / cols
-                max_tile_height = HUB_PLAYABLE_AREA_HEIGHT / rows
-                tile_size = min(max_tile_width, max_tile_height)
+            tile_size = hub_tile_size(rows, cols, hub_scale)
             
-            # Scale the player sprite to match the calculated tile size
-            scaled_player_sprite = pygame.transform.smoothscale(
-                player.sprite, (int(tile_size), int(tile_size))
-            )
+            # Scale the player sprite to match the calculated tile size (cached per sprite and size)
+            scaled_player_sprite = scaled_hub_sprite(player.sprite, tile_size)
             
             # Get the player's grid coordinates
             player_grid_x = player_pos[0]
@@ -11,8 +11,6 @@ from common_b_s import (
     assets_data,
     load_sprite,
     TILE_SIZE,
-    DUNGEON_PLAYABLE_AREA_WIDTH,
-    DUNGEON_PLAYABLE_AREA_HEIGHT,
     DUNGEON_TILE_SIZE,
     DUNGEON_SCREEN_WIDTH,
     DUNGEON_SCREEN_HEIGHT,
@@ -61,10 +59,12 @@ def create_test_arena(player, dungeon):
                 arena.tiles[x_coord][y_coord].type = "floor"
                 floor_sprite_path = assets_data["sprites"]["tiles"]["floor"]
                 arena.tiles[x_coord][y_coord].sprite = load_sprite(floor_sprite_path)
+    arena.rebuild_opacity()
     
     player_x_tile, player_y_tile = width // 2, height // 2
-    max_x_tile = (DUNGEON_PLAYABLE_AREA_WIDTH - DUNGEON_TILE_SIZE) // DUNGEON_TILE_SIZE
-    max_y_tile = (DUNGEON_PLAYABLE_AREA_HEIGHT - DUNGEON_TILE_SIZE) // DUNGEON_TILE_SIZE
+    # The camera scrolls to follow the player, so only the arena's own walls bound positions
+    max_x_tile = width - 1
+    max_y_tile = height - 1
     player_x_tile = min(max(player_x_tile, 2), max_x_tile - 2)
     player_y_tile = min(max(player_y_tile, 2), max_y_tile - 2)
     player_x_px = player_x_tile * DUNGEON_TILE_SIZE + DUNGEON_TILE_SIZE // 2
@@ -72,7 +72,7 @@ def create_test_arena(player, dungeon):
     arena.entrance = (player_x_px, player_y_px)
     arena.start_position = list(arena.entrance)
     player.position = list(arena.entrance)
-    debug_system.test_arena_logger.debug(f"Positioned player in playable area at {player.position}")
+    debug_system.test_arena_logger.debug(f"Positioned player in the arena at {player.position}")
     
     debug_system.test_arena_logger.debug("Creating test monsters (rats and spiders)")
     arena.monsters = []
@@ -101,6 +101,7 @@ def create_test_arena(player, dungeon):
         monster_y_px = monster_y_tile * DUNGEON_TILE_SIZE + DUNGEON_TILE_SIZE // 2
         monster.position = [monster_x_px, monster_y_px]
         arena.monsters.append(monster)
+    arena.rebuild_spatial_index()
     debug_system.test_arena_logger.debug(f"Added {len(arena.monsters)} test monsters to the arena")
     
     player.hit_points = player.max_hit_points
@@ -131,6 +132,7 @@ def create_emergency_arena(player, screen):
                     fallback_sprite = pygame.Surface((DUNGEON_TILE_SIZE, DUNGEON_TILE_SIZE))
                     fallback_sprite.fill((100, 100, 100))
                     min_arena.tiles[x][y].sprite = fallback_sprite
+        min_arena.rebuild_opacity()
         player_x, player_y = width // 2, height // 2  
         min_arena.start_position = [player_x * DUNGEON_TILE_SIZE + DUNGEON_TILE_SIZE // 2, player_y * DUNGEON_TILE_SIZE + DUNGEON_TILE_SIZE // 2]
         player.position = list(min_arena.start_position)
@@ -141,6 +143,7 @@ def create_emergency_arena(player, screen):
         )
         test_monster.position = [player.position[0] + 5*DUNGEON_TILE_SIZE, player.position[1]]
         min_arena.monsters = [test_monster]
+        min_arena.rebuild_spatial_index()
         player.spell_points = 200
         add_message("EMERGENCY TEST ARENA CREATED!")
         add_message("Press 'x' to cast spells")